@@ -0,0 +1,6 @@
+"""
+엔드포인트 벤치마크
+
+앱을 인프로세스로 띄우고 로컬 OpenAI 대체 서버와 초소형 SD 모델로
+API 키/대형 가중치 없이 재현 가능한 지연/처리량/메모리 리포트를 생성합니다.
+"""
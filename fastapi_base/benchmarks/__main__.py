@@ -0,0 +1,72 @@
+"""
+벤치마크 CLI (fastapi_base 디렉토리에서 실행)
+
+    python -m benchmarks --requests 50 --concurrency 1,8
+    python -m benchmarks --services textGen --openai-latency-median 1.2
+    python -m benchmarks.report results/a.json results/b.json   # 커밋 간 비교
+    python -m benchmarks.workflow --users 8                      # 워크플로 부하 생성
+"""
+import asyncio
+import argparse
+import logging
+
+from .fake_openai import FakeOpenAIConfig
+from .report import format_results, write_report
+from .runner import TINY_SD_CONFIG, run_benchmark
+from .scenarios import Fixtures
+
+def _csv(value: str):
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="FastAPI 엔드포인트 벤치마크")
+    parser.add_argument("--services", type=_csv, default=["textGen", "imageGen_Text", "imageGen_BG"])
+    parser.add_argument("--scenarios", type=_csv, default=None, help="실행할 시나리오 이름 (기본: 전체)")
+    parser.add_argument("--requests", type=int, default=20, help="시나리오 × 동시성별 요청 수")
+    parser.add_argument("--concurrency", type=lambda v: [int(x) for x in _csv(v)], default=[1, 4])
+    parser.add_argument("--warmup", type=int, default=1, help="측정 전 요청 수")
+    parser.add_argument("--canvas-size", type=int, default=512)
+    parser.add_argument("--inference-steps", type=int, default=35)
+    parser.add_argument("--num-images", type=int, default=2)
+    parser.add_argument("--sd-config", default=str(TINY_SD_CONFIG),
+                        help="imageGen_BG 설정 파일 (기본: 초소형 모델, 'default'면 운영 설정)")
+    parser.add_argument("--openai-base-url", default=None, help="대체 서버 대신 사용할 OpenAI 호환 URL")
+    parser.add_argument("--openai-latency-median", type=float, default=0.8)
+    parser.add_argument("--openai-latency-sigma", type=float, default=0.35)
+    parser.add_argument("--openai-tokens-mean", type=float, default=80.0)
+    parser.add_argument("--openai-tokens-std", type=float, default=25.0)
+    parser.add_argument("--openai-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", default=None, help="리포트 경로 (기본: benchmarks/results/<시각>-<커밋>.json)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    report = asyncio.run(run_benchmark(
+        services=args.services,
+        scenario_names=args.scenarios,
+        requests=args.requests,
+        concurrency_levels=args.concurrency,
+        warmup=args.warmup,
+        fixtures=Fixtures(
+            canvas_size=(args.canvas_size, args.canvas_size),
+            inference_steps=args.inference_steps,
+            num_images=args.num_images
+        ),
+        openai_config=FakeOpenAIConfig(
+            latency_median=args.openai_latency_median,
+            latency_sigma=args.openai_latency_sigma,
+            tokens_mean=args.openai_tokens_mean,
+            tokens_std=args.openai_tokens_std,
+            error_rate=args.openai_error_rate,
+            seed=args.seed
+        ),
+        openai_base_url=args.openai_base_url,
+        sd_config=None if args.sd_config == "default" else args.sd_config
+    ))
+
+    print(format_results(report))
+    print(f"\n리포트 저장: {write_report(report, args.output)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+로컬 OpenAI 대체 서버 (Chat Completions 호환)
+
+지연 시간(로그정규 분포)과 생성 토큰 수(정규 분포)를 설정해 실제 API와 비슷한 부하 특성을 재현합니다.
+벤치마크는 OPENAI_BASE_URL을 이 서버로 지정하므로 API 키 없이 textGen/analyze-ad 경로를 측정할 수 있습니다.
+
+    python -m benchmarks.fake_openai --port 8100 --latency-median 0.8
+"""
+import json
+import math
+import time
+import uuid
+import random
+import asyncio
+import argparse
+import multiprocessing
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+# 응답 문구 생성용 어휘 (토큰 1개 ≈ 단어 1개로 근사)
+_WORDS = [
+    "촉촉한", "하루", "피부", "빛나는", "선물", "새로운", "향기", "당신의", "지금",
+    "특별한", "순간", "자연", "그대로", "매일", "가볍게", "완성", "부드러운", "감성",
+]
+
+class FakeOpenAIConfig(BaseModel):
+    """대체 서버 응답 특성"""
+    # 전체 응답 지연 (로그정규 분포의 중앙값/시그마, 초)
+    latency_median: float = 0.8
+    latency_sigma: float = 0.35
+    # 스트리밍 첫 토큰까지 지연 비율 (나머지는 토큰별로 분배)
+    ttft_ratio: float = 0.3
+    # 생성 토큰 수 분포
+    tokens_mean: float = 80.0
+    tokens_std: float = 25.0
+    # 실패 응답 비율 (HTTP 500)
+    error_rate: float = 0.0
+    seed: Optional[int] = None
+
+def _estimate_prompt_tokens(messages: List[Dict[str, Any]]) -> int:
+    # 한글 위주 텍스트 기준 대략 1.5자당 1토큰
+    return sum(max(1, math.ceil(len(str(m.get("content", ""))) / 1.5)) for m in messages)
+
+def create_app(config: FakeOpenAIConfig):
+    from fastapi import FastAPI, Request
+    from fastapi.responses import JSONResponse, StreamingResponse
+
+    app = FastAPI(title="Fake OpenAI")
+    rng = random.Random(config.seed)
+
+    def sample_latency() -> float:
+        return rng.lognormvariate(math.log(config.latency_median), config.latency_sigma)
+
+    def sample_text(max_tokens: Optional[int]) -> List[str]:
+        count = max(1, int(rng.gauss(config.tokens_mean, config.tokens_std)))
+        if max_tokens:
+            count = min(count, max_tokens)
+        return [rng.choice(_WORDS) for _ in range(count)]
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = body.get("model", "gpt-4.1-mini")
+        n = int(body.get("n") or 1)
+        prompt_tokens = _estimate_prompt_tokens(body.get("messages", []))
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        latency = sample_latency()
+
+        if rng.random() < config.error_rate:
+            await asyncio.sleep(latency * config.ttft_ratio)
+            return JSONResponse(
+                status_code=500,
+                content={"error": {"message": "fake server error", "type": "server_error"}}
+            )
+
+        choices = [sample_text(body.get("max_tokens")) for _ in range(n)]
+        completion_tokens = sum(len(words) for words in choices)
+
+        if body.get("stream"):
+            async def events():
+                await asyncio.sleep(latency * config.ttft_ratio)
+                per_token = latency * (1 - config.ttft_ratio) / max(1, max(len(w) for w in choices))
+                for position in range(max(len(w) for w in choices)):
+                    for index, words in enumerate(choices):
+                        if position < len(words):
+                            chunk = {
+                                "id": completion_id,
+                                "object": "chat.completion.chunk",
+                                "created": created,
+                                "model": model,
+                                "choices": [{
+                                    "index": index,
+                                    "delta": {"content": ("" if position == 0 else " ") + words[position]},
+                                    "finish_reason": None,
+                                }],
+                            }
+                            yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+                    await asyncio.sleep(per_token)
+                final = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [
+                        {"index": index, "delta": {}, "finish_reason": "stop"}
+                        for index in range(n)
+                    ],
+                }
+                yield f"data: {json.dumps(final)}\n\n"
+                yield "data: [DONE]\n\n"
+
+            return StreamingResponse(events(), media_type="text/event-stream")
+
+        await asyncio.sleep(latency)
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [
+                {
+                    "index": index,
+                    "message": {"role": "assistant", "content": " ".join(words)},
+                    "finish_reason": "stop",
+                }
+                for index, words in enumerate(choices)
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    return app
+
+def serve(config: FakeOpenAIConfig, host: str = "127.0.0.1", port: int = 8100) -> None:
+    import uvicorn
+    uvicorn.run(create_app(config), host=host, port=port, log_level="warning")
+
+class FakeOpenAIServer:
+    """별도 프로세스로 대체 서버 실행 (측정 대상 프로세스의 CPU/메모리와 분리)"""
+
+    def __init__(self, config: FakeOpenAIConfig, host: str = "127.0.0.1", port: int = 8100):
+        self.config = config
+        self.host = host
+        self.port = port
+        self._process: Optional[multiprocessing.Process] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    def start(self, timeout: float = 30.0) -> None:
+        import httpx
+
+        context = multiprocessing.get_context("spawn")
+        self._process = context.Process(
+            target=serve, args=(self.config, self.host, self.port), daemon=True
+        )
+        self._process.start()
+
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            try:
+                httpx.get(f"http://{self.host}:{self.port}/docs", timeout=1.0)
+                return
+            except httpx.HTTPError:
+                time.sleep(0.2)
+        self.stop()
+        raise RuntimeError("대체 OpenAI 서버가 시작되지 않았습니다.")
+
+    def stop(self) -> None:
+        if self._process and self._process.is_alive():
+            self._process.terminate()
+            self._process.join(timeout=5)
+        self._process = None
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 OpenAI 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    for name, field in FakeOpenAIConfig.model_fields.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(field.default) if field.default is not None else int)
+    args = vars(parser.parse_args())
+    host, port = args.pop("host"), args.pop("port")
+    serve(FakeOpenAIConfig(**{k: v for k, v in args.items() if v is not None}), host, port)
@@ -0,0 +1,121 @@
+"""
+벤치마크 결과 통계 및 리포트 (JSON)
+
+리포트에는 커밋/환경 정보와 실행 설정이 함께 기록되어 커밋 간 비교가 가능합니다.
+"""
+import os
+import sys
+import json
+import math
+import platform
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    """선형 보간 분위수 (sorted_values는 정렬된 값)"""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * q
+    lower, upper = math.floor(position), math.ceil(position)
+    if lower == upper:
+        return sorted_values[lower]
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def latency_summary(latencies: List[float]) -> Dict[str, Optional[float]]:
+    values = sorted(latencies)
+    return {
+        "mean": _round(sum(values) / len(values)) if values else None,
+        "p50": _round(percentile(values, 0.50)),
+        "p95": _round(percentile(values, 0.95)),
+        "p99": _round(percentile(values, 0.99)),
+        "max": _round(values[-1]) if values else None,
+    }
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 4) if value is not None else None
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", *args], cwd=Path(__file__).parent, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def environment() -> Dict[str, Any]:
+    """커밋 및 실행 환경 정보"""
+    env = {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "gpu": None,
+    }
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        env["gpu"] = torch.cuda.get_device_name(0)
+    return env
+
+def default_output_path(report: Dict[str, Any]) -> Path:
+    commit = (report["environment"]["commit"] or "nogit")[:10]
+    kind = report.get("kind", "endpoints")
+    return Path(__file__).parent / "results" / f"{report['started_at']}-{kind}-{commit}.json"
+
+def write_report(report: Dict[str, Any], path: Optional[str] = None) -> Path:
+    output = Path(path) if path else default_output_path(report)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    return output
+
+def load_report(path: str) -> Dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """시나리오 × 동시성별 p50/p95/p99/처리량 변화율 (current / baseline - 1)"""
+    base_index = {(r["scenario"], r["concurrency"]): r for r in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        base = base_index.get((result["scenario"], result["concurrency"]))
+        if base is None:
+            continue
+        row = {"scenario": result["scenario"], "concurrency": result["concurrency"]}
+        for key in ("p50", "p95", "p99"):
+            row[key] = _change(base["latency"][key], result["latency"][key])
+        row["throughput_rps"] = _change(base["throughput_rps"], result["throughput_rps"])
+        rows.append(row)
+    return rows
+
+def _change(before: Optional[float], after: Optional[float]) -> Optional[float]:
+    if not before or after is None:
+        return None
+    return round(after / before - 1, 4)
+
+def format_results(report: Dict[str, Any]) -> str:
+    lines = [
+        f"{'scenario':<26}{'conc':>5}{'ok':>6}{'err':>5}{'p50':>9}{'p95':>9}{'p99':>9}{'rps':>9}{'peakMB':>9}"
+    ]
+    for r in report["results"]:
+        latency = r["latency"]
+        lines.append(
+            f"{r['scenario']:<26}{r['concurrency']:>5}{r['ok']:>6}{r['errors']:>5}"
+            f"{_fmt(latency['p50'])}{_fmt(latency['p95'])}{_fmt(latency['p99'])}"
+            f"{r['throughput_rps']:>9.2f}{r['peak_rss_bytes'] / 2**20:>9.0f}"
+        )
+    return "\n".join(lines)
+
+def _fmt(value: Optional[float]) -> str:
+    return f"{value:>9.3f}" if value is not None else f"{'-':>9}"
+
+if __name__ == "__main__":
+    # python -m benchmarks.report baseline.json current.json
+    if len(sys.argv) != 3:
+        print("usage: python -m benchmarks.report <baseline.json> <current.json>")
+        sys.exit(2)
+    for row in compare(load_report(sys.argv[1]), load_report(sys.argv[2])):
+        changes = "  ".join(
+            f"{key}={value:+.1%}" if value is not None else f"{key}=-"
+            for key, value in row.items() if key not in ("scenario", "concurrency")
+        )
+        print(f"{row['scenario']:<26}c={row['concurrency']:<4}{changes}")
@@ -0,0 +1,198 @@
+"""
+인프로세스 벤치마크 실행기
+
+앱을 같은 프로세스에서 lifespan까지 실행하고(httpx ASGITransport), 각 시나리오를
+설정한 동시성으로 반복 호출해 지연 분포/처리량/최대 RSS를 측정합니다.
+"""
+import os
+import time
+import asyncio
+import resource
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .fake_openai import FakeOpenAIConfig, FakeOpenAIServer
+from .report import environment, latency_summary
+from .scenarios import Fixtures, Scenario, select_scenarios
+
+logger = logging.getLogger(__name__)
+
+TINY_SD_CONFIG = Path(__file__).parent / "config" / "tiny_sd.yaml"
+
+class RSSSampler:
+    """구간 동안 프로세스 RSS를 주기적으로 샘플링해 최대값 기록"""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _sample(self) -> None:
+        from common.utils.metrics import process_memory
+
+        while True:
+            self.peak = max(self.peak, process_memory()["rss_bytes"])
+            await asyncio.sleep(self.interval)
+
+    async def __aenter__(self):
+        self._task = asyncio.create_task(self._sample())
+        return self
+
+    async def __aexit__(self, *exc):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+async def run_scenario(
+    client,
+    name: str,
+    scenario: Scenario,
+    fixtures: Fixtures,
+    requests: int,
+    concurrency: int,
+    warmup: int = 1
+) -> Dict[str, Any]:
+    """시나리오 1개를 requests회 실행 (동시에 concurrency개)"""
+    for _ in range(warmup):
+        await scenario(client, fixtures)
+
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            start = time.perf_counter()
+            try:
+                response = await scenario(client, fixtures)
+                status = str(response.status_code)
+            except Exception as e:
+                status = type(e).__name__
+            elapsed = time.perf_counter() - start
+            statuses[status] = statuses.get(status, 0) + 1
+            if status.startswith("2"):
+                latencies.append(elapsed)
+
+    async with RSSSampler() as sampler:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall = time.perf_counter() - started
+
+    ok = len(latencies)
+    return {
+        "scenario": name,
+        "concurrency": concurrency,
+        "requests": requests,
+        "ok": ok,
+        "errors": requests - ok,
+        "statuses": statuses,
+        "latency": latency_summary(latencies),
+        "wall_seconds": round(wall, 3),
+        "throughput_rps": round(ok / wall, 3) if wall > 0 else 0.0,
+        "peak_rss_bytes": sampler.peak,
+    }
+
+def configure_environment(
+    services: List[str],
+    openai_base_url: str,
+    sd_config: Optional[str]
+) -> None:
+    """앱 import 전에 설정 (설정 객체는 import 시점에 환경 변수를 읽음)"""
+    os.environ["SERVING_INFERENCE_MODE"] = "local"
+    os.environ["SERVING_STARTUP_MODE"] = "eager"
+    os.environ["SERVING_ENABLED_SERVICES"] = str(services).replace("'", '"')
+    os.environ["OPENAI_BASE_URL"] = openai_base_url
+    os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+    if sd_config:
+        os.environ["IMAGEGEN_BG_CONFIG"] = str(sd_config)
+
+@asynccontextmanager
+async def in_process_client(
+    services: List[str],
+    openai_config: Optional[FakeOpenAIConfig] = None,
+    openai_base_url: Optional[str] = None,
+    sd_config: Optional[str] = str(TINY_SD_CONFIG),
+    timeout: float = 600.0
+):
+    """
+    대체 OpenAI 서버 + 인프로세스 앱(lifespan 포함)에 연결된 httpx 클라이언트.
+
+    yield: (client, info) - info에는 import/기동 시간, 사용한 OpenAI 설정이 담김
+    """
+    import httpx
+
+    fake_server = None
+    if openai_base_url is None:
+        fake_server = FakeOpenAIServer(openai_config or FakeOpenAIConfig())
+        fake_server.start()
+        openai_base_url = fake_server.base_url
+    configure_environment(services, openai_base_url, sd_config)
+
+    try:
+        import_start = time.perf_counter()
+        from main import app
+        info = {
+            "import_seconds": round(time.perf_counter() - import_start, 3),
+            "openai": fake_server.config.model_dump() if fake_server else {"base_url": openai_base_url},
+            "sd_config": sd_config,
+        }
+
+        startup_start = time.perf_counter()
+        async with app.router.lifespan_context(app):
+            info["startup_seconds"] = round(time.perf_counter() - startup_start, 3)
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=timeout) as client:
+                yield client, info
+    finally:
+        if fake_server:
+            fake_server.stop()
+
+async def run_benchmark(
+    services: List[str],
+    scenario_names: Optional[List[str]] = None,
+    requests: int = 20,
+    concurrency_levels: List[int] = (1, 4),
+    warmup: int = 1,
+    fixtures: Optional[Fixtures] = None,
+    openai_config: Optional[FakeOpenAIConfig] = None,
+    openai_base_url: Optional[str] = None,
+    sd_config: Optional[str] = str(TINY_SD_CONFIG),
+    timeout: float = 600.0
+) -> Dict[str, Any]:
+    """벤치마크 전체 실행 후 리포트(dict) 반환"""
+    fixtures = fixtures or Fixtures()
+    started_at = datetime.now().strftime("%Y%m%d-%H%M%S")
+
+    async with in_process_client(services, openai_config, openai_base_url, sd_config, timeout) as (client, info):
+        results = []
+        for name, scenario in select_scenarios(services, scenario_names):
+            for concurrency in concurrency_levels:
+                logger.info(f"시나리오 실행: {name} (동시성 {concurrency})")
+                results.append(await run_scenario(
+                    client, name, scenario, fixtures, requests, concurrency, warmup
+                ))
+
+    return {
+        "started_at": started_at,
+        "environment": environment(),
+        "config": {
+            "services": services,
+            "requests": requests,
+            "concurrency": list(concurrency_levels),
+            "warmup": warmup,
+            "canvas_size": list(fixtures.canvas_size),
+            "inference_steps": fixtures.inference_steps,
+            "num_images": fixtures.num_images,
+            "sd_config": info["sd_config"],
+            "openai": info["openai"],
+        },
+        "import_seconds": info["import_seconds"],
+        "startup_seconds": info["startup_seconds"],
+        "process_peak_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        "results": results,
+    }
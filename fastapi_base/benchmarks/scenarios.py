@@ -0,0 +1,210 @@
+"""
+엔드포인트별 벤치마크 시나리오
+
+각 시나리오는 (httpx.AsyncClient, Fixtures) → httpx.Response 인 async 함수입니다.
+요청 형식은 Streamlit APIClient와 동일한 필드/기본값을 사용합니다.
+"""
+import io
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+from PIL import Image, ImageDraw
+
+TEXT_PREFIX = "/api/v1/text"
+IMAGE_TEXT_PREFIX = "/api/v1/image/text"
+IMAGE_BG_PREFIX = "/api/v1/image/bg"
+
+AD_REQUEST = {
+    "product_name": "프리미엄 스킨케어 세트",
+    "product_use": "피부 보습 및 안티에이징",
+    "brand_name": "뷰티랩",
+    "extra_info": "천연 성분 사용, 모든 피부 타입에 적합",
+}
+
+def _png(image: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+class Fixtures:
+    """합성 입력 이미지 및 공통 파라미터 (실행마다 동일한 입력)"""
+
+    def __init__(self, canvas_size: Tuple[int, int] = (512, 512), inference_steps: int = 35, num_images: int = 2):
+        self.canvas_size = canvas_size
+        self.inference_steps = inference_steps
+        self.num_images = num_images
+        width, height = canvas_size
+
+        # 흰 배경 위 제품 (배경 제거 입력)
+        product = Image.new("RGB", (width, height), "white")
+        draw = ImageDraw.Draw(product)
+        draw.rounded_rectangle(
+            (width * 0.35, height * 0.2, width * 0.65, height * 0.8), radius=width // 20, fill=(180, 90, 140)
+        )
+        self.product_png = _png(product)
+
+        # 배경이 제거된 제품 (RGBA)
+        cutout = Image.new("RGBA", (width // 2, height // 2), (0, 0, 0, 0))
+        ImageDraw.Draw(cutout).ellipse((0, 0, width // 2 - 1, height // 2 - 1), fill=(180, 90, 140, 255))
+        self.cutout_png = _png(cutout)
+
+        # 제품 배치 캔버스 및 배경 영역 마스크 (흰색 = 생성 영역)
+        canvas = Image.new("RGB", (width, height), "white")
+        canvas.paste(cutout, (width // 4, height // 4), cutout)
+        self.canvas_png = _png(canvas)
+        mask = Image.new("L", (width, height), 255)
+        ImageDraw.Draw(mask).ellipse((width // 4, height // 4, width * 3 // 4, height * 3 // 4), fill=0)
+        self.mask_png = _png(mask)
+
+        self.font_name = "본고딕_BOLD"
+
+    def sd_form(self) -> Dict[str, str]:
+        return {
+            "category": "cosmetics",
+            "inference_steps": str(self.inference_steps),
+            "guidance_scale": "7.0",
+        }
+
+Scenario = Callable[["httpx.AsyncClient", Fixtures], Awaitable["httpx.Response"]]
+
+# ---------------------------------------------------------------- 공통
+
+async def health_ready(client, fx: Fixtures):
+    return await client.get("/health/ready")
+
+# ---------------------------------------------------------------- textGen
+
+async def text_single_platform(client, fx: Fixtures):
+    return await client.post(
+        f"{TEXT_PREFIX}/textGen-multiTP_singlePF",
+        json={**AD_REQUEST, "ad_type": "인스타그램", "mode_input": "1"}
+    )
+
+async def text_multi_platform(client, fx: Fixtures):
+    return await client.post(
+        f"{TEXT_PREFIX}/textGen_multiTP_multiPF",
+        json={**AD_REQUEST, "platforms": ["인스타그램", "블로그"], "temperatures": [0.3, 0.7, 1.0]}
+    )
+
+async def text_single_temperature(client, fx: Fixtures):
+    return await client.post(
+        f"{TEXT_PREFIX}/signleTP_multiPF",
+        json={**AD_REQUEST, "platforms": ["인스타그램", "블로그", "포스터"]}
+    )
+
+# ---------------------------------------------------------------- imageGen_Text
+
+async def text_image_fonts(client, fx: Fixtures):
+    return await client.get(f"{IMAGE_TEXT_PREFIX}/fonts")
+
+async def text_image_generate(client, fx: Fixtures):
+    return await client.post(
+        f"{IMAGE_TEXT_PREFIX}/generate",
+        json={
+            "text": "촉촉한 하루의 시작",
+            "font_name": fx.font_name,
+            "font_size": 125,
+            "text_colors": "#000000",
+            "stroke_colors": "#FFFFFF",
+            "stroke_width": 2,
+        }
+    )
+
+# ---------------------------------------------------------------- imageGen_BG
+
+async def remove_background(client, fx: Fixtures):
+    return await client.post(
+        f"{IMAGE_BG_PREFIX}/remove-background",
+        files={"product_image": ("image.png", fx.product_png, "image/png")},
+        data={"threshold": "250", "output_format": "RGBA"}
+    )
+
+async def position_product(client, fx: Fixtures):
+    width, height = fx.canvas_size
+    return await client.post(
+        f"{IMAGE_BG_PREFIX}/position-product",
+        files={"background_removed_image": ("image.png", fx.cutout_png, "image/png")},
+        data={
+            "canvas_width": str(width),
+            "canvas_height": str(height),
+            "scale": "100",
+            "pos_x": str(width // 4),
+            "pos_y": str(height // 4),
+        }
+    )
+
+async def analyze_ad(client, fx: Fixtures):
+    return await client.post(
+        f"{IMAGE_BG_PREFIX}/analyze-ad",
+        files={"product_image": ("product.png", fx.product_png, "image/png")},
+        data={"product_type": "cosmetics", "marketing_type": "배경 제작"}
+    )
+
+async def generate_background(client, fx: Fixtures):
+    width, height = fx.canvas_size
+    return await client.post(
+        f"{IMAGE_BG_PREFIX}/generate-background",
+        data={
+            "prompt": "luxury marble table, soft studio light",
+            "canvas_width": str(width),
+            "canvas_height": str(height),
+            "num_images": str(fx.num_images),
+            **fx.sd_form(),
+        }
+    )
+
+async def inpaint(client, fx: Fixtures):
+    return await client.post(
+        f"{IMAGE_BG_PREFIX}/inpaint",
+        files={
+            "canvas_image": ("canvas.png", fx.canvas_png, "image/png"),
+            "mask_image": ("mask.png", fx.mask_png, "image/png"),
+        },
+        data={
+            "prompt": "luxury marble table, soft studio light",
+            "num_images": str(fx.num_images),
+            **fx.sd_form(),
+        }
+    )
+
+async def smoothing(client, fx: Fixtures):
+    return await client.post(
+        f"{IMAGE_BG_PREFIX}/smoothing",
+        files={
+            "background_image": ("background.png", fx.canvas_png, "image/png"),
+            "product_image": ("product.png", fx.cutout_png, "image/png"),
+        },
+        data={"prompt": "luxury marble table, soft studio light", "scale": "0.7", **fx.sd_form()}
+    )
+
+# 서비스별 시나리오 (이름, 함수)
+SCENARIOS: Dict[str, List[Tuple[str, Scenario]]] = {
+    "common": [
+        ("health_ready", health_ready),
+    ],
+    "textGen": [
+        ("text_single_platform", text_single_platform),
+        ("text_multi_platform", text_multi_platform),
+        ("text_single_temperature", text_single_temperature),
+    ],
+    "imageGen_Text": [
+        ("text_image_fonts", text_image_fonts),
+        ("text_image_generate", text_image_generate),
+    ],
+    "imageGen_BG": [
+        ("remove_background", remove_background),
+        ("position_product", position_product),
+        ("analyze_ad", analyze_ad),
+        ("generate_background", generate_background),
+        ("inpaint", inpaint),
+        ("smoothing", smoothing),
+    ],
+}
+
+def select_scenarios(services: List[str], names: List[str] = None) -> List[Tuple[str, Scenario]]:
+    """활성 서비스 기준 시나리오 목록 (names가 있으면 해당 시나리오만)"""
+    selected = list(SCENARIOS["common"])
+    for service in services:
+        selected.extend(SCENARIOS.get(service, []))
+    if names:
+        selected = [(name, fn) for name, fn in selected if name in names]
+    return selected
@@ -0,0 +1,452 @@
+"""
+4단계 Streamlit 워크플로 부하 생성기
+
+가상 사용자 N명이 실제 화면 흐름과 같은 호출 조합을 사고 시간(think time)과 함께 재생합니다.
+
+    1단계: 배경 제거 1회 + 제품 배치 여러 회 (슬라이더 조정마다 호출)
+    2단계: 광고 분석 → Inpaint 또는 Generate(+ 생성 이미지별 스무딩)
+    3단계: 광고 문구 생성 → 텍스트 이미지 생성
+    4단계: 최종 합성 (Streamlit에서 클라이언트 측 PIL 합성, API 호출 없음)
+
+요청 필드/기본값은 Streamlit APIClient와 같고, 경로는 현재 라우터 경로를 사용합니다.
+
+    python -m benchmarks.workflow --users 8 --iterations 2               # 인프로세스
+    python -m benchmarks.workflow --base-url http://localhost:8000 --users 20
+"""
+import io
+import time
+import base64
+import random
+import asyncio
+import argparse
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from .report import environment, latency_summary, write_report
+from .scenarios import AD_REQUEST, IMAGE_BG_PREFIX, IMAGE_TEXT_PREFIX, TEXT_PREFIX, Fixtures
+
+logger = logging.getLogger(__name__)
+
+# Streamlit config.CANVAS_RATIOS
+CANVAS_SIZES = [(720, 512), (512, 720), (512, 512)]
+
+STEPS = ["step1_product_setup", "step2_background", "step3_text", "step4_composition"]
+
+class WorkflowOptions:
+    """가상 사용자 행동 설정"""
+
+    def __init__(
+        self,
+        think_time: float = 3.0,
+        position_calls: Tuple[int, int] = (3, 8),
+        inpaint_ratio: float = 0.5,
+        inference_steps: int = 35,
+        num_images: int = 2,
+        seed: Optional[int] = None
+    ):
+        # 호출 사이 평균 사고 시간 (지수 분포, 0이면 대기 없음)
+        self.think_time = think_time
+        # 1단계 제품 배치 호출 횟수 범위
+        self.position_calls = position_calls
+        # 2단계에서 Inpaint 모드를 고르는 비율 (나머지는 Generate + 스무딩)
+        self.inpaint_ratio = inpaint_ratio
+        self.inference_steps = inference_steps
+        self.num_images = num_images
+        self.seed = seed
+
+class WorkflowClient:
+    """APIClient와 같은 요청 형식의 비동기 클라이언트 (호출별 지연/단계 기록)"""
+
+    def __init__(self, client, recorder: "WorkflowRecorder", options: WorkflowOptions):
+        self.client = client
+        self.recorder = recorder
+        self.options = options
+        self.step = STEPS[0]
+
+    async def _call(self, name: str, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, path, **kwargs)
+            status = str(response.status_code)
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            status = getattr(getattr(e, "response", None), "status_code", None) or type(e).__name__
+            raise
+        finally:
+            self.recorder.record_call(self.step, name, time.perf_counter() - start, str(status))
+
+    def _sd_form(self) -> Dict[str, str]:
+        return {
+            "category": "general",
+            "inference_steps": str(self.options.inference_steps),
+            "guidance_scale": "7.0",
+        }
+
+    async def remove_background(self, image_png: bytes) -> bytes:
+        result = await self._call(
+            "remove_background", "POST", f"{IMAGE_BG_PREFIX}/remove-background",
+            files={"product_image": ("image.png", image_png, "image/png")},
+            data={"threshold": "250", "output_format": "RGBA"}
+        )
+        return base64.b64decode(result["background_removed_image"])
+
+    async def position_product(
+        self, image_png: bytes, canvas_size: Tuple[int, int], scale: int, position: Tuple[int, int]
+    ) -> Tuple[bytes, bytes]:
+        result = await self._call(
+            "position_product", "POST", f"{IMAGE_BG_PREFIX}/position-product",
+            files={"background_removed_image": ("image.png", image_png, "image/png")},
+            data={
+                "canvas_width": str(canvas_size[0]),
+                "canvas_height": str(canvas_size[1]),
+                "scale": str(scale),
+                "pos_x": str(position[0]),
+                "pos_y": str(position[1]),
+            }
+        )
+        return base64.b64decode(result["positioned_image"]), base64.b64decode(result["mask_image"])
+
+    async def analyze_advertisement(self, product_png: bytes, platform: str) -> str:
+        result = await self._call(
+            "analyze_ad", "POST", f"{IMAGE_BG_PREFIX}/analyze-ad",
+            files={"product_image": ("product.png", product_png, "image/png")},
+            data={"product_type": "general", "marketing_type": f"{platform} 광고용 배경 생성"}
+        )
+        if isinstance(result, dict):
+            return result.get("generated_prompt") or result.get("ad_plan") or ""
+        return str(result)
+
+    async def inpaint_background(self, canvas_png: bytes, mask_png: bytes, prompt: str) -> List[bytes]:
+        result = await self._call(
+            "inpaint", "POST", f"{IMAGE_BG_PREFIX}/inpaint",
+            files={
+                "canvas_image": ("canvas.png", canvas_png, "image/png"),
+                "mask_image": ("mask.png", mask_png, "image/png"),
+            },
+            data={"prompt": prompt, "num_images": str(self.options.num_images), **self._sd_form()}
+        )
+        return [base64.b64decode(image) for image in result["generated_images"]]
+
+    async def generate_background(self, prompt: str, canvas_size: Tuple[int, int]) -> List[bytes]:
+        result = await self._call(
+            "generate_background", "POST", f"{IMAGE_BG_PREFIX}/generate-background",
+            data={
+                "prompt": prompt,
+                "canvas_width": str(canvas_size[0]),
+                "canvas_height": str(canvas_size[1]),
+                "num_images": str(self.options.num_images),
+                **self._sd_form(),
+            }
+        )
+        return [base64.b64decode(image) for image in result["generated_images"]]
+
+    async def apply_smoothing(self, background_png: bytes, product_png: bytes, prompt: str) -> bytes:
+        result = await self._call(
+            "smoothing", "POST", f"{IMAGE_BG_PREFIX}/smoothing",
+            files={
+                "background_image": ("background.png", background_png, "image/png"),
+                "product_image": ("product.png", product_png, "image/png"),
+            },
+            data={"prompt": prompt, "scale": "0.7", **self._sd_form()}
+        )
+        return base64.b64decode(result["smoothed_image"])
+
+    async def generate_ad_text(self, platform: str) -> str:
+        result = await self._call(
+            "generate_ad_text", "POST", f"{TEXT_PREFIX}/textGen-multiTP_singlePF",
+            json={**AD_REQUEST, "ad_type": platform, "mode_input": None if platform == "포스터" else "2"}
+        )
+        return _first_text(result.get("data", {})) or AD_REQUEST["product_name"]
+
+    async def generate_text_image(self, text: str, font_name: str) -> bytes:
+        result = await self._call(
+            "generate_text_image", "POST", f"{IMAGE_TEXT_PREFIX}/generate",
+            json={
+                "text": text[:40],
+                "font_name": font_name,
+                "font_size": 125,
+                "text_colors": "#000000",
+                "stroke_colors": "#FFFFFF",
+                "stroke_width": 2,
+            }
+        )
+        return base64.b64decode(result["image_base64"])
+
+def _first_text(data: Any) -> Optional[str]:
+    """생성 결과에서 텍스트 이미지용 문구(없으면 광고 문구) 추출"""
+    if isinstance(data, dict):
+        for key in ("image_text", "ad_text"):
+            if isinstance(data.get(key), str) and data[key].strip():
+                return data[key]
+        values = data.values()
+    elif isinstance(data, list):
+        values = data
+    else:
+        return None
+    for value in values:
+        text = _first_text(value)
+        if text:
+            return text
+    return None
+
+def compose_final_image(background_png: bytes, text_png: bytes) -> bytes:
+    """Streamlit 4단계 compose_final_image와 같은 클라이언트 측 합성"""
+    background = Image.open(io.BytesIO(background_png)).convert("RGB")
+    text_image = Image.open(io.BytesIO(text_png)).convert("RGBA")
+    scale = min(1.0, background.width * 0.8 / text_image.width)
+    resized = text_image.resize(
+        (max(1, int(text_image.width * scale)), max(1, int(text_image.height * scale))),
+        Image.Resampling.LANCZOS
+    )
+    background.paste(
+        resized,
+        ((background.width - resized.width) // 2, (background.height - resized.height) // 2),
+        resized
+    )
+    buffer = io.BytesIO()
+    background.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+class WorkflowRecorder:
+    """호출/단계/워크플로별 지연 기록"""
+
+    def __init__(self):
+        self.calls: Dict[str, List[float]] = defaultdict(list)
+        self.call_statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.steps: Dict[str, List[float]] = defaultdict(list)
+        self.workflows: List[Dict[str, float]] = []
+        self.failures: Dict[str, int] = defaultdict(int)
+
+    def record_call(self, step: str, name: str, seconds: float, status: str) -> None:
+        self.call_statuses[name][status] += 1
+        if status.startswith("2"):
+            self.calls[name].append(seconds)
+
+    def summary(self, wall_seconds: float) -> Dict[str, Any]:
+        completed = [w for w in self.workflows if w["ok"]]
+        active = [w["active_seconds"] for w in completed]
+        step_totals = {step: sum(self.steps[step]) for step in STEPS}
+        total_active = sum(step_totals.values()) or 1.0
+        bottleneck = max(step_totals, key=step_totals.get) if completed else None
+        return {
+            "workflows": len(self.workflows),
+            "completed": len(completed),
+            "failures": dict(self.failures),
+            "throughput_workflows_per_min": round(len(completed) / wall_seconds * 60, 3) if wall_seconds else 0.0,
+            # 사고 시간 포함 / 제외 종단 지연
+            "end_to_end": latency_summary([w["wall_seconds"] for w in completed]),
+            "active": latency_summary(active),
+            "steps": {
+                step: {
+                    **latency_summary(self.steps[step]),
+                    "share_of_active": round(step_totals[step] / total_active, 4),
+                }
+                for step in STEPS
+            },
+            "calls": {
+                name: {
+                    "count": len(latencies),
+                    "statuses": dict(self.call_statuses[name]),
+                    **latency_summary(latencies),
+                }
+                for name, latencies in self.calls.items()
+            },
+            "bottleneck_step": bottleneck,
+            "bottleneck_call": max(self.calls, key=lambda n: sum(self.calls[n])) if self.calls else None,
+        }
+
+async def simulate_workflow(
+    client,
+    recorder: WorkflowRecorder,
+    options: WorkflowOptions,
+    fixtures: Fixtures,
+    rng: random.Random
+) -> None:
+    """가상 사용자 1명의 워크플로 1회"""
+    api = WorkflowClient(client, recorder, options)
+    canvas_size = rng.choice(CANVAS_SIZES)
+    platform = rng.choice(["인스타그램", "블로그", "포스터"])
+    step_active = {step: 0.0 for step in STEPS}
+    think_total = 0.0
+    started = time.perf_counter()
+
+    async def think():
+        nonlocal think_total
+        if options.think_time > 0:
+            delay = rng.expovariate(1.0 / options.think_time)
+            think_total += delay
+            await asyncio.sleep(delay)
+
+    async def run_step(step: str, coro_fn):
+        api.step = step
+        step_start = time.perf_counter()
+        think_before = think_total
+        try:
+            return await coro_fn()
+        finally:
+            # 단계 내 사고 시간은 제외
+            step_active[step] = time.perf_counter() - step_start - (think_total - think_before)
+
+    async def step1():
+        bg_removed = await api.remove_background(fixtures.product_png)
+        positioned = mask = None
+        for _ in range(rng.randint(*options.position_calls)):
+            await think()
+            # 슬라이더: 크기 1-20 (API는 ×10 퍼센트), 위치 0-400 (API는 -200 오프셋)
+            positioned, mask = await api.position_product(
+                bg_removed, canvas_size, rng.randint(1, 20) * 10,
+                (rng.randint(0, 400) - 200, rng.randint(0, 400) - 200)
+            )
+        return bg_removed, positioned, mask
+
+    async def step2(bg_removed, positioned, mask):
+        prompt = await api.analyze_advertisement(positioned, platform)
+        await think()
+        if rng.random() < options.inpaint_ratio:
+            return await api.inpaint_background(positioned, mask, prompt)
+        backgrounds = await api.generate_background(prompt, canvas_size)
+        return [await api.apply_smoothing(bg, bg_removed, prompt) for bg in backgrounds]
+
+    async def step3():
+        text = await api.generate_ad_text(platform)
+        await think()
+        return await api.generate_text_image(text, fixtures.font_name)
+
+    try:
+        bg_removed, positioned, mask = await run_step(STEPS[0], step1)
+        await think()
+        backgrounds = await run_step(STEPS[1], lambda: step2(bg_removed, positioned, mask))
+        await think()
+        text_image = await run_step(STEPS[2], step3)
+        await think()
+        await run_step(STEPS[3], lambda: asyncio.to_thread(compose_final_image, backgrounds[0], text_image))
+        ok = True
+    except Exception as e:
+        recorder.failures[api.step] += 1
+        logger.debug(f"워크플로 실패 ({api.step}): {e}")
+        ok = False
+
+    if ok:
+        for step, seconds in step_active.items():
+            recorder.steps[step].append(seconds)
+    recorder.workflows.append({
+        "ok": ok,
+        "wall_seconds": time.perf_counter() - started,
+        "active_seconds": sum(step_active.values()),
+        "think_seconds": think_total,
+    })
+
+async def run_users(
+    client,
+    users: int,
+    iterations: int,
+    ramp_up: float,
+    options: WorkflowOptions,
+    fixtures: Fixtures
+) -> Dict[str, Any]:
+    """가상 사용자 users명이 ramp_up초에 걸쳐 시작해 각자 iterations회 워크플로 수행"""
+    recorder = WorkflowRecorder()
+    base_rng = random.Random(options.seed)
+
+    async def user(index: int):
+        rng = random.Random(base_rng.random() + index)
+        await asyncio.sleep(ramp_up * index / max(1, users))
+        for _ in range(iterations):
+            await simulate_workflow(client, recorder, options, fixtures, rng)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(user(i) for i in range(users)))
+    return recorder.summary(time.perf_counter() - started)
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    lines = [
+        f"완료 {summary['completed']}/{summary['workflows']} 워크플로, "
+        f"{summary['throughput_workflows_per_min']:.2f}/min, 병목: {summary['bottleneck_step']} ({summary['bottleneck_call']})",
+        f"종단 지연(사고 시간 포함) p50={summary['end_to_end']['p50']} p95={summary['end_to_end']['p95']}",
+        f"처리 시간(사고 시간 제외) p50={summary['active']['p50']} p95={summary['active']['p95']}",
+        "",
+        f"{'step':<22}{'p50':>9}{'p95':>9}{'share':>8}",
+    ]
+    for step, values in summary["steps"].items():
+        lines.append(f"{step:<22}{values['p50'] or 0:>9.3f}{values['p95'] or 0:>9.3f}{values['share_of_active']:>8.1%}")
+    lines.append("")
+    lines.append(f"{'call':<22}{'count':>7}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for name, values in summary["calls"].items():
+        lines.append(
+            f"{name:<22}{values['count']:>7}{values['p50'] or 0:>9.3f}{values['p95'] or 0:>9.3f}{values['p99'] or 0:>9.3f}"
+        )
+    return "\n".join(lines)
+
+async def run_workflow_load(args) -> Dict[str, Any]:
+    import httpx
+    from .fake_openai import FakeOpenAIConfig
+    from .runner import in_process_client
+
+    options = WorkflowOptions(
+        think_time=args.think_time,
+        position_calls=(args.min_position_calls, args.max_position_calls),
+        inpaint_ratio=args.inpaint_ratio,
+        inference_steps=args.inference_steps,
+        num_images=args.num_images,
+        seed=args.seed
+    )
+    fixtures = Fixtures(canvas_size=(512, 512), inference_steps=args.inference_steps, num_images=args.num_images)
+    started_at = datetime.now().strftime("%Y%m%d-%H%M%S")
+
+    if args.base_url:
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout) as client:
+            summary = await run_users(client, args.users, args.iterations, args.ramp_up, options, fixtures)
+        target = {"base_url": args.base_url}
+    else:
+        services = ["textGen", "imageGen_Text", "imageGen_BG"]
+        async with in_process_client(
+            services,
+            openai_config=FakeOpenAIConfig(latency_median=args.openai_latency_median, seed=args.seed),
+            sd_config=None if args.sd_config == "default" else args.sd_config,
+            timeout=args.timeout
+        ) as (client, info):
+            summary = await run_users(client, args.users, args.iterations, args.ramp_up, options, fixtures)
+        target = {"in_process": info}
+
+    return {
+        "kind": "workflow",
+        "started_at": started_at,
+        "environment": environment(),
+        "config": {**vars(options), "users": args.users, "iterations": args.iterations, "ramp_up": args.ramp_up},
+        "target": target,
+        "summary": summary,
+    }
+
+def main() -> None:
+    from .runner import TINY_SD_CONFIG
+
+    parser = argparse.ArgumentParser(description="4단계 워크플로 부하 생성기")
+    parser.add_argument("--base-url", default=None, help="대상 서버 (없으면 인프로세스 + 대체 OpenAI 서버)")
+    parser.add_argument("--users", type=int, default=4)
+    parser.add_argument("--iterations", type=int, default=1, help="사용자별 워크플로 반복 횟수")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="사용자 시작을 분산할 시간 (초)")
+    parser.add_argument("--think-time", type=float, default=3.0, help="평균 사고 시간 (초, 0이면 없음)")
+    parser.add_argument("--min-position-calls", type=int, default=3)
+    parser.add_argument("--max-position-calls", type=int, default=8)
+    parser.add_argument("--inpaint-ratio", type=float, default=0.5)
+    parser.add_argument("--inference-steps", type=int, default=35)
+    parser.add_argument("--num-images", type=int, default=2)
+    parser.add_argument("--sd-config", default=str(TINY_SD_CONFIG))
+    parser.add_argument("--openai-latency-median", type=float, default=0.8)
+    parser.add_argument("--timeout", type=float, default=600.0)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    report = asyncio.run(run_workflow_load(args))
+    print(format_summary(report["summary"]))
+    print(f"\n리포트 저장: {write_report(report, args.output)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+from typing import List, Optional
+from pydantic_settings import BaseSettings
+
+class ServingSettings(BaseSettings):
+    """서빙 토폴로지 설정 (HTTP 워커 / 추론 프로세스)"""
+    # HTTP 워커 수 (uvicorn)
+    workers: int = 1
+    host: str = "0.0.0.0"
+    port: int = 8000
+
+    # local: 워커가 직접 모델 로드 / remote: 추론 프로세스에 위임
+    inference_mode: str = "local"
+    ipc_address: str = "/tmp/ai_ad_inference.sock"
+    ipc_authkey: Optional[str] = None
+    ipc_timeout: float = 600.0
+
+    # 기동 모드
+    # eager: 트래픽 수신 전 모든 서브시스템 로드
+    # background: 트래픽 수신 후 백그라운드 워밍업
+    # lazy: 첫 사용 시점에 로드
+    startup_mode: str = "background"
+    # 활성화할 서비스 (텍스트 전용 배포 예: ["textGen", "imageGen_Text"] → torch 미로드)
+    enabled_services: List[str] = ["textGen", "imageGen_Text", "imageGen_BG"]
+    # 워밍업 시 미리 로드할 SD 파이프라인
+    warmup_pipelines: List[str] = ["text2img", "inpaint", "ip_adapter"]
+
+    # remote 모드에서 워커 메트릭을 추론 프로세스에 게시하는 주기 (초)
+    metrics_publish_interval: float = 5.0
+
+    class Config:
+        env_file = ".env"
+        extra = "allow"
+        env_prefix = "SERVING_"
+
+class OpenAIPoolSettings(BaseSettings):
+    """앱 전역 OpenAI HTTP 클라이언트 설정 (연결 재사용)"""
+    http2: bool = True
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+
+    # 타임아웃 (초)
+    connect_timeout: float = 5.0
+    read_timeout: float = 60.0
+    write_timeout: float = 10.0
+    pool_timeout: float = 10.0
+
+    # SDK 자체 재시도 (재시도/백오프는 openai_scheduler가 담당하므로 기본 0)
+    max_retries: int = 0
+    # 환경 변수(HTTP(S)_PROXY) 프록시 사용 여부
+    use_env_proxy: bool = False
+
+    class Config:
+        env_file = ".env"
+        extra = "allow"
+        env_prefix = "OPENAI_POOL_"
+
+class OpenAISchedulerSettings(BaseSettings):
+    """OpenAI 호출 페이싱/재시도/헤징 설정"""
+    # 분당 한도 (None이면 응답 헤더 x-ratelimit-limit-*에서 학습)
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+    # 헤더 기준 잔여 예산이 이 비율 이하로 떨어지면 리셋 시각까지 대기
+    budget_reserve_ratio: float = 0.02
+    # 예산 대기 상한 (초과 시 재시도 없이 실패)
+    max_pacing_wait: float = 60.0
+
+    # 재시도 (429/408/409/5xx/타임아웃/연결 오류)
+    max_attempts: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 20.0
+
+    # 헤징: 지연 분위수를 넘긴 비스트리밍 호출을 한 번 더 보내 먼저 끝난 응답 사용
+    hedge_enabled: bool = False
+    hedge_percentile: float = 0.95
+    hedge_min_samples: int = 20
+    hedge_min_delay: float = 1.0
+
+    class Config:
+        env_file = ".env"
+        extra = "allow"
+        env_prefix = "OPENAI_SCHEDULER_"
+
+class ImageEncodingSettings(BaseSettings):
+    """이미지 인코딩 프로필 설정 (common/utils/image_encoding.py)"""
+    # 미리보기: 손실 WebP (지원하지 않는 빌드에서는 PNG)
+    preview_format: str = "WEBP"
+    preview_quality: int = 80
+    # 최종 결과(다음 단계 입력): 무손실 PNG, 낮은 압축 레벨로 인코딩 시간 단축
+    final_format: str = "PNG"
+    final_png_compress_level: int = 3
+    # 다운로드: 크기 우선
+    download_format: str = "PNG"
+    # 배경 생성 서비스 결과에 사용할 프로필
+    bg_output_profile: str = "final"
+
+    class Config:
+        env_file = ".env"
+        extra = "allow"
+        env_prefix = "IMAGE_ENCODING_"
+
+serving_settings = ServingSettings()
+openai_pool_settings = OpenAIPoolSettings()
+openai_scheduler_settings = OpenAISchedulerSettings()
+image_encoding_settings = ImageEncodingSettings()
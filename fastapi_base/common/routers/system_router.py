@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from common.core.config import serving_settings
+from common.service.inference_ipc import inference_client
+from common.service.metrics_service import render_metrics
+from common.service.readiness import readiness, required_subsystems, WARM, FAILED
+from common.utils.import_profiler import import_profiler
+from common.utils.tracing import stage_histograms
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# 추론 프로세스가 소유하는 서브시스템
+REMOTE_SUBSYSTEMS = {"sd_text2img", "sd_inpaint", "sd_ip_adapter", "lora_sets"}
+
+@router.get("/health")
+async def health_check():
+    return {
+        "status": "healthy",
+        "services": serving_settings.enabled_services,
+        "message": "All services are running"
+    }
+
+@router.get("/health/live")
+async def liveness():
+    """프로세스 생존 여부 (모델 로드 여부와 무관)"""
+    return {"status": "alive"}
+
+@router.get("/health/ready")
+async def readiness_check():
+    """
+    서브시스템별 준비 상태.
+
+    필요한 서브시스템이 모두 warm일 때만 200, 아니면 503을 반환합니다.
+    (lazy 기동 모드에서는 상태만 보고하고 항상 200)
+    """
+    required = required_subsystems(serving_settings.enabled_services, serving_settings.warmup_pipelines)
+    subsystems = readiness.snapshot([name for name in required if name not in REMOTE_SUBSYSTEMS])
+    remote = [name for name in required if name in REMOTE_SUBSYSTEMS]
+
+    if remote and serving_settings.inference_mode == "remote":
+        try:
+            status = await asyncio.to_thread(inference_client.get_status)
+            for name in remote:
+                subsystems[name] = status.get(name, {"state": "cold", "progress": 0.0, "message": None})
+        except Exception as e:
+            logger.warning(f"추론 프로세스 상태 조회 실패: {e}")
+            for name in remote:
+                subsystems[name] = {"state": FAILED, "progress": 0.0, "message": f"추론 프로세스 상태 조회 실패: {e}"}
+    elif remote:
+        subsystems.update(readiness.snapshot(remote))
+
+    is_ready = (
+        serving_settings.startup_mode == "lazy"
+        or all(entry["state"] == WARM for entry in subsystems.values())
+    )
+    progress = (
+        sum(entry["progress"] for entry in subsystems.values()) / len(subsystems)
+        if subsystems else 1.0
+    )
+
+    return JSONResponse(
+        status_code=200 if is_ready else 503,
+        content={
+            "status": "ready" if is_ready else "not_ready",
+            "startup_mode": serving_settings.startup_mode,
+            "progress": round(progress, 3),
+            "subsystems": subsystems
+        }
+    )
+
+@router.get("/startup-profile")
+async def startup_profile():
+    """라우터 import 시간 및 로드된 무거운 패키지 보고"""
+    return import_profiler.report()
+
+@router.get("/debug/timings")
+async def stage_timings():
+    """엔드포인트별 단계 지연 시간 분포 (count/mean/p50/p95/p99, 초)"""
+    return stage_histograms.summary()
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus 텍스트 포맷 메트릭 (라우트별 지연, 처리 중 요청, 메모리, 캐시, OpenAI 호출)"""
+    return PlainTextResponse(
+        await render_metrics(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -0,0 +1,307 @@
+import os
+import queue
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from multiprocessing.managers import BaseManager
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from PIL import Image
+
+from common.core.config import serving_settings
+from common.utils.shared_image import put_image, get_image, release_image
+from common.utils.tracing import span, start_trace, record_spans
+
+logger = logging.getLogger(__name__)
+
+# (op, params, images) -> (result, output_images)
+InferenceHandler = Callable[
+    [str, Dict[str, Any], Dict[str, Image.Image]],
+    Awaitable[Tuple[Dict[str, Any], List[Image.Image]]]
+]
+
+
+class _ServerManager(BaseManager):
+    pass
+
+
+class _ClientManager(BaseManager):
+    pass
+
+
+_ClientManager.register("get_request_queue")
+_ClientManager.register("get_response_queue")
+_ClientManager.register("get_status")
+_ClientManager.register("get_metrics")
+_ClientManager.register("publish_metrics")
+_ClientManager.register("get_worker_metrics")
+
+# 이 시간 동안 갱신이 없는 워커 메트릭은 종료된 워커로 보고 제외
+WORKER_METRICS_TTL = 60.0
+
+
+def _authkey(value: Optional[str]) -> bytes:
+    if not value:
+        raise RuntimeError("SERVING_IPC_AUTHKEY가 설정되지 않았습니다.")
+    return value.encode("utf-8")
+
+
+class InferenceServer:
+    """
+    모델을 소유하는 단일 추론 프로세스.
+
+    HTTP 워커들이 공유하는 요청 큐에서 작업을 꺼내 순차 실행하고,
+    워커별 응답 큐로 결과를 돌려줍니다. 이미지는 공유 메모리로 주고받습니다.
+    """
+
+    def __init__(
+        self,
+        handler: InferenceHandler,
+        address: str,
+        authkey: str,
+        warmup: Optional[Callable[[], Awaitable[None]]] = None,
+        status: Optional[Callable[[], Dict[str, Any]]] = None,
+        metrics: Optional[Callable[[], List[Any]]] = None
+    ):
+        self.handler = handler
+        self.warmup = warmup
+        self.status = status or dict
+        self.metrics = metrics or list
+        self.address = address
+        self.authkey = _authkey(authkey)
+        self._request_queue: "queue.Queue" = queue.Queue()
+        self._response_queues: Dict[str, "queue.Queue"] = {}
+        self._worker_metrics: Dict[str, Tuple[float, List[Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _get_response_queue(self, worker_id: str) -> "queue.Queue":
+        with self._lock:
+            if worker_id not in self._response_queues:
+                self._response_queues[worker_id] = queue.Queue()
+            return self._response_queues[worker_id]
+
+    def _collect_metrics(self) -> List[Any]:
+        families = list(self.metrics())
+        families.append((
+            "inference_queue_depth", "gauge", "추론 프로세스 요청 큐 대기 작업 수",
+            [("", {}, self._request_queue.qsize())]
+        ))
+        return families
+
+    def _publish_metrics(self, worker_id: str, families: List[Any]) -> None:
+        with self._lock:
+            self._worker_metrics[worker_id] = (time.time(), families)
+
+    def _get_worker_metrics(self) -> Dict[str, List[Any]]:
+        """워커들이 게시한 최신 메트릭 (오래된 항목은 정리)"""
+        now = time.time()
+        with self._lock:
+            for worker_id in [w for w, (at, _) in self._worker_metrics.items() if now - at > WORKER_METRICS_TTL]:
+                del self._worker_metrics[worker_id]
+            return {worker_id: families for worker_id, (_, families) in self._worker_metrics.items()}
+
+    def _start_manager(self) -> None:
+        if os.path.exists(self.address):
+            os.remove(self.address)
+
+        _ServerManager.register("get_request_queue", callable=lambda: self._request_queue)
+        _ServerManager.register("get_response_queue", callable=self._get_response_queue)
+        # 상태 조회는 요청 큐를 거치지 않고 매니저 스레드에서 바로 응답
+        _ServerManager.register("get_status", callable=self.status)
+        # 워커는 각자 메트릭을 게시하고, /metrics 요청 시 전체를 모아 렌더링
+        _ServerManager.register("get_metrics", callable=self._collect_metrics)
+        _ServerManager.register("publish_metrics", callable=self._publish_metrics)
+        _ServerManager.register("get_worker_metrics", callable=self._get_worker_metrics)
+        manager = _ServerManager(address=self.address, authkey=self.authkey)
+        server = manager.get_server()
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        logger.info(f"추론 프로세스 IPC 대기 중: {self.address}")
+
+    async def _process(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            # 추론 프로세스 측 단계별 시간은 응답에 실어 워커의 Trace에 합침
+            with start_trace() as trace:
+                images = {name: get_image(desc) for name, desc in message.get("images", {}).items()}
+                result, outputs = await self.handler(message["op"], message.get("params", {}), images)
+            return {
+                "id": message["id"],
+                "ok": True,
+                "result": result,
+                "images": [put_image(img) for img in outputs],
+                "timings": trace.totals(),
+            }
+        except Exception as e:
+            logger.error(f"추론 작업 실패 ({message.get('op')}): {e}")
+            return {"id": message["id"], "ok": False, "error": str(e)}
+
+    def serve_forever(self) -> None:
+        """요청 큐를 소비하는 메인 루프 (GPU 작업은 직렬 실행)"""
+        self._start_manager()
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        # IPC 소켓을 연 뒤 모델 로드 (그 사이 요청은 큐에 쌓임)
+        if self.warmup:
+            try:
+                loop.run_until_complete(self.warmup())
+            except Exception as e:
+                logger.warning(f"추론 프로세스 워밍업 실패: {e}")
+
+        while True:
+            message = self._request_queue.get()
+            if message is None:
+                break
+            response = loop.run_until_complete(self._process(message))
+            self._get_response_queue(message["worker"]).put(response)
+
+        loop.close()
+
+
+class InferenceClient:
+    """HTTP 워커 측 추론 프로세스 클라이언트"""
+
+    def __init__(self, address: str, authkey: Optional[str], timeout: float = 600.0):
+        self.address = address
+        self.authkey = authkey
+        self.timeout = timeout
+        self.worker_id = f"worker-{os.getpid()}"
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._manager = None
+        self._request_queue = None
+        self._response_queue = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closed = False
+
+    @property
+    def connected(self) -> bool:
+        return self._request_queue is not None
+
+    @property
+    def pending(self) -> int:
+        """응답을 기다리는 요청 수"""
+        return len(self._pending)
+
+    def connect(self) -> None:
+        """추론 프로세스에 연결하고 응답 디스패처 스레드를 시작합니다."""
+        manager = _ClientManager(address=self.address, authkey=_authkey(self.authkey))
+        manager.connect()
+        self._manager = manager
+        self._request_queue = manager.get_request_queue()
+        self._response_queue = manager.get_response_queue(self.worker_id)
+        self._loop = asyncio.get_running_loop()
+        threading.Thread(target=self._dispatch_responses, daemon=True).start()
+        logger.info(f"추론 프로세스 연결 완료: {self.address} ({self.worker_id})")
+
+    def get_status(self) -> Dict[str, Any]:
+        """추론 프로세스의 서브시스템 상태 조회 (블로킹 호출)"""
+        if not self.connected:
+            raise RuntimeError("추론 프로세스에 연결되지 않았습니다.")
+        return self._manager.get_status()._getvalue()
+
+    def publish_metrics(self, families: List[Any]) -> None:
+        """이 워커의 메트릭을 추론 프로세스에 게시 (블로킹 호출)"""
+        if not self.connected:
+            raise RuntimeError("추론 프로세스에 연결되지 않았습니다.")
+        self._manager.publish_metrics(self.worker_id, families)
+
+    def get_cluster_metrics(self) -> Dict[str, List[Any]]:
+        """추론 프로세스 및 모든 워커의 메트릭 ({출처: families}, 블로킹 호출)"""
+        if not self.connected:
+            raise RuntimeError("추론 프로세스에 연결되지 않았습니다.")
+        workers = self._manager.get_worker_metrics()._getvalue()
+        return {"inference": self._manager.get_metrics()._getvalue(), **workers}
+
+    def _dispatch_responses(self) -> None:
+        while not self._closed:
+            try:
+                response = self._response_queue.get()
+            except (EOFError, OSError) as e:
+                logger.error(f"추론 프로세스 연결 끊김: {e}")
+                break
+            if response is None:
+                break
+
+            future = self._pending.pop(response["id"], None)
+            if future is None:
+                # 타임아웃 등으로 버려진 요청
+                for desc in response.get("images", []):
+                    release_image(desc)
+                continue
+            self._loop.call_soon_threadsafe(_resolve, future, response)
+
+        # 남은 요청은 실패 처리
+        for request_id in list(self._pending):
+            future = self._pending.pop(request_id)
+            self._loop.call_soon_threadsafe(
+                _resolve, future, {"id": request_id, "ok": False, "error": "추론 프로세스 연결이 종료되었습니다."}
+            )
+
+    async def submit(
+        self,
+        op: str,
+        params: Dict[str, Any],
+        images: Optional[Dict[str, Image.Image]] = None
+    ) -> Tuple[Dict[str, Any], List[Image.Image]]:
+        """작업을 추론 프로세스로 보내고 (result, output_images)를 반환합니다."""
+        if not self.connected:
+            raise RuntimeError("추론 프로세스에 연결되지 않았습니다.")
+
+        request_id = uuid.uuid4().hex
+        with span("shm_transfer"):
+            descriptors = {name: put_image(img) for name, img in (images or {}).items()}
+        future = self._loop.create_future()
+        self._pending[request_id] = future
+
+        message = {
+            "id": request_id,
+            "worker": self.worker_id,
+            "op": op,
+            "params": params,
+            "images": descriptors,
+        }
+
+        try:
+            await asyncio.to_thread(self._request_queue.put, message)
+        except Exception:
+            self._pending.pop(request_id, None)
+            for desc in descriptors.values():
+                release_image(desc)
+            raise
+
+        try:
+            with span("ipc_roundtrip"):
+                response = await asyncio.wait_for(future, timeout=self.timeout)
+        except Exception:
+            self._pending.pop(request_id, None)
+            raise
+
+        if not response["ok"]:
+            raise RuntimeError(response["error"])
+
+        record_spans(response.get("timings", {}))
+        with span("shm_transfer"):
+            outputs = [get_image(desc) for desc in response["images"]]
+        return response.get("result", {}), outputs
+
+    def close(self) -> None:
+        if not self.connected or self._closed:
+            return
+        self._closed = True
+        try:
+            self._response_queue.put(None)
+        except (EOFError, OSError):
+            pass
+
+
+def _resolve(future: asyncio.Future, response: Dict[str, Any]) -> None:
+    if not future.done():
+        future.set_result(response)
+
+
+# 전역 인스턴스 (remote 모드에서 lifespan에서 연결)
+inference_client = InferenceClient(
+    address=serving_settings.ipc_address,
+    authkey=serving_settings.ipc_authkey,
+    timeout=serving_settings.ipc_timeout
+)
@@ -0,0 +1,92 @@
+"""
+/metrics 수집 및 멀티 프로세스 집계
+
+local 모드: 현재 프로세스의 메트릭만 렌더링합니다.
+remote 모드: 각 워커가 주기적으로(및 스크레이프 시) 메트릭을 추론 프로세스에 게시하고,
+어느 워커가 스크레이프를 받든 추론 프로세스 + 모든 워커 메트릭을 process 라벨로 구분해 반환합니다.
+"""
+import sys
+import asyncio
+import logging
+from typing import List
+
+from common.core.config import serving_settings
+from common.service.inference_ipc import inference_client
+from common.service.readiness import readiness, WARM
+from common.utils.metrics import (
+    Family, metrics, render, with_labels, histogram_samples, process_memory, memory_families
+)
+from common.utils.tracing import stage_histograms
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_MODULE = "imageGen_BG.service.pipeline_service"
+
+def _stage_families() -> List[Family]:
+    samples = []
+    for (endpoint, stage), histogram in stage_histograms.items():
+        samples.extend(histogram_samples(histogram, {"route": endpoint, "stage": stage}))
+    return [("request_stage_duration_seconds", "histogram", "엔드포인트별 단계 처리 시간", samples)]
+
+def _memory_families() -> List[Family]:
+    snapshot = process_memory()
+    # 파이프라인 모듈이 이미 로드된 프로세스에서만 모델 메모리 보고
+    pipeline_module = sys.modules.get(PIPELINE_MODULE)
+    if pipeline_module is not None:
+        snapshot["models"] = pipeline_module.pipeline_service.memory_report()
+    return memory_families(snapshot)
+
+def _readiness_families() -> List[Family]:
+    warm, load_seconds = [], []
+    for name, entry in readiness.snapshot().items():
+        warm.append(("", {"subsystem": name}, 1.0 if entry["state"] == WARM else 0.0))
+        if entry["load_seconds"] is not None:
+            load_seconds.append(("", {"subsystem": name}, entry["load_seconds"]))
+    return [
+        ("subsystem_warm", "gauge", "서브시스템 준비 완료 여부", warm),
+        ("subsystem_load_seconds", "gauge", "서브시스템 로드 소요 시간", load_seconds),
+    ]
+
+def _inference_client_families() -> List[Family]:
+    if not inference_client.connected:
+        return []
+    return [(
+        "inference_requests_pending", "gauge", "추론 프로세스 응답 대기 중인 요청 수",
+        [("", {}, inference_client.pending)]
+    )]
+
+metrics.register_collector(_stage_families)
+metrics.register_collector(_memory_families)
+metrics.register_collector(_readiness_families)
+metrics.register_collector(_inference_client_families)
+
+def collect_local() -> List[Family]:
+    """현재 프로세스의 메트릭 패밀리"""
+    return metrics.collect()
+
+async def render_metrics() -> str:
+    """Prometheus 텍스트 포맷 메트릭"""
+    local = collect_local()
+    if serving_settings.inference_mode != "remote" or not inference_client.connected:
+        return render(local)
+
+    try:
+        await asyncio.to_thread(inference_client.publish_metrics, local)
+        cluster = await asyncio.to_thread(inference_client.get_cluster_metrics)
+    except Exception as e:
+        logger.warning(f"추론 프로세스 메트릭 집계 실패: {e}")
+        return render(with_labels(local, process=inference_client.worker_id))
+
+    families: List[Family] = []
+    for source, source_families in cluster.items():
+        families.extend(with_labels(source_families, process=source))
+    return render(families)
+
+async def publish_metrics_forever(interval: float) -> None:
+    """remote 모드에서 이 워커의 메트릭을 주기적으로 추론 프로세스에 게시"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(inference_client.publish_metrics, collect_local())
+        except Exception as e:
+            logger.debug(f"메트릭 게시 실패: {e}")
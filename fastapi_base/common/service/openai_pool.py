@@ -0,0 +1,81 @@
+import os
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from common.core.config import OpenAIPoolSettings, openai_pool_settings
+
+logger = logging.getLogger(__name__)
+
+class OpenAIClientPool:
+    """
+    앱 전역 OpenAI 클라이언트 풀.
+
+    httpx.AsyncClient 하나(HTTP/2, keep-alive 연결 풀)를 모든 서비스가 공유하고,
+    API 키별 AsyncOpenAI 래퍼만 따로 둡니다. lifespan 종료 시 aclose()로 연결을 정리합니다.
+    """
+
+    def __init__(self, settings: OpenAIPoolSettings):
+        self.settings = settings
+        self._http_client = None
+        self._clients: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _create_http_client(self):
+        import httpx
+
+        settings = self.settings
+        limits = httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry
+        )
+        timeout = httpx.Timeout(
+            connect=settings.connect_timeout,
+            read=settings.read_timeout,
+            write=settings.write_timeout,
+            pool=settings.pool_timeout
+        )
+
+        http2 = settings.http2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("h2 패키지가 없어 HTTP/1.1로 연결합니다. (pip install 'httpx[http2]')")
+                http2 = False
+
+        if settings.use_env_proxy:
+            return httpx.AsyncClient(http2=http2, limits=limits, timeout=timeout)
+        # 전송 계층을 직접 지정하면 환경 변수 프록시를 사용하지 않음
+        transport = httpx.AsyncHTTPTransport(http2=http2, limits=limits)
+        return httpx.AsyncClient(transport=transport, timeout=timeout)
+
+    def get_client(self, api_key: Optional[str] = None):
+        """API 키에 해당하는 AsyncOpenAI 반환 (연결 풀은 공유)"""
+        from openai import AsyncOpenAI
+
+        api_key = api_key or os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
+
+        with self._lock:
+            if self._http_client is None:
+                self._http_client = self._create_http_client()
+            if api_key not in self._clients:
+                self._clients[api_key] = AsyncOpenAI(
+                    api_key=api_key,
+                    http_client=self._http_client,
+                    max_retries=self.settings.max_retries
+                )
+            return self._clients[api_key]
+
+    async def aclose(self) -> None:
+        with self._lock:
+            http_client, self._http_client = self._http_client, None
+            self._clients.clear()
+        if http_client is not None:
+            await http_client.aclose()
+
+# 전역 인스턴스
+openai_pool = OpenAIClientPool(openai_pool_settings)
@@ -0,0 +1,335 @@
+import re
+import math
+import time
+import random
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from common.core.config import OpenAISchedulerSettings, openai_scheduler_settings
+from common.utils.metrics import metrics, openai_call_timer
+from common.utils.rate_limit import RateLimiter
+from common.utils.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 HTTP 상태 (요청 한도 / 타임아웃 / 충돌 / 서버 오류)
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+# 헤징 분위수 계산용 최근 지연 샘플 수
+LATENCY_WINDOW = 200
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+_retries = metrics.counter(
+    "openai_retries_total", "OpenAI 호출 재시도 수", ["service", "reason"]
+)
+_hedges = metrics.counter(
+    "openai_hedged_requests_total", "OpenAI 헤징 요청 수", ["service", "outcome"]
+)
+_pacing_wait = metrics.histogram(
+    "openai_pacing_wait_seconds", "OpenAI 요청 한도 대기 시간", ["service"]
+)
+
+class OpenAIUnavailableError(RuntimeError):
+    """재시도 후에도 OpenAI 호출 실패 (요청 한도 초과 / 타임아웃 / 서버 오류) → 503"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """초 단위 숫자 또는 x-ratelimit-reset-* 형식("20ms", "1s", "6m0s")을 초로 변환"""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(number) * _UNIT_SECONDS[unit] for number, unit in parts)
+
+def retry_after_seconds(headers: Any) -> Optional[float]:
+    """Retry-After / retry-after-ms 헤더 (HTTP 날짜 형식은 무시)"""
+    if headers is None:
+        return None
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+    return parse_duration(headers.get("retry-after"))
+
+def _header_int(headers: Any, name: str) -> Optional[int]:
+    value = headers.get(name)
+    try:
+        return int(float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+class RateLimitState:
+    """모델별 계정 한도 상태 (x-ratelimit-* 응답 헤더로 갱신, 응답 사이에는 로컬에서 차감)"""
+
+    def __init__(self, limiter: Optional[RateLimiter] = None):
+        self.limiter = limiter
+        self.limit_requests: Optional[int] = None
+        self.limit_tokens: Optional[int] = None
+        self.remaining_requests: Optional[int] = None
+        self.remaining_tokens: Optional[int] = None
+        self.reset_requests_at = 0.0
+        self.reset_tokens_at = 0.0
+
+    def update(self, headers: Any) -> None:
+        now = time.monotonic()
+        self.limit_requests = _header_int(headers, "x-ratelimit-limit-requests") or self.limit_requests
+        self.limit_tokens = _header_int(headers, "x-ratelimit-limit-tokens") or self.limit_tokens
+
+        remaining_requests = _header_int(headers, "x-ratelimit-remaining-requests")
+        if remaining_requests is not None:
+            self.remaining_requests = remaining_requests
+            self.reset_requests_at = now + (parse_duration(headers.get("x-ratelimit-reset-requests")) or 0.0)
+        remaining_tokens = _header_int(headers, "x-ratelimit-remaining-tokens")
+        if remaining_tokens is not None:
+            self.remaining_tokens = remaining_tokens
+            self.reset_tokens_at = now + (parse_duration(headers.get("x-ratelimit-reset-tokens")) or 0.0)
+
+        # 설정된 한도가 없으면 헤더의 분당 한도로 토큰 버킷 생성
+        if self.limiter is None and (self.limit_requests or self.limit_tokens):
+            self.limiter = RateLimiter(self.limit_requests, self.limit_tokens)
+
+    def wait_time(self, tokens: int, reserve_ratio: float) -> float:
+        """잔여 예산이 예비분 이하이면 리셋 시각까지 남은 시간"""
+        now = time.monotonic()
+        waits = [0.0]
+        if self.remaining_requests is not None and self.limit_requests:
+            if self.remaining_requests - 1 < self.limit_requests * reserve_ratio:
+                waits.append(self.reset_requests_at - now)
+        if self.remaining_tokens is not None and self.limit_tokens:
+            if self.remaining_tokens - tokens < self.limit_tokens * reserve_ratio:
+                waits.append(self.reset_tokens_at - now)
+        return max(waits)
+
+    def reserve(self, tokens: int) -> None:
+        if self.remaining_requests is not None:
+            self.remaining_requests -= 1
+        if self.remaining_tokens is not None:
+            self.remaining_tokens -= tokens
+
+class OpenAIScheduler:
+    """
+    OpenAI 호출 공용 스케줄러.
+
+    - 페이싱: 분당 요청/토큰 토큰 버킷 + 응답 헤더 기준 잔여 예산
+    - 재시도: 지터가 있는 지수 백오프 (Retry-After가 있으면 그 값을 따름)
+    - 헤징(선택): 최근 지연 분위수를 넘긴 비스트리밍 호출을 한 번 더 보내 먼저 끝난 응답 사용
+    """
+
+    def __init__(self, settings: OpenAISchedulerSettings):
+        self.settings = settings
+        self._states: Dict[str, RateLimitState] = {}
+        self._latencies: Dict[Tuple[str, str], Deque[float]] = {}
+
+    def _state(self, model: str) -> RateLimitState:
+        state = self._states.get(model)
+        if state is None:
+            limiter = None
+            if self.settings.requests_per_minute or self.settings.tokens_per_minute:
+                limiter = RateLimiter(self.settings.requests_per_minute, self.settings.tokens_per_minute)
+            state = self._states[model] = RateLimitState(limiter)
+        return state
+
+    @staticmethod
+    def estimate_tokens(params: Dict[str, Any]) -> int:
+        """입력 + 최대 출력 토큰 근사 (호출자가 estimated_tokens를 주지 않을 때)"""
+        chars = sum(
+            len(message["content"]) for message in params.get("messages", [])
+            if isinstance(message.get("content"), str)
+        )
+        return chars // 2 + (params.get("max_tokens") or 256) * params.get("n", 1)
+
+    async def _pace(self, service: str, model: str, tokens: int) -> None:
+        state = self._state(model)
+        start = time.monotonic()
+        while True:
+            delay = state.wait_time(tokens, self.settings.budget_reserve_ratio)
+            if delay <= 0:
+                break
+            if time.monotonic() - start + delay > self.settings.max_pacing_wait:
+                raise OpenAIUnavailableError("OpenAI 요청 한도에 도달했습니다.", retry_after=delay)
+            await asyncio.sleep(delay)
+        if state.limiter is not None:
+            await state.limiter.acquire(1, tokens)
+        state.reserve(tokens)
+
+        waited = time.monotonic() - start
+        if waited > 0.001:
+            _pacing_wait.observe(waited, service=service)
+
+    def _backoff(self, attempt: int) -> float:
+        # full jitter: 0 ~ min(상한, base × 2^(시도-1))
+        return random.uniform(0, min(self.settings.backoff_max, self.settings.backoff_base * 2 ** (attempt - 1)))
+
+    async def _with_retries(
+        self,
+        service: str,
+        model: str,
+        tokens: int,
+        attempt_fn: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        from openai import APIConnectionError, APIStatusError, APITimeoutError
+
+        max_attempts = max(1, self.settings.max_attempts)
+        last_error: Optional[Exception] = None
+        retry_after: Optional[float] = None
+
+        for attempt in range(1, max_attempts + 1):
+            await self._pace(service, model, tokens)
+            try:
+                return await attempt_fn()
+            except APIConnectionError as e:
+                # APITimeoutError는 APIConnectionError의 하위 클래스
+                reason = "timeout" if isinstance(e, APITimeoutError) else "connection"
+                retry_after = None
+                last_error = e
+            except APIStatusError as e:
+                if e.status_code not in RETRYABLE_STATUS:
+                    raise
+                reason = str(e.status_code)
+                self._state(model).update(e.response.headers)
+                retry_after = retry_after_seconds(e.response.headers)
+                last_error = e
+
+            if attempt == max_attempts:
+                break
+            delay = retry_after if retry_after is not None else self._backoff(attempt)
+            if delay > self.settings.max_pacing_wait:
+                break
+            _retries.inc(service=service, reason=reason)
+            logger.warning(f"OpenAI 호출 재시도 ({service}, {reason}): {attempt}/{max_attempts}, {delay:.2f}초 후")
+            await asyncio.sleep(delay)
+
+        raise OpenAIUnavailableError(
+            f"OpenAI API 호출 실패 ({attempt}회 시도): {last_error}", retry_after=retry_after
+        ) from last_error
+
+    def _hedge_delay(self, service: str, model: str) -> Optional[float]:
+        if not self.settings.hedge_enabled:
+            return None
+        samples = self._latencies.get((service, model))
+        if not samples or len(samples) < self.settings.hedge_min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.settings.hedge_percentile))
+        return max(self.settings.hedge_min_delay, ordered[index])
+
+    async def _hedged(self, service: str, model: str, tokens: int, attempt_fn, delay: float) -> Any:
+        first = asyncio.create_task(attempt_fn())
+        pending = {first}
+        error: Optional[BaseException] = None
+        # 호출자가 취소되면 finally에서 진행 중인 호출(첫 요청 포함)을 모두 취소
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return first.result()
+
+            self._state(model).reserve(tokens)
+            _hedges.inc(service=service, outcome="sent")
+            second = asyncio.create_task(attempt_fn())
+            pending = {first, second}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        _hedges.inc(service=service, outcome="hedge_won" if task is second else "primary_won")
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def create(
+        self,
+        service: str,
+        client: Any,
+        estimated_tokens: Optional[int] = None,
+        **params: Any
+    ) -> Any:
+        """chat.completions.create (페이싱 + 재시도 + 헤징), 호출 시간/토큰은 metrics에 기록"""
+        model = params["model"]
+        tokens = estimated_tokens or self.estimate_tokens(params)
+
+        async def attempt():
+            start = time.perf_counter()
+            with openai_call_timer(service, model) as call:
+                raw = await client.chat.completions.with_raw_response.create(**params)
+                self._state(model).update(raw.headers)
+                response = raw.parse()
+                call.usage = response.usage
+            self._latencies.setdefault((service, model), deque(maxlen=LATENCY_WINDOW)).append(
+                time.perf_counter() - start
+            )
+            return response
+
+        async def attempt_with_hedge():
+            delay = self._hedge_delay(service, model)
+            if delay is None:
+                return await attempt()
+            return await self._hedged(service, model, tokens, attempt, delay)
+
+        with span("openai"):
+            return await self._with_retries(service, model, tokens, attempt_with_hedge)
+
+    async def open_stream(
+        self,
+        service: str,
+        client: Any,
+        estimated_tokens: Optional[int] = None,
+        **params: Any
+    ) -> Any:
+        """
+        스트리밍 chat.completions.create (페이싱 + 재시도, 헤징 없음)
+
+        응답 스트림을 연 이후의 오류는 재시도하지 않으며, 호출 시간은 호출자가 기록합니다.
+        """
+        model = params["model"]
+        tokens = estimated_tokens or self.estimate_tokens(params)
+
+        async def attempt():
+            raw = await client.chat.completions.with_raw_response.create(stream=True, **params)
+            self._state(model).update(raw.headers)
+            return raw.parse()
+
+        return await self._with_retries(service, model, tokens, attempt)
+
+    def ratelimit_families(self) -> List[Any]:
+        """모델별 헤더 기준 잔여 예산 (/metrics)"""
+        samples = []
+        for model, state in list(self._states.items()):
+            if state.remaining_requests is not None:
+                samples.append(("", {"model": model, "kind": "requests"}, state.remaining_requests))
+            if state.remaining_tokens is not None:
+                samples.append(("", {"model": model, "kind": "tokens"}, state.remaining_tokens))
+        if not samples:
+            return []
+        return [("openai_ratelimit_remaining", "gauge", "OpenAI 계정 잔여 예산 (응답 헤더 기준)", samples)]
+
+async def openai_unavailable_handler(request: Request, exc: OpenAIUnavailableError) -> JSONResponse:
+    """재시도 후에도 실패한 OpenAI 호출은 503 + Retry-After로 응답"""
+    headers = {"Retry-After": str(max(1, math.ceil(exc.retry_after)))} if exc.retry_after else None
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "OpenAI 요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해 주세요."},
+        headers=headers
+    )
+
+# 전역 인스턴스
+openai_scheduler = OpenAIScheduler(openai_scheduler_settings)
+metrics.register_collector(openai_scheduler.ratelimit_families)
@@ -0,0 +1,101 @@
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional
+
+# 서브시스템 상태
+COLD = "cold"
+WARMING = "warming"
+WARM = "warm"
+FAILED = "failed"
+
+# 서비스별 준비 상태를 판단하는 서브시스템
+SERVICE_SUBSYSTEMS = {
+    "textGen": ["openai_client"],
+    "imageGen_Text": ["fonts"],
+    "imageGen_BG": ["openai_client", "rembg", "sd_text2img", "sd_inpaint", "sd_ip_adapter", "lora_sets"],
+}
+
+class ReadinessRegistry:
+    """서브시스템별 로드 상태 및 진행률 관리"""
+
+    def __init__(self):
+        self._subsystems: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, name: str) -> Dict[str, Any]:
+        if name not in self._subsystems:
+            self._subsystems[name] = {
+                "state": COLD,
+                "progress": 0.0,
+                "message": None,
+                "load_seconds": None,
+                "updated_at": time.time(),
+                "_started_at": None,
+            }
+        return self._subsystems[name]
+
+    def set_state(
+        self,
+        name: str,
+        state: str,
+        progress: Optional[float] = None,
+        message: Optional[str] = None
+    ) -> None:
+        with self._lock:
+            entry = self._entry(name)
+            if state == WARMING and entry["state"] in (COLD, FAILED):
+                entry["_started_at"] = time.time()
+            if state == WARM and entry["_started_at"]:
+                entry["load_seconds"] = round(time.time() - entry["_started_at"], 3)
+
+            entry["state"] = state
+            entry["message"] = message
+            entry["updated_at"] = time.time()
+            if progress is not None:
+                entry["progress"] = round(progress, 3)
+            elif state == WARM:
+                entry["progress"] = 1.0
+
+    def set_progress(self, name: str, progress: float) -> None:
+        with self._lock:
+            entry = self._entry(name)
+            entry["progress"] = round(progress, 3)
+            entry["updated_at"] = time.time()
+
+    def state(self, name: str) -> str:
+        with self._lock:
+            return self._entry(name)["state"]
+
+    @contextmanager
+    def track(self, name: str):
+        """블록 실행 동안 warming, 성공 시 warm, 예외 시 failed"""
+        self.set_state(name, WARMING, progress=0.0)
+        try:
+            yield
+        except Exception as e:
+            self.set_state(name, FAILED, message=str(e))
+            raise
+        self.set_state(name, WARM)
+
+    def snapshot(self, names: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            names = names if names is not None else list(self._subsystems)
+            return {
+                name: {k: v for k, v in self._entry(name).items() if not k.startswith("_")}
+                for name in names
+            }
+
+def required_subsystems(enabled_services: List[str], warmup_pipelines: List[str]) -> List[str]:
+    """활성 서비스 기준으로 준비 완료가 필요한 서브시스템 목록"""
+    names = []
+    for service in enabled_services:
+        for name in SERVICE_SUBSYSTEMS.get(service, []):
+            if name.startswith("sd_") and name[len("sd_"):] not in warmup_pipelines:
+                continue
+            if name not in names:
+                names.append(name)
+    return names
+
+# 전역 인스턴스 (프로세스별)
+readiness = ReadinessRegistry()
@@ -0,0 +1,89 @@
+import asyncio
+import logging
+from typing import List
+
+from common.core.config import serving_settings
+from common.service.readiness import readiness, WARMING, WARM, FAILED
+
+logger = logging.getLogger(__name__)
+
+def _warm_openai_client(enabled_services: List[str]) -> None:
+    """공유 OpenAI 연결 풀 생성 (서비스별 API 키 클라이언트 포함) 및 textGen 프롬프트 구성"""
+    if "textGen" in enabled_services:
+        from textGen.service.textGen_service import ad_service
+        from textGen.utils.prompt_registry import prompt_registry
+        ad_service._get_client()
+        prompt_registry.compile()
+    if "imageGen_BG" in enabled_services:
+        from imageGen_BG.service.gpt_service import gpt_service
+        gpt_service.client
+
+def _warm_rembg() -> None:
+    """rembg 세션 로드 + 소형 이미지 1회 처리"""
+    from PIL import Image
+    from imageGen_BG.utils.image_utils import ImageProcessor, get_rembg_session
+
+    get_rembg_session()
+    readiness.set_progress("rembg", 0.5)
+    ImageProcessor().remove_background(Image.new("RGBA", (32, 32), (255, 255, 255, 255)))
+
+async def _warm_fonts() -> None:
+    """설정된 폰트를 동시에 받아 검증하고, 기본 서브셋을 만들어 기본 크기 폰트를 캐시에 로드 (일부 실패는 메시지로만 보고)"""
+    from imageGen_Text.core.imageGen_Text_config import FONTS
+    from imageGen_Text.utils.font_cache import font_cache
+    from imageGen_Text.utils.font_store import font_store
+    from imageGen_Text.utils.font_subset import font_subsetter
+
+    paths = await font_store.prefetch_all(lambda done: readiness.set_progress("fonts", 0.6 * done))
+    unavailable = [font_name for font_name, path in paths.items() if path is None]
+    # 폰트별 기본 서브셋 생성 (이미 디스크에 있으면 건너뜀)
+    await asyncio.gather(*(font_subsetter.prepare(font_name) for font_name, path in paths.items() if path))
+    readiness.set_progress("fonts", 0.8)
+
+    def load() -> None:
+        font_cache.resolve_paths()
+        for font_name, path in paths.items():
+            if path is None:
+                continue
+            try:
+                font_cache.get(font_name, 125, text="")
+            except Exception:
+                unavailable.append(font_name)
+    await asyncio.to_thread(load)
+    readiness.set_progress("fonts", 1.0)
+
+    if len(unavailable) == len(FONTS):
+        raise RuntimeError("사용 가능한 폰트가 없습니다.")
+    if unavailable:
+        readiness.set_state("fonts", WARM, message=f"사용 불가 폰트: {unavailable}")
+        logger.warning(f"사용 불가 폰트: {unavailable}")
+
+async def _run_step(name: str, step) -> None:
+    if readiness.state(name) == WARM:
+        return
+    readiness.set_state(name, WARMING, progress=0.0)
+    try:
+        await step()
+        if readiness.state(name) != WARM:
+            readiness.set_state(name, WARM)
+        logger.info(f"워밍업 완료: {name}")
+    except Exception as e:
+        readiness.set_state(name, FAILED, message=str(e))
+        logger.warning(f"워밍업 실패 ({name}): {e}")
+
+async def warmup_subsystems(enabled_services: List[str]) -> None:
+    """
+    활성화된 서비스의 무거운 서브시스템을 미리 로드하고 1회 실행합니다.
+
+    진행 상태는 readiness에 기록되며, 실패한 서브시스템은 첫 요청 시 다시 로드를 시도합니다.
+    """
+    if "textGen" in enabled_services or "imageGen_BG" in enabled_services:
+        await _run_step("openai_client", lambda: asyncio.to_thread(_warm_openai_client, enabled_services))
+    if "imageGen_Text" in enabled_services:
+        await _run_step("fonts", _warm_fonts)
+    if "imageGen_BG" in enabled_services:
+        await _run_step("rembg", lambda: asyncio.to_thread(_warm_rembg))
+        # remote 모드에서는 추론 프로세스가 파이프라인을 직접 워밍업
+        if serving_settings.inference_mode == "local":
+            from imageGen_BG.service.pipeline_service import pipeline_service
+            await pipeline_service.warmup(serving_settings.warmup_pipelines)
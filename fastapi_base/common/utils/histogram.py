@@ -0,0 +1,61 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, Any, List, Optional
+
+# 지연 시간(초) 기본 버킷
+DEFAULT_BUCKETS = [
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+]
+
+class Histogram:
+    """고정 버킷 누적 히스토그램 (스레드 안전)"""
+
+    def __init__(self, buckets: Optional[List[float]] = None):
+        self.buckets = sorted(buckets or DEFAULT_BUCKETS)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.counts[bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """버킷 내 선형 보간으로 분위수 추정"""
+        with self._lock:
+            if self.count == 0:
+                return None
+            target = q * self.count
+            cumulative = 0
+            for i, bucket_count in enumerate(self.counts):
+                if cumulative + bucket_count >= target and bucket_count > 0:
+                    lower = self.buckets[i - 1] if i > 0 else 0.0
+                    upper = self.buckets[i] if i < len(self.buckets) else self.buckets[-1]
+                    return lower + (upper - lower) * (target - cumulative) / bucket_count
+                cumulative += bucket_count
+            return self.buckets[-1]
+
+    def cumulative_counts(self) -> List[int]:
+        """Prometheus 형식의 누적 버킷 카운트 (+Inf 포함)"""
+        with self._lock:
+            result, total = [], 0
+            for bucket_count in self.counts:
+                total += bucket_count
+                result.append(total)
+            return result
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": round(self.sum / self.count, 4) if self.count else None,
+            "p50": _round(self.quantile(0.5)),
+            "p95": _round(self.quantile(0.95)),
+            "p99": _round(self.quantile(0.99)),
+        }
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 4) if value is not None else None
@@ -0,0 +1,123 @@
+"""
+이미지 인코딩 (텍스트/배경 이미지 서비스 공용)
+
+용도별 프로필로 포맷과 압축 파라미터를 고릅니다.
+    preview  - 화면 미리보기 (손실 WebP 등, 작고 빠름)
+    final    - 다음 단계 입력으로 쓰는 결과 (무손실, 빠른 압축)
+    download - 사용자가 저장하는 결과 (무손실, 크기 우선)
+
+WebP/AVIF는 설치된 Pillow가 지원할 때만 사용하고, 지원하지 않으면 PNG로 인코딩합니다.
+인코딩 시간과 바이트 수는 포맷/프로필별 히스토그램으로 기록합니다.
+"""
+import io
+import time
+import logging
+import functools
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from PIL import Image, features
+
+from common.core.config import image_encoding_settings as settings
+from common.utils.metrics import metrics
+from common.utils.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# 알파 채널을 지원하지 않는 포맷 (RGB로 변환 후 저장)
+RGB_ONLY_FORMATS = {"JPEG", "ICO", "PPM", "HEIF"}
+
+class EncodingProfile(NamedTuple):
+    """용도별 기본 포맷과 포맷별 저장 옵션 (options에 없는 포맷은 Pillow 기본값)"""
+    format: str
+    options: Dict[str, Dict[str, Any]]
+
+PROFILES: Dict[str, EncodingProfile] = {
+    "preview": EncodingProfile(settings.preview_format.upper(), {
+        "WEBP": {"quality": settings.preview_quality, "method": 2},
+        "PNG": {"compress_level": 1},
+        "JPEG": {"quality": settings.preview_quality},
+        "AVIF": {"quality": 60, "speed": 8},
+    }),
+    "final": EncodingProfile(settings.final_format.upper(), {
+        "PNG": {"compress_level": settings.final_png_compress_level},
+        "WEBP": {"lossless": True, "quality": 50, "method": 2},
+        "JPEG": {"quality": 92},
+        "AVIF": {"quality": 85, "speed": 6},
+    }),
+    "download": EncodingProfile(settings.download_format.upper(), {
+        "PNG": {"compress_level": 9},
+        "WEBP": {"lossless": True, "quality": 100, "method": 6},
+        "JPEG": {"quality": 95, "optimize": True},
+        "AVIF": {"quality": 90, "speed": 4},
+    }),
+}
+
+_encode_seconds = metrics.histogram(
+    "image_encode_seconds", "이미지 인코딩 시간", ["format", "profile"]
+)
+_encoded_bytes = metrics.histogram(
+    "image_encoded_bytes", "인코딩된 이미지 크기", ["format", "profile"],
+    buckets=[2 ** exp for exp in range(12, 25)]
+)
+
+@functools.lru_cache(maxsize=None)
+def supports(fmt: str) -> bool:
+    """설치된 Pillow로 fmt 저장이 가능한지 (AVIF는 pillow-avif-plugin이 있으면 등록)"""
+    fmt = fmt.upper()
+    if fmt == "WEBP":
+        return features.check("webp")
+    if fmt == "AVIF":
+        try:
+            import pillow_avif  # noqa: F401
+        except ImportError:
+            pass
+    Image.init()
+    return fmt in Image.SAVE
+
+def resolve(profile: str = "final", output_format: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+    """
+    (포맷, 저장 옵션) 결정
+
+    output_format이 없으면 프로필의 기본 포맷을 쓰며, 지원하지 않는 포맷은 PNG로 대체합니다.
+
+    Raises:
+        ValueError: 알 수 없는 프로필
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"알 수 없는 인코딩 프로필입니다: {profile} (지원: {', '.join(PROFILES)})")
+    encoding = PROFILES[profile]
+    fmt = (output_format or encoding.format).upper()
+    if not supports(fmt):
+        logger.debug(f"{fmt} 인코딩을 지원하지 않아 PNG로 저장합니다.")
+        fmt = "PNG"
+    return fmt, dict(encoding.options.get(fmt, {}))
+
+def encode_image(
+    image: Image.Image,
+    profile: str = "final",
+    output_format: Optional[str] = None,
+    **options: Any
+) -> Tuple[bytes, str]:
+    """
+    이미지를 프로필에 맞춰 인코딩해 (바이트, 포맷) 반환 (options는 프로필 옵션을 덮어씀)
+
+    Raises:
+        ValueError: 알 수 없는 프로필이거나 저장 결과가 비어 있는 경우
+    """
+    fmt, save_options = resolve(profile, output_format)
+    save_options.update(options)
+    if fmt in RGB_ONLY_FORMATS and image.mode != "RGB":
+        image = image.convert("RGB")
+
+    start = time.perf_counter()
+    with span("encode"):
+        buffer = io.BytesIO()
+        image.save(buffer, format=fmt, **save_options)
+    elapsed = time.perf_counter() - start
+
+    data = buffer.getvalue()
+    if not data:
+        raise ValueError("이미지를 버퍼에 저장하지 못했습니다.")
+    _encode_seconds.observe(elapsed, format=fmt, profile=profile)
+    _encoded_bytes.observe(len(data), format=fmt, profile=profile)
+    return data, fmt
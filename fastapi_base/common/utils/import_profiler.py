@@ -0,0 +1,66 @@
+"""
+import 시간 프로파일러
+
+라우터/서브시스템 import에 걸린 시간과 그 과정에서 올라온 무거운 패키지를 기록합니다.
+
+    python -m common.utils.import_profiler   # main 앱 import 프로파일 출력
+"""
+import sys
+import json
+import time
+import logging
+from contextlib import contextmanager
+from typing import Dict, Any, List
+
+logger = logging.getLogger(__name__)
+
+# 기동 시간에 큰 영향을 주는 패키지
+HEAVY_MODULES = [
+    "torch", "diffusers", "transformers", "accelerate",
+    "rembg", "onnxruntime", "cv2", "openai", "httpx", "numpy", "PIL",
+]
+
+class ImportProfiler:
+    """import 구간별 소요 시간 기록기"""
+
+    def __init__(self):
+        self.entries: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def profile(self, name: str):
+        before = set(sys.modules)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            loaded = set(sys.modules) - before
+            self.entries.append({
+                "name": name,
+                "seconds": round(elapsed, 4),
+                "new_modules": len(loaded),
+                "heavy_modules": [m for m in HEAVY_MODULES if m in loaded],
+            })
+
+    def report(self) -> Dict[str, Any]:
+        """구간별 기록 + 현재 프로세스에 로드된 무거운 패키지"""
+        return {
+            "total_seconds": round(sum(e["seconds"] for e in self.entries), 4),
+            "entries": self.entries,
+            "loaded_heavy_modules": [m for m in HEAVY_MODULES if m in sys.modules],
+        }
+
+    def log_report(self) -> None:
+        for entry in self.entries:
+            logger.info(
+                f"[import] {entry['name']}: {entry['seconds']:.3f}s "
+                f"(+{entry['new_modules']} modules, heavy={entry['heavy_modules']})"
+            )
+
+# 전역 인스턴스
+import_profiler = ImportProfiler()
+
+if __name__ == "__main__":
+    with import_profiler.profile("main"):
+        import main  # noqa: F401
+    print(json.dumps(import_profiler.report(), ensure_ascii=False, indent=2))
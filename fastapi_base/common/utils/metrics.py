@@ -0,0 +1,375 @@
+"""
+Prometheus 텍스트 포맷 메트릭 (외부 라이브러리/서비스 없이 동작)
+
+    from common.utils.metrics import metrics
+    requests = metrics.counter("my_requests_total", "설명", ["route"])
+    requests.inc(route="/a")
+
+스크레이프 시점에 계산하는 값(메모리, 큐 길이, 캐시 통계 등)은 register_collector로 등록합니다.
+"""
+import os
+import sys
+import time
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from common.utils.histogram import Histogram
+from common.utils.tracing import route_path
+
+# (suffix, labels, value)
+Sample = Tuple[str, Dict[str, str], float]
+
+class _Metric:
+    type_name = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def samples(self) -> List[Sample]:
+        raise NotImplementedError
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, value: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            return [("", self._labels(key), value) for key, value in self._values.items()]
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, value: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+
+    def dec(self, value: float = 1.0, **labels) -> None:
+        self.inc(-value, **labels)
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            return [("", self._labels(key), value) for key, value in self._values.items()]
+
+class HistogramMetric(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, *args, buckets: Optional[List[float]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = buckets
+        self._histograms: Dict[Tuple[str, ...], Histogram] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            if key not in self._histograms:
+                self._histograms[key] = Histogram(self.buckets)
+            histogram = self._histograms[key]
+        histogram.observe(value)
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            items = list(self._histograms.items())
+        result = []
+        for key, histogram in items:
+            result.extend(histogram_samples(histogram, self._labels(key)))
+        return result
+
+def histogram_samples(histogram: Histogram, labels: Dict[str, str]) -> List[Sample]:
+    """Histogram → _bucket/_sum/_count 샘플"""
+    samples = []
+    bounds = [_format_value(b) for b in histogram.buckets] + ["+Inf"]
+    for bound, count in zip(bounds, histogram.cumulative_counts()):
+        samples.append(("_bucket", {**labels, "le": bound}, count))
+    samples.append(("_sum", labels, histogram.sum))
+    samples.append(("_count", labels, histogram.count))
+    return samples
+
+# 누적 값이라 counter로 노출하는 캐시 통계 (나머지는 gauge)
+CACHE_COUNTER_STATS = ("hits", "misses", "evictions", "expirations", "shadow_hits", "disk_hits", "disk_evictions")
+
+# 수집기: [(name, type, help, samples)]
+Family = Tuple[str, str, str, List[Sample]]
+Collector = Callable[[], Iterable[Family]]
+
+class MetricsRegistry:
+    """메트릭 및 스크레이프 시점 수집기 레지스트리"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Collector] = []
+        self._caches: Dict[str, Callable[[], Dict[str, float]]] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, help_text: str, labelnames: Iterable[str], **kwargs) -> Any:
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = cls(name, help_text, labelnames, **kwargs)
+            return self._metrics[name]
+
+    def counter(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Iterable[str] = (),
+        buckets: Optional[List[float]] = None
+    ) -> HistogramMetric:
+        return self._get_or_create(HistogramMetric, name, help_text, labelnames, buckets=buckets)
+
+    def register_collector(self, collector: Collector) -> None:
+        with self._lock:
+            self._collectors.append(collector)
+
+    def register_cache(self, name: str, stats: Callable[[], Dict[str, float]]) -> None:
+        """캐시 통계 등록 (stats()는 hits/misses/entries/bytes 등 숫자 dict 반환)"""
+        with self._lock:
+            self._caches[name] = stats
+
+    def _cache_families(self) -> List[Family]:
+        with self._lock:
+            caches = list(self._caches.items())
+        families: Dict[str, List[Sample]] = {}
+        for cache_name, stats in caches:
+            try:
+                values = stats()
+            except Exception:
+                continue
+            for stat, value in values.items():
+                families.setdefault(stat, []).append(("", {"cache": cache_name}, value))
+        return [
+            (f"cache_{stat}_total", "counter", f"캐시 {stat} 누적 횟수", samples)
+            if stat in CACHE_COUNTER_STATS else
+            (f"cache_{stat}", "gauge", f"캐시 {stat}", samples)
+            for stat, samples in families.items()
+        ]
+
+    def collect(self) -> List[Family]:
+        """모든 메트릭 패밀리 수집"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+
+        families = [(m.name, m.type_name, m.help, m.samples()) for m in metrics]
+        for collector in collectors:
+            try:
+                families.extend(collector())
+            except Exception:
+                continue
+        families.extend(self._cache_families())
+        return families
+
+# 전역 인스턴스
+metrics = MetricsRegistry()
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value)) if abs(value) < 1e15 else repr(float(value))
+    return repr(float(value))
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def render(families: Iterable[Family]) -> str:
+    """메트릭 패밀리 → Prometheus 텍스트 포맷 (같은 이름은 하나로 병합)"""
+    merged: Dict[str, Family] = {}
+    for name, type_name, help_text, samples in families:
+        if name in merged:
+            merged[name][3].extend(samples)
+        else:
+            merged[name] = (name, type_name, help_text, list(samples))
+
+    lines = []
+    for name, type_name, help_text, samples in merged.values():
+        lines.append(f"# HELP {name} {_escape(help_text)}")
+        lines.append(f"# TYPE {name} {type_name}")
+        for suffix, labels, value in samples:
+            label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            label_text = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{name}{suffix}{label_text} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+def with_labels(families: Iterable[Family], **extra: str) -> List[Family]:
+    """모든 샘플에 고정 라벨 추가 (예: worker)"""
+    return [
+        (name, type_name, help_text, [(suffix, {**labels, **extra}, value) for suffix, labels, value in samples])
+        for name, type_name, help_text, samples in families
+    ]
+
+# ---------------------------------------------------------------- 공통 수집 값
+
+def process_memory() -> Dict[str, Any]:
+    """현재 프로세스 RSS 및 (torch가 이미 로드된 경우) GPU 메모리"""
+    snapshot: Dict[str, Any] = {"rss_bytes": _rss_bytes(), "gpu": {}}
+
+    # torch를 새로 import하지 않음 (텍스트 전용 워커 보호)
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        for device in range(torch.cuda.device_count()):
+            snapshot["gpu"][str(device)] = {
+                "allocated_bytes": torch.cuda.memory_allocated(device),
+                "reserved_bytes": torch.cuda.memory_reserved(device),
+            }
+    return snapshot
+
+def _rss_bytes() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def memory_families(snapshot: Dict[str, Any], **labels: str) -> List[Family]:
+    families: List[Family] = [
+        ("process_resident_memory_bytes", "gauge", "프로세스 RSS", [("", labels, snapshot["rss_bytes"])]),
+    ]
+    gpu_allocated, gpu_reserved = [], []
+    for device, values in snapshot.get("gpu", {}).items():
+        gpu_allocated.append(("", {**labels, "device": device}, values["allocated_bytes"]))
+        gpu_reserved.append(("", {**labels, "device": device}, values["reserved_bytes"]))
+    if gpu_allocated:
+        families.append(("gpu_memory_allocated_bytes", "gauge", "torch 할당 GPU 메모리", gpu_allocated))
+        families.append(("gpu_memory_reserved_bytes", "gauge", "torch 예약 GPU 메모리", gpu_reserved))
+
+    model_samples = [
+        ("", {**labels, "pipeline": name}, value)
+        for name, value in snapshot.get("models", {}).items()
+    ]
+    if model_samples:
+        families.append(("model_parameter_bytes", "gauge", "로드된 파이프라인 파라미터 메모리", model_samples))
+    return families
+
+# ---------------------------------------------------------------- OpenAI
+
+_openai_duration = metrics.histogram(
+    "openai_request_duration_seconds", "OpenAI API 호출 지연 시간", ["service", "model"]
+)
+_openai_requests = metrics.counter(
+    "openai_requests_total", "OpenAI API 호출 수", ["service", "model", "status"]
+)
+_openai_tokens = metrics.counter(
+    "openai_tokens_total", "OpenAI 토큰 사용량", ["service", "model", "kind"]
+)
+_openai_ttft = metrics.histogram(
+    "openai_time_to_first_token_seconds", "OpenAI 스트리밍 첫 토큰까지의 시간", ["service", "model"]
+)
+
+def record_openai_call(
+    service: str,
+    model: str,
+    seconds: float,
+    usage: Any = None,
+    status: str = "ok"
+) -> None:
+    """OpenAI 호출 1회 기록 (usage: 응답의 usage 객체)"""
+    _openai_duration.observe(seconds, service=service, model=model)
+    _openai_requests.inc(service=service, model=model, status=status)
+    if usage is not None:
+        _openai_tokens.inc(getattr(usage, "prompt_tokens", 0) or 0, service=service, model=model, kind="prompt")
+        _openai_tokens.inc(getattr(usage, "completion_tokens", 0) or 0, service=service, model=model, kind="completion")
+
+class openai_call_timer:
+    """
+    OpenAI 호출 시간/상태/토큰 기록용 컨텍스트 매니저
+
+        with openai_call_timer("textGen", model) as call:
+            response = await client.chat.completions.create(...)
+            call.usage = response.usage
+
+    스트리밍 호출은 첫 청크 수신 시 call.first_token()으로 첫 토큰 지연을 기록합니다.
+    """
+
+    def __init__(self, service: str, model: str):
+        self.service = service
+        self.model = model
+        self.usage = None
+        self._first_token_seen = False
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def first_token(self) -> None:
+        if not self._first_token_seen:
+            self._first_token_seen = True
+            _openai_ttft.observe(time.perf_counter() - self._start, service=self.service, model=self.model)
+
+    def __exit__(self, exc_type, exc, tb):
+        status = "ok" if exc_type is None else type(exc).__name__
+        record_openai_call(self.service, self.model, time.perf_counter() - self._start, self.usage, status)
+        return False
+
+# ---------------------------------------------------------------- HTTP
+
+_http_requests = metrics.counter(
+    "http_requests_total", "HTTP 요청 수", ["route", "method", "status"]
+)
+_http_duration = metrics.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간", ["route", "method"]
+)
+_http_in_flight = metrics.gauge(
+    "http_requests_in_flight", "처리 중인 HTTP 요청 수", ["method"]
+)
+
+class MetricsMiddleware:
+    """라우트별 요청 수/처리 시간 및 처리 중 요청 수를 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "")
+        status = {"code": 500}
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        _http_in_flight.inc(method=method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            _http_in_flight.dec(method=method)
+            route = route_path(scope)
+            _http_requests.inc(route=route, method=method, status=str(status["code"]))
+            _http_duration.observe(time.perf_counter() - start, route=route, method=method)
@@ -0,0 +1,64 @@
+import time
+import asyncio
+from typing import Optional
+
+class TokenBucket:
+    """분당 예산을 초당 비율로 채우는 토큰 버킷 (용량 = 분당 예산)"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.available = float(per_minute)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """amount만큼 쓸 수 있을 때까지 남은 시간 (초)"""
+        self._refill()
+        # 한 번에 용량보다 큰 요청은 가득 찬 버킷으로 처리
+        amount = min(amount, self.capacity)
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) / self.rate
+
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self.available -= min(amount, self.capacity)
+
+class RateLimiter:
+    """
+    요청 수/토큰 수 분당 예산 (RPM/TPM)
+
+    acquire()는 두 예산이 모두 남을 때까지 기다린 뒤 차감합니다. (예산이 None이면 제한 없음)
+    """
+
+    def __init__(self, requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self, requests: int = 1, tokens: int = 0) -> float:
+        """예산 확보까지 대기하고 대기한 시간(초)을 반환"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        waited = 0.0
+        # 먼저 온 호출부터 순서대로 예산을 받음
+        async with self._lock:
+            while True:
+                delay = max(
+                    self.requests.wait_time(requests) if self.requests else 0.0,
+                    self.tokens.wait_time(tokens) if self.tokens else 0.0
+                )
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+                waited += delay
+            if self.requests:
+                self.requests.consume(requests)
+            if self.tokens:
+                self.tokens.consume(tokens)
+        return waited
@@ -0,0 +1,49 @@
+from multiprocessing import shared_memory, resource_tracker
+from typing import Dict, Any
+from PIL import Image
+
+
+def put_image(image: Image.Image) -> Dict[str, Any]:
+    """
+    PIL 이미지를 공유 메모리 블록에 기록하고 디스크립터를 반환합니다.
+
+    블록의 소유권은 디스크립터를 받은 쪽으로 넘어가며, 수신 측에서
+    get_image()로 읽은 뒤 블록을 해제합니다.
+    """
+    data = image.tobytes()
+    shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+    try:
+        shm.buf[:len(data)] = data
+        descriptor = {
+            "shm_name": shm.name,
+            "mode": image.mode,
+            "size": image.size,
+            "nbytes": len(data),
+        }
+    finally:
+        shm.close()
+
+    # 해제는 수신 측 책임이므로 생성 측 resource_tracker에서 제외
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return descriptor
+
+
+def get_image(descriptor: Dict[str, Any]) -> Image.Image:
+    """디스크립터가 가리키는 공유 메모리 블록에서 이미지를 복사하고 블록을 해제합니다."""
+    shm = shared_memory.SharedMemory(name=descriptor["shm_name"])
+    try:
+        data = bytes(shm.buf[:descriptor["nbytes"]])
+    finally:
+        shm.close()
+        shm.unlink()
+    return Image.frombytes(descriptor["mode"], tuple(descriptor["size"]), data)
+
+
+def release_image(descriptor: Dict[str, Any]) -> None:
+    """읽지 않고 버리는 블록 해제 (에러 경로용)"""
+    try:
+        shm = shared_memory.SharedMemory(name=descriptor["shm_name"])
+        shm.close()
+        shm.unlink()
+    except FileNotFoundError:
+        pass
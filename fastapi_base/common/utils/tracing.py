@@ -0,0 +1,162 @@
+"""
+요청 단위 경량 트레이싱
+
+요청마다 Trace를 contextvar에 두고, 각 단계에서 span(name)으로 구간을 기록합니다.
+(asyncio.to_thread로 넘긴 작업도 컨텍스트가 복사되어 같은 Trace에 기록됨)
+응답에는 Server-Timing 헤더로 단계별 합계가 붙고, 엔드포인트별 히스토그램에 누적됩니다.
+"""
+import time
+import asyncio
+import functools
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional, Tuple
+from starlette.datastructures import MutableHeaders
+
+from common.utils.histogram import Histogram
+
+_current_trace: ContextVar[Optional["Trace"]] = ContextVar("current_trace", default=None)
+
+class Trace:
+    """한 요청의 span 기록"""
+
+    def __init__(self):
+        self.spans: List[Tuple[str, float]] = []
+        self._lock = threading.Lock()
+
+    def add(self, name: str, duration: float) -> None:
+        with self._lock:
+            self.spans.append((name, duration))
+
+    def totals(self) -> Dict[str, float]:
+        """단계 이름별 합계 (첫 등장 순서 유지)"""
+        with self._lock:
+            totals: Dict[str, float] = {}
+            for name, duration in self.spans:
+                totals[name] = totals.get(name, 0.0) + duration
+            return totals
+
+    def server_timing(self, total: float) -> str:
+        parts = [f"{name};dur={duration * 1000:.1f}" for name, duration in self.totals().items()]
+        parts.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(parts)
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+@contextmanager
+def span(name: str):
+    """현재 요청의 Trace에 구간 기록 (Trace가 없으면 아무 것도 하지 않음)"""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, time.perf_counter() - start)
+
+def traced(name: str):
+    """함수 전체를 span으로 기록하는 데코레이터 (sync/async 모두 지원)"""
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def record_spans(totals: Dict[str, float]) -> None:
+    """다른 프로세스(추론 프로세스)에서 측정한 구간을 현재 Trace에 합칩니다."""
+    trace = _current_trace.get()
+    if trace is None:
+        return
+    for name, duration in totals.items():
+        trace.add(name, duration)
+
+@contextmanager
+def start_trace():
+    """새 Trace를 현재 컨텍스트에 설정 (미들웨어 밖에서 측정할 때 사용)"""
+    trace = Trace()
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+class StageHistograms:
+    """엔드포인트 × 단계별 지연 시간 히스토그램"""
+
+    def __init__(self):
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, endpoint: str, stage: str) -> Histogram:
+        key = (endpoint, stage)
+        with self._lock:
+            if key not in self._histograms:
+                self._histograms[key] = Histogram()
+            return self._histograms[key]
+
+    def observe(self, endpoint: str, totals: Dict[str, float], total: float) -> None:
+        for stage, duration in totals.items():
+            self.histogram(endpoint, stage).observe(duration)
+        self.histogram(endpoint, "total").observe(total)
+
+    def items(self) -> List[Tuple[Tuple[str, str], Histogram]]:
+        with self._lock:
+            return list(self._histograms.items())
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        result: Dict[str, Dict[str, Any]] = {}
+        for (endpoint, stage), histogram in self.items():
+            result.setdefault(endpoint, {})[stage] = histogram.summary()
+        return result
+
+# 전역 인스턴스
+stage_histograms = StageHistograms()
+
+def route_path(scope: Dict[str, Any]) -> str:
+    """라우트 템플릿 경로 (매칭되지 않은 요청은 하나로 묶어 카디널리티 제한)"""
+    route = scope.get("route")
+    if route is not None and getattr(route, "path", None):
+        return route.path
+    if scope.get("endpoint") is not None:
+        return scope.get("path", "")
+    return "unmatched"
+
+class TracingMiddleware:
+    """요청마다 Trace를 열고 Server-Timing 헤더 및 단계별 히스토그램을 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace = Trace()
+        token = _current_trace.set(trace)
+        start = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", trace.server_timing(time.perf_counter() - start))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_trace.reset(token)
+            stage_histograms.observe(route_path(scope), trace.totals(), time.perf_counter() - start)
@@ -1,17 +1,33 @@
+import os
 import yaml
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from pathlib import Path
 
 class Settings:
     def __init__(self):
-        self.config = self.load_config()
+        # YAML은 첫 접근 시점에 파싱 (import 시점 비용 제거)
+        self._config: Optional[Dict[str, Any]] = None
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        if self._config is None:
+            self._config = self.load_config()
+        return self._config
     
     def load_config(self, path: str = "imageGen_BG/core/config.yaml") -> Dict[str, Any]:
-        config_path = Path(path)
-        if not config_path.exists():
-            config_path = "imageGen_BG/core/config.yaml"
+        # IMAGEGEN_BG_CONFIG로 다른 설정 파일 지정 가능 (예: 벤치마크용 초소형 모델)
+        override = os.getenv("IMAGEGEN_BG_CONFIG")
+        if override:
+            # 지정한 파일이 없을 때 기본 설정(실제 모델)으로 조용히 바뀌지 않도록 실패
+            config_path = Path(override)
+            if not config_path.exists():
+                raise FileNotFoundError(f"IMAGEGEN_BG_CONFIG 설정 파일을 찾을 수 없습니다: {config_path.resolve()}")
+        else:
+            config_path = Path(path)
+            if not config_path.exists():
+                config_path = "imageGen_BG/core/config.yaml"
         
         with open(config_path, "r", encoding="utf-8") as f:
             return yaml.safe_load(f)
 
-settings = Settings()
\ No newline at end of file
+settings = Settings()
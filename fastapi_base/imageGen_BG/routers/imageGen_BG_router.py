@@ -14,6 +14,7 @@ from ..service.inpaint_service import InpaintService
 from ..service.generate_service import GenerateService
 from ..service.smoothing_service import SmoothingService
 from ..utils.image_utils import ImageProcessor, validate_image
+from common.service.openai_scheduler import OpenAIUnavailableError
 
 router = APIRouter()
 
@@ -166,32 +167,35 @@ async def analyze_advertisement(
     product_image: UploadFile = File(...),
     product_type: str = Form("food"),
     marketing_type: str = Form("배경 제작"),
-    reference_image: Optional[UploadFile] = File(None)
+    reference_image: Optional[UploadFile] = File(None),
+    allow_cached: bool = Form(True)
 ):
     try:
-        from ..service.gpt_service import GPTService
-        service = GPTService()
+        from ..service.gpt_service import gpt_service as service
 
         # 1. 이미지 로드
         product_pil = await validate_image(product_image)
         print("[DEBUG] product_pil:", product_pil)  # 또는 logger.info
         ref_pil = await validate_image(reference_image) if reference_image else None
 
-        # 2. base64로 인코딩
+        # 2. base64로 인코딩 (분석 입력이므로 미리보기 프로필)
         processor = ImageProcessor()
-        product_b64 = processor.encode_to_base64(product_pil)
+        product_b64 = processor.encode_to_base64(product_pil, profile="preview")
         print("[DEBUG] product_b64:", product_b64[:100])
-        ref_b64 = processor.encode_to_base64(ref_pil) if ref_pil else None
+        ref_b64 = processor.encode_to_base64(ref_pil, profile="preview") if ref_pil else None
 
         # 3. GPT 서비스 호출
         result = await service.analyze_ad_plan(
             product_b64=product_b64,
             ref_b64=ref_b64,
             product_type=product_type,
-            marketing_type=marketing_type
+            marketing_type=marketing_type,
+            allow_cached=allow_cached
         )
 
         return result
 
+    except OpenAIUnavailableError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"광고 분석 중 오류 발생: {str(e)}")
\ No newline at end of file
@@ -3,6 +3,7 @@ from PIL import Image
 from typing import Tuple, Dict, Any
 
 from ..utils.image_utils import ImageProcessor
+from common.utils.tracing import span
 from ..schemas.response_schemas import BackgroundRemovalResponse, ProductPositionResponse
 
 class BackgroundService:
@@ -55,18 +56,19 @@ class BackgroundService:
         start_time = time.time()
         
         try:
-            # 캔버스 생성
-            canvas = self.image_processor.create_canvas(canvas_size)
-            
-            # 제품 크기 조정
-            new_size = tuple([int(dim * scale / 100) for dim in product_image.size])
-            resized_product = self.image_processor.resize_image(product_image, new_size)
-            
-            # 제품 배치
-            positioned_image = self.image_processor.overlay_product(canvas, resized_product, position)
-            
-            # 마스크 생성
-            mask = self.image_processor.create_mask(positioned_image)
+            with span("compose"):
+                # 캔버스 생성
+                canvas = self.image_processor.create_canvas(canvas_size)
+                
+                # 제품 크기 조정
+                new_size = tuple([int(dim * scale / 100) for dim in product_image.size])
+                resized_product = self.image_processor.resize_image(product_image, new_size)
+                
+                # 제품 배치
+                positioned_image = self.image_processor.overlay_product(canvas, resized_product, position)
+                
+                # 마스크 생성
+                mask = self.image_processor.create_mask(positioned_image)
             
             # base64 인코딩
             positioned_b64 = self.image_processor.encode_to_base64(positioned_image)
@@ -2,13 +2,13 @@ import time
 from PIL import Image
 from typing import List, Tuple
 
-from .pipeline_service import PipelineService
+from .pipeline_service import get_pipeline_service
 from ..utils.image_utils import ImageProcessor
 from ..schemas.response_schemas import GenerateResponse
 
 class GenerateService:
     def __init__(self):
-        self.pipeline_service = PipelineService()
+        self.pipeline_service = get_pipeline_service()
         self.image_processor = ImageProcessor()
     
     async def generate_background(
@@ -25,13 +25,14 @@ class GenerateService:
         
         try:
             # Text2Image 파이프라인 로드
-            pipe = await self.pipeline_service.get_text2img_pipeline(category)
+            pipe = await self.pipeline_service.get_text2img_pipeline()
             
             # 배경 생성
             generated_images = await self.pipeline_service.generate_background(
                 pipe=pipe,
                 prompt=prompt,
                 canvas_size=canvas_size,
+                category=category,
                 inference_steps=inference_steps,
                 guidance_scale=guidance_scale,
                 num_images=num_images
@@ -1,30 +1,46 @@
-from typing import Optional
+from typing import Dict, Optional
 import os
-import httpx
-from openai import AsyncOpenAI, OpenAIError
+from openai import OpenAIError
 from ..core.config import settings
+from common.service.openai_pool import openai_pool
+from common.service.openai_scheduler import openai_scheduler, OpenAIUnavailableError
+from common.utils.metrics import metrics
+from ..utils.semantic_cache import SemanticCache
 import logging
 
 logger = logging.getLogger(__name__)
 
 class GPTService:
+    """광고 기획/프롬프트 변환 서비스 (OpenAI 연결은 앱 전역 풀 공유)"""
+
     def __init__(self):
-        transport = httpx.AsyncHTTPTransport(proxy=None)
+        self._caches: Dict[str, SemanticCache] = {}
+
+    def _cache(self, name: str) -> SemanticCache:
+        """유사 요청 캐시 (설정 파일은 첫 사용 시점에 읽음)"""
+        if name not in self._caches:
+            config = settings.config.get("semantic_cache") or {"mode": "off"}
+            self._caches[name] = SemanticCache.from_config(name, config)
+            metrics.register_cache(f"gpt_{name}", self._caches[name].stats)
+        return self._caches[name]
+
+    @property
+    def client(self):
+        return openai_pool.get_client(os.getenv(settings.config['openai']['api_key_env']))
 
-        self.client = AsyncOpenAI(
-            api_key=os.getenv(settings.config['openai']['api_key_env']),
-            http_client=httpx.AsyncClient(transport=transport)
-        )
-        self.model = settings.config['openai']['gpt_model']
+    @property
+    def model(self) -> str:
+        return settings.config['openai']['gpt_model']
 
     async def analyze_ad_plan(
         self,
         product_b64: str,
         ref_b64: Optional[str],
         product_type: str,
-        marketing_type: str
+        marketing_type: str,
+        allow_cached: bool = True
     ) -> str:
-        """광고 기획안 생성"""
+        """광고 기획안 생성 (allow_cached면 유사한 이전 요청의 기획안 재사용)"""
         try:
             messages = [
                 {
@@ -42,16 +58,28 @@ class GPTService:
                     )
                 }
             ]
+            cache = self._cache("ad_plan")
+            partition = f"{self.model}|{product_type}|{marketing_type}"
+            cached = cache.lookup(messages[1]["content"], partition, allow_reuse=allow_cached)
+            if cached is not None:
+                return cached
 
-            response = await self.client.chat.completions.create(
+            response = await openai_scheduler.create(
+                "imageGen_BG",
+                self.client,
                 model=self.model,
                 messages=messages,
                 temperature=0.7,
                 max_tokens=500,
             )
             content = response.choices[0].message.content
+            cache.add(messages[1]["content"], content, partition)
             return content
 
+        except OpenAIUnavailableError:
+            # 재시도 후에도 실패 → 503 + Retry-After
+            raise
+
         except OpenAIError as e:
             logger.error(f"OpenAI API 호출 실패: {e}")
             raise RuntimeError(f"OpenAI API 호출 실패: {e}")
@@ -60,8 +88,8 @@ class GPTService:
             logger.error(f"광고 기획 분석 중 오류 발생: {e}")
             raise RuntimeError(f"광고 기획 분석 중 오류 발생: {e}")
 
-    async def convert_to_sd_prompt(self, ad_description: str) -> str:
-        """광고 기획을 Stable Diffusion 프롬프트로 변환"""
+    async def convert_to_sd_prompt(self, ad_description: str, allow_cached: bool = True) -> str:
+        """광고 기획을 Stable Diffusion 프롬프트로 변환 (allow_cached면 유사한 기획의 변환 결과 재사용)"""
         try:
             messages = [
                 {
@@ -73,16 +101,27 @@ class GPTService:
                     "content": f"다음 광고 기획을 Stable Diffusion 프롬프트로 변환해 주세요:\n{ad_description}"
                 }
             ]
+            cache = self._cache("sd_prompt")
+            cached = cache.lookup(ad_description, self.model, allow_reuse=allow_cached)
+            if cached is not None:
+                return cached
 
-            response = await self.client.chat.completions.create(
+            response = await openai_scheduler.create(
+                "imageGen_BG",
+                self.client,
                 model=self.model,
                 messages=messages,
                 temperature=0.6,
                 max_tokens=200,
             )
             content = response.choices[0].message.content
+            cache.add(ad_description, content, self.model)
             return content
 
+        except OpenAIUnavailableError:
+            # 재시도 후에도 실패 → 503 + Retry-After
+            raise
+
         except OpenAIError as e:
             logger.error(f"OpenAI API 호출 실패: {e}")
             raise RuntimeError(f"OpenAI API 호출 실패: {e}")
@@ -90,3 +129,6 @@ class GPTService:
         except Exception as e:
             logger.error(f"SD 프롬프트 변환 중 오류 발생: {e}")
             raise RuntimeError(f"SD 프롬프트 변환 중 오류 발생: {e}")
+
+# 전역 인스턴스
+gpt_service = GPTService()
@@ -2,13 +2,13 @@ import time
 from PIL import Image
 from typing import List
 
-from .pipeline_service import PipelineService
+from .pipeline_service import get_pipeline_service
 from ..utils.image_utils import ImageProcessor
 from ..schemas.response_schemas import InpaintResponse
 
 class InpaintService:
     def __init__(self):
-        self.pipeline_service = PipelineService()
+        self.pipeline_service = get_pipeline_service()
         self.image_processor = ImageProcessor()
     
     async def run_inpainting(
@@ -26,7 +26,7 @@ class InpaintService:
         
         try:
             # Inpaint 파이프라인 로드
-            pipe = await self.pipeline_service.get_inpaint_pipeline(category)
+            pipe = await self.pipeline_service.get_inpaint_pipeline()
             
             # Inpainting 실행
             generated_images = await self.pipeline_service.run_inpainting(
@@ -34,6 +34,7 @@ class InpaintService:
                 image=canvas_image,
                 mask=mask_image,
                 prompt=prompt,
+                category=category,
                 inference_steps=inference_steps,
                 guidance_scale=guidance_scale,
                 num_images=num_images
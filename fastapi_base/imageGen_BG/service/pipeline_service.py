@@ -1,42 +1,386 @@
-from diffusers import AutoPipelineForText2Image, StableDiffusionInpaintPipeline
 from PIL import Image
-from typing import List, Dict, Any
-import torch
+from pathlib import Path
+from typing import List, Dict, Any, Tuple, Optional
+import asyncio
+import threading
+import logging
 
 from ..core.config import settings
+from common.core.config import serving_settings
+from common.service.readiness import readiness, WARMING, WARM, FAILED
+from common.utils.metrics import metrics
+from common.utils.tracing import span
+
+logger = logging.getLogger(__name__)
 
 class PipelineService:
+    """
+    SD 파이프라인 로드/실행 서비스.
+
+    파이프라인은 프로세스당 한 번만 로드되며, 카테고리별 LoRA 세트는
+    요청 시점에 어댑터 가중치만 전환합니다. 전환과 추론은 같은 GPU 잠금 구간에서
+    실행되므로 다른 카테고리 요청의 전환이 그 사이에 끼어들지 않습니다.
+    """
+
     def __init__(self):
-        self.config = settings.config
         self._inpaint_pipe = None
         self._text2img_pipe = None
         self._ip_adapter = None
-    
+        self._active_loras: Dict[int, Optional[str]] = {}
+        self._loaded_loras: Dict[int, set] = {}
+        self._model_bytes: Dict[str, int] = {}
+        self._lora_stats = {"hits": 0, "misses": 0}
+        self._load_lock = threading.Lock()
+        self._run_lock = threading.Lock()
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        return settings.config
+
+    # ---------------------------------------------------------------- 로드
+    # torch/diffusers는 모델을 실제로 로드하는 프로세스에서만 import
+    # (remote 모드의 HTTP 워커는 이 모듈을 import해도 torch를 올리지 않음)
+    def _device_and_dtype(self) -> Tuple[str, Any]:
+        import torch
+
+        sd_config = self.config["sd_pipeline"]
+        device = sd_config.get("device", "cuda")
+        if device == "cuda" and not torch.cuda.is_available():
+            logger.warning("CUDA를 사용할 수 없어 CPU로 실행합니다.")
+            return "cpu", torch.float32
+        return device, getattr(torch, sd_config.get("torch_dtype", "float16"))
+
+    def _pipeline_kwargs(self) -> Dict[str, Any]:
+        _, dtype = self._device_and_dtype()
+        kwargs = {"torch_dtype": dtype}
+        if not self.config["sd_pipeline"].get("use_safety_checker", False):
+            kwargs.update(safety_checker=None, requires_safety_checker=False)
+        return kwargs
+
+    def _load_inpaint_pipeline(self):
+        from diffusers import StableDiffusionInpaintPipeline
+
+        model_id = self.config["sd_pipeline"]["inpaint"]["model_id"]
+        logger.info(f"Inpaint 파이프라인 로드: {model_id}")
+        device, _ = self._device_and_dtype()
+        return StableDiffusionInpaintPipeline.from_pretrained(model_id, **self._pipeline_kwargs()).to(device)
+
+    def _load_text2img_pipeline(self):
+        from diffusers import AutoPipelineForText2Image
+
+        model_id = self.config["sd_pipeline"]["text2img"]["model_id"]
+        logger.info(f"Text2Image 파이프라인 로드: {model_id}")
+        device, _ = self._device_and_dtype()
+        return AutoPipelineForText2Image.from_pretrained(model_id, **self._pipeline_kwargs()).to(device)
+
+    def _load_ip_adapter(self):
+        """IP-Adapter가 적용된 Img2Img 파이프라인 로드 (스무딩 전용)"""
+        from diffusers import StableDiffusionImg2ImgPipeline
+        from transformers import CLIPVisionModelWithProjection
+
+        ip_config = self.config["ip_adapter"]
+        model_id = self.config["sd_pipeline"]["text2img"]["model_id"]
+        device, dtype = self._device_and_dtype()
+
+        if not self._ip_adapter_enabled():
+            # IP-Adapter 없이 Img2Img만 사용 (호환 가중치가 없는 모델, 벤치마크 등)
+            logger.info("IP-Adapter 비활성화: Img2Img 파이프라인만 로드")
+            return StableDiffusionImg2ImgPipeline.from_pretrained(model_id, **self._pipeline_kwargs()).to(device)
+
+        logger.info(f"IP-Adapter 로드: {ip_config['checkpoint']}")
+
+        image_encoder = CLIPVisionModelWithProjection.from_pretrained(
+            ip_config["image_encoder"], torch_dtype=dtype
+        )
+        pipe = StableDiffusionImg2ImgPipeline.from_pretrained(
+            model_id, image_encoder=image_encoder, **self._pipeline_kwargs()
+        )
+        pipe.load_ip_adapter(
+            ip_config.get("repo", "h94/IP-Adapter"),
+            subfolder=ip_config.get("subfolder", "models"),
+            weight_name=ip_config["checkpoint"]
+        )
+        return pipe.to(device)
+
+    def _ip_adapter_enabled(self) -> bool:
+        return self.config["ip_adapter"].get("enabled", True)
+
+    def _lora_dir(self) -> Path:
+        lora_dir = Path(self.config["paths"]["lora_dir"])
+        if not lora_dir.exists() and not lora_dir.is_absolute():
+            lora_dir = Path("static") / lora_dir
+        return lora_dir
+
+    def _apply_lora_set(self, pipe, category: str) -> None:
+        """카테고리에 해당하는 LoRA 세트로 어댑터 전환"""
+        if self._active_loras.get(id(pipe)) == category:
+            return
+
+        with span("lora_switch"):
+            loras = self.config["lora"]["category_map"].get(category)
+            if not loras:
+                if self._active_loras.get(id(pipe)):
+                    pipe.disable_lora()
+                self._active_loras[id(pipe)] = None
+                return
+
+            loaded = self._loaded_loras.setdefault(id(pipe), set())
+            for lora in loras:
+                if lora["name"] in loaded:
+                    self._lora_stats["hits"] += 1
+                else:
+                    self._lora_stats["misses"] += 1
+                    pipe.load_lora_weights(
+                        str(self._lora_dir()),
+                        weight_name=f"{lora['name']}.safetensors",
+                        adapter_name=lora["name"]
+                    )
+                    loaded.add(lora["name"])
+
+            pipe.enable_lora()
+            pipe.set_adapters(
+                [lora["name"] for lora in loras],
+                adapter_weights=[lora["scale"] for lora in loras]
+            )
+            self._active_loras[id(pipe)] = category
+            logger.info(f"LoRA 세트 전환: {category}")
+
+    def _loaders(self) -> Dict[str, Tuple[str, Any]]:
+        return {
+            "text2img": ("_text2img_pipe", self._load_text2img_pipeline),
+            "inpaint": ("_inpaint_pipe", self._load_inpaint_pipeline),
+            "ip_adapter": ("_ip_adapter", self._load_ip_adapter),
+        }
+
+    def _get_or_load(self, kind: str) -> Any:
+        attr, loader = self._loaders()[kind]
+        pipe = getattr(self, attr)
+        if pipe is None:
+            with self._load_lock:
+                pipe = getattr(self, attr)
+                if pipe is None:
+                    with readiness.track(f"sd_{kind}"), span("pipeline_load"):
+                        pipe = loader()
+                    self._model_bytes[kind] = _parameter_bytes(pipe)
+                    setattr(self, attr, pipe)
+        return pipe
+
+    def memory_report(self) -> Dict[str, int]:
+        """로드된 파이프라인별 파라미터 메모리 (bytes)"""
+        return dict(self._model_bytes)
+
+    def lora_cache_stats(self) -> Dict[str, float]:
+        """로드된 LoRA 어댑터 캐시 통계 (/metrics)"""
+        return {
+            **self._lora_stats,
+            "entries": sum(len(names) for names in self._loaded_loras.values()),
+        }
+
+    async def _run(self, fn, *args, **kwargs):
+        """GPU 작업은 스레드에서 직렬 실행 (이벤트 루프 블로킹 방지)"""
+        def locked():
+            with span("gpu_wait"):
+                self._run_lock.acquire()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._run_lock.release()
+        return await asyncio.to_thread(locked)
+
+    def _denoise_and_decode(self, pipe, **kwargs) -> List[Image.Image]:
+        """디노이징(잠재 공간)과 VAE 디코딩을 나눠 실행 (단계별 지연 측정)"""
+        import torch
+
+        def synchronize():
+            # CUDA 커널은 비동기로 실행되므로 구간 끝에서 기다려야 GPU 시간이 해당 단계에 기록됨
+            if pipe.device.type == "cuda":
+                torch.cuda.synchronize(pipe.device)
+
+        with span("denoise"):
+            latents = pipe(output_type="latent", **kwargs).images
+            synchronize()
+        with span("vae_decode"), torch.no_grad():
+            decoded = pipe.vae.decode(latents / pipe.vae.config.scaling_factor, return_dict=False)[0]
+            images = pipe.image_processor.postprocess(decoded, output_type="pil")
+            synchronize()
+        return images
+
+    def _denoise_with_lora(self, pipe, category: str, **kwargs) -> List[Image.Image]:
+        """카테고리 LoRA 전환 후 추론 (_run 안에서 호출되어 한 잠금 구간으로 실행)"""
+        self._apply_lora_set(pipe, category)
+        return self._denoise_and_decode(pipe, **kwargs)
+
+    # ---------------------------------------------------------------- 파이프라인 획득
+    # LoRA 세트는 실행 메서드에서 추론과 함께 전환 (여기서 전환하면 추론 전에 다른 요청이 바꿀 수 있음)
+    async def get_inpaint_pipeline(self):
+        """Inpaint 파이프라인 반환"""
+        return await asyncio.to_thread(self._get_or_load, "inpaint")
+
+    async def get_text2img_pipeline(self):
+        """Text2Image 파이프라인 반환"""
+        return await asyncio.to_thread(self._get_or_load, "text2img")
+
+    async def get_ip_adapter(self):
+        """IP-Adapter 파이프라인 반환"""
+        return await asyncio.to_thread(self._get_or_load, "ip_adapter")
+
+    def _tiny_inference(self, kind: str, pipe) -> None:
+        """64x64, 1 step 추론 (CUDA 커널/메모리 풀을 미리 초기화)"""
+        size = 64
+        blank = Image.new("RGB", (size, size))
+        if kind == "text2img":
+            pipe(prompt="warmup", width=size, height=size, num_inference_steps=1)
+        elif kind == "inpaint":
+            pipe(
+                prompt="warmup", image=blank, mask_image=Image.new("L", (size, size), 255),
+                width=size, height=size, num_inference_steps=1
+            )
+        elif kind == "ip_adapter":
+            kwargs = {}
+            if self._ip_adapter_enabled():
+                pipe.set_ip_adapter_scale(0.5)
+                kwargs["ip_adapter_image"] = blank
+            pipe(prompt="warmup", image=blank, strength=1.0, num_inference_steps=1, **kwargs)
+
+    async def warmup(self, kinds: List[str]) -> None:
+        """
+        파이프라인 로드 + 초소형 추론 1회 + 카테고리별 LoRA 세트 로드.
+
+        완료된 서브시스템은 readiness에 warm으로 기록됩니다.
+        """
+        for kind in kinds:
+            name = f"sd_{kind}"
+            try:
+                pipe = await asyncio.to_thread(self._get_or_load, kind)
+                readiness.set_state(name, WARMING, progress=0.5, message="warm-up 추론 중")
+                await self._run(self._tiny_inference, kind, pipe)
+                readiness.set_state(name, WARM)
+            except Exception as e:
+                logger.error(f"파이프라인 워밍업 실패 ({kind}): {e}")
+                readiness.set_state(name, FAILED, message=str(e))
+
+        pipes = [getattr(self, self._loaders()[kind][0]) for kind in kinds]
+        pipes = [pipe for pipe in pipes if pipe is not None]
+        categories = list(self.config["lora"]["category_map"])
+        readiness.set_state("lora_sets", WARMING, progress=0.0)
+        try:
+            for i, category in enumerate(categories, start=1):
+                for pipe in pipes:
+                    await self._run(self._apply_lora_set, pipe, category)
+                readiness.set_progress("lora_sets", i / len(categories))
+            readiness.set_state("lora_sets", WARM)
+        except Exception as e:
+            logger.error(f"LoRA 세트 워밍업 실패: {e}")
+            readiness.set_state("lora_sets", FAILED, message=str(e))
+
+    # ---------------------------------------------------------------- 실행
+    def _negative_prompt(self) -> str:
+        return self.config.get("generation", {}).get("negative_prompt", "")
+
     async def run_inpainting(
         self,
+        pipe,
         image: Image.Image,
         mask: Image.Image,
         prompt: str,
-        config: Dict[str, Any]
+        category: str = "cosmetics",
+        inference_steps: int = 35,
+        guidance_scale: float = 7.0,
+        num_images: int = 2
     ) -> List[Image.Image]:
-        """Inpainting 파이프라인 실행"""
-        if not self._inpaint_pipe:
-            self._inpaint_pipe = self._load_inpaint_pipeline()
-        
-        # 기존 run_inpainting 로직 적용
-        pass
-    
-    async def generate_with_ip_adapter(
+        """카테고리 LoRA를 적용해 Inpainting 파이프라인 실행"""
+        width, height = image.size
+        return await self._run(
+            self._denoise_with_lora,
+            pipe,
+            category,
+            prompt=prompt,
+            negative_prompt=self._negative_prompt(),
+            image=image.convert("RGB"),
+            mask_image=mask.convert("L"),
+            width=width - width % 8,
+            height=height - height % 8,
+            num_inference_steps=inference_steps,
+            guidance_scale=guidance_scale,
+            num_images_per_prompt=num_images
+        )
+
+    async def generate_background(
         self,
-        product_image: Image.Image,
+        pipe,
         prompt: str,
-        config: Dict[str, Any]
+        canvas_size: Tuple[int, int] = (512, 512),
+        category: str = "cosmetics",
+        inference_steps: int = 35,
+        guidance_scale: float = 7.0,
+        num_images: int = 2
     ) -> List[Image.Image]:
-        """IP-Adapter를 통한 이미지 생성"""
-        if not self._text2img_pipe:
-            self._text2img_pipe = self._load_text2img_pipeline()
-        if not self._ip_adapter:
-            self._ip_adapter = self._load_ip_adapter()
-        
-        # 배경 생성 후 IP-Adapter 합성 로직
-        pass
\ No newline at end of file
+        """카테고리 LoRA를 적용해 Text2Image 파이프라인 실행"""
+        width, height = canvas_size
+        return await self._run(
+            self._denoise_with_lora,
+            pipe,
+            category,
+            prompt=prompt,
+            negative_prompt=self._negative_prompt(),
+            width=width - width % 8,
+            height=height - height % 8,
+            num_inference_steps=inference_steps,
+            guidance_scale=guidance_scale,
+            num_images_per_prompt=num_images
+        )
+
+    async def apply_ip_adapter(
+        self,
+        ip_adapter,
+        background_image: Image.Image,
+        product_image: Image.Image,
+        prompt: str,
+        category: str = "cosmetics",
+        scale: float = 0.7,
+        inference_steps: int = 35,
+        guidance_scale: float = 7.0
+    ) -> Image.Image:
+        """IP-Adapter로 제품 특징을 유지하며 배경과 자연스럽게 합성 (카테고리 LoRA 적용)"""
+        def run():
+            kwargs = {}
+            if self._ip_adapter_enabled():
+                ip_adapter.set_ip_adapter_scale(scale)
+                kwargs["ip_adapter_image"] = product_image.convert("RGB")
+            return self._denoise_with_lora(
+                ip_adapter,
+                category,
+                prompt=prompt,
+                negative_prompt=self._negative_prompt(),
+                image=background_image.convert("RGB"),
+                strength=self.config.get("generation", {}).get("smoothing_strength", 0.4),
+                num_inference_steps=inference_steps,
+                guidance_scale=guidance_scale,
+                **kwargs
+            )
+
+        images = await self._run(run)
+        return images[0]
+
+
+def _parameter_bytes(pipe) -> int:
+    """파이프라인 구성 모듈(UNet, VAE, 텍스트/이미지 인코더 등)의 파라미터 크기 합계"""
+    import torch
+
+    total = 0
+    for component in pipe.components.values():
+        if isinstance(component, torch.nn.Module):
+            total += sum(p.numel() * p.element_size() for p in component.parameters())
+    return total
+
+# 전역 인스턴스 (모델 가중치는 프로세스당 한 번만 로드)
+pipeline_service = PipelineService()
+metrics.register_cache("lora_adapters", pipeline_service.lora_cache_stats)
+
+
+def get_pipeline_service():
+    """서빙 모드에 맞는 파이프라인 서비스 반환 (remote: 추론 프로세스 위임)"""
+    if serving_settings.inference_mode == "remote":
+        from .remote_pipeline_service import remote_pipeline_service
+        return remote_pipeline_service
+    return pipeline_service
@@ -0,0 +1,178 @@
+from PIL import Image
+from typing import Any, Dict, List, NamedTuple, Tuple
+import logging
+
+from common.service.inference_ipc import InferenceClient, inference_client
+
+logger = logging.getLogger(__name__)
+
+class PipelineHandle(NamedTuple):
+    """추론 프로세스에 있는 파이프라인을 가리키는 핸들"""
+    kind: str
+
+class RemotePipelineService:
+    """
+    PipelineService와 같은 인터페이스로 추론 프로세스에 작업을 위임합니다.
+
+    HTTP 워커는 모델을 로드하지 않으며, 이미지는 공유 메모리로 전달됩니다.
+    """
+
+    def __init__(self, client: InferenceClient):
+        self.client = client
+
+    async def get_inpaint_pipeline(self) -> PipelineHandle:
+        return PipelineHandle("inpaint")
+
+    async def get_text2img_pipeline(self) -> PipelineHandle:
+        return PipelineHandle("text2img")
+
+    async def get_ip_adapter(self) -> PipelineHandle:
+        return PipelineHandle("ip_adapter")
+
+    async def run_inpainting(
+        self,
+        pipe: PipelineHandle,
+        image: Image.Image,
+        mask: Image.Image,
+        prompt: str,
+        category: str = "cosmetics",
+        inference_steps: int = 35,
+        guidance_scale: float = 7.0,
+        num_images: int = 2
+    ) -> List[Image.Image]:
+        _, images = await self.client.submit(
+            "inpaint",
+            params={
+                "category": category,
+                "prompt": prompt,
+                "inference_steps": inference_steps,
+                "guidance_scale": guidance_scale,
+                "num_images": num_images,
+            },
+            images={"image": image, "mask": mask}
+        )
+        return images
+
+    async def generate_background(
+        self,
+        pipe: PipelineHandle,
+        prompt: str,
+        canvas_size: Tuple[int, int] = (512, 512),
+        category: str = "cosmetics",
+        inference_steps: int = 35,
+        guidance_scale: float = 7.0,
+        num_images: int = 2
+    ) -> List[Image.Image]:
+        _, images = await self.client.submit(
+            "text2img",
+            params={
+                "category": category,
+                "prompt": prompt,
+                "canvas_size": list(canvas_size),
+                "inference_steps": inference_steps,
+                "guidance_scale": guidance_scale,
+                "num_images": num_images,
+            }
+        )
+        return images
+
+    async def apply_ip_adapter(
+        self,
+        ip_adapter: PipelineHandle,
+        background_image: Image.Image,
+        product_image: Image.Image,
+        prompt: str,
+        category: str = "cosmetics",
+        scale: float = 0.7,
+        inference_steps: int = 35,
+        guidance_scale: float = 7.0
+    ) -> Image.Image:
+        _, images = await self.client.submit(
+            "ip_adapter",
+            params={
+                "category": category,
+                "prompt": prompt,
+                "scale": scale,
+                "inference_steps": inference_steps,
+                "guidance_scale": guidance_scale,
+            },
+            images={"background_image": background_image, "product_image": product_image}
+        )
+        return images[0]
+
+
+async def handle_inference_request(
+    op: str,
+    params: Dict[str, Any],
+    images: Dict[str, Image.Image]
+) -> Tuple[Dict[str, Any], List[Image.Image]]:
+    """추론 프로세스 측 핸들러: 요청을 로컬 PipelineService로 실행"""
+    from .pipeline_service import pipeline_service
+
+    category = params["category"]
+
+    if op == "inpaint":
+        pipe = await pipeline_service.get_inpaint_pipeline()
+        outputs = await pipeline_service.run_inpainting(
+            pipe=pipe,
+            image=images["image"],
+            mask=images["mask"],
+            prompt=params["prompt"],
+            category=category,
+            inference_steps=params["inference_steps"],
+            guidance_scale=params["guidance_scale"],
+            num_images=params["num_images"]
+        )
+    elif op == "text2img":
+        pipe = await pipeline_service.get_text2img_pipeline()
+        outputs = await pipeline_service.generate_background(
+            pipe=pipe,
+            prompt=params["prompt"],
+            canvas_size=tuple(params["canvas_size"]),
+            category=category,
+            inference_steps=params["inference_steps"],
+            guidance_scale=params["guidance_scale"],
+            num_images=params["num_images"]
+        )
+    elif op == "ip_adapter":
+        ip_adapter = await pipeline_service.get_ip_adapter()
+        outputs = [await pipeline_service.apply_ip_adapter(
+            ip_adapter=ip_adapter,
+            background_image=images["background_image"],
+            product_image=images["product_image"],
+            prompt=params["prompt"],
+            category=category,
+            scale=params["scale"],
+            inference_steps=params["inference_steps"],
+            guidance_scale=params["guidance_scale"]
+        )]
+    else:
+        raise ValueError(f"지원하지 않는 추론 작업입니다: {op}")
+
+    return {}, outputs
+
+
+def run_inference_process(address: str, authkey: str) -> None:
+    """추론 프로세스 엔트리포인트 (serve.py에서 spawn)"""
+    from common.core.config import serving_settings
+    from common.service.inference_ipc import InferenceServer
+    from common.service.metrics_service import collect_local
+    from common.service.readiness import readiness
+    from .pipeline_service import pipeline_service
+
+    async def warmup():
+        await pipeline_service.warmup(serving_settings.warmup_pipelines)
+
+    logging.basicConfig(level=logging.INFO)
+    InferenceServer(
+        handle_inference_request,
+        address=address,
+        authkey=authkey,
+        warmup=None if serving_settings.startup_mode == "lazy" else warmup,
+        status=readiness.snapshot,
+        metrics=collect_local
+    ).serve_forever()
+
+
+# 전역 인스턴스
+remote_pipeline_service = RemotePipelineService(inference_client)
@@ -1,13 +1,13 @@
 import time
 from PIL import Image
 
-from .pipeline_service import PipelineService
+from .pipeline_service import get_pipeline_service
 from ..utils.image_utils import ImageProcessor
 from ..schemas.response_schemas import SmoothingResponse
 
 class SmoothingService:
     def __init__(self):
-        self.pipeline_service = PipelineService()
+        self.pipeline_service = get_pipeline_service()
         self.image_processor = ImageProcessor()
     
     async def apply_smoothing(
@@ -25,7 +25,7 @@ class SmoothingService:
         
         try:
             # IP-Adapter 로드
-            ip_adapter = await self.pipeline_service.get_ip_adapter(category)
+            ip_adapter = await self.pipeline_service.get_ip_adapter()
             
             # 스무딩 실행
             smoothed_image = await self.pipeline_service.apply_ip_adapter(
@@ -33,6 +33,7 @@ class SmoothingService:
                 background_image=background_image,
                 product_image=product_image,
                 prompt=prompt,
+                category=category,
                 scale=scale,
                 inference_steps=inference_steps,
                 guidance_scale=guidance_scale
@@ -2,16 +2,38 @@ from PIL import Image, ImageOps
 from fastapi import UploadFile, HTTPException
 import io
 import base64
-from rembg import remove
 from typing import Tuple, Optional
+import threading
 import time
 import logging
 
+from common.core.config import image_encoding_settings
+from common.utils.image_encoding import encode_image
+from common.utils.tracing import span, traced
+
 logger = logging.getLogger(__name__)
 
+_rembg_session = None
+_rembg_lock = threading.Lock()
+
+def get_rembg_session():
+    """
+    rembg 세션 반환 (onnxruntime 모델은 첫 사용 시 한 번만 로드)
+
+    readiness의 rembg 상태는 warm-up 추론까지 마친 워밍업 단계에서만 기록합니다.
+    """
+    global _rembg_session
+    if _rembg_session is None:
+        with _rembg_lock:
+            if _rembg_session is None:
+                from rembg import new_session
+                _rembg_session = new_session()
+    return _rembg_session
+
 class ImageProcessor:
     """이미지 처리 유틸리티 클래스"""
     
+    @traced("rembg")
     def remove_background(self, image: Image.Image) -> Tuple[Image.Image, Image.Image]:
         """배경 제거 (model_dev/modules/utils.py의 remove_background 로직 적용)"""
         try:
@@ -22,7 +44,8 @@ class ImageProcessor:
             original_image = image.convert("RGBA")
 
             # rembg로 배경 제거
-            output_data = remove(input_data)
+            from rembg import remove
+            output_data = remove(input_data, session=get_rembg_session())
             transparent_image = Image.open(io.BytesIO(output_data)).convert("RGBA")
 
             return original_image, transparent_image
@@ -62,8 +85,18 @@ class ImageProcessor:
             logger.error(f"Failed to create mask: {e}")
             raise
     
-    def encode_to_base64(self, image: Image.Image, size: Optional[Tuple[int, int]] = None) -> str:
-        """이미지를 base64로 인코딩"""
+    def encode_to_base64(
+        self,
+        image: Image.Image,
+        size: Optional[Tuple[int, int]] = None,
+        profile: Optional[str] = None,
+        output_format: Optional[str] = None
+    ) -> str:
+        """
+        이미지를 base64로 인코딩 (RGB 변환 후 인코딩 프로필 적용)
+        
+        profile을 생략하면 설정의 bg_output_profile(기본 final: 무손실 PNG, 빠른 압축)을 사용합니다.
+        """
         try:
             if not isinstance(image, Image.Image):
                 raise TypeError(f"Unsupported image type: {type(image)}")
@@ -73,16 +106,7 @@ class ImageProcessor:
             if size:
                 image.thumbnail(size, Image.Resampling.LANCZOS)
             
-            buffered = io.BytesIO()
-            image.save(buffered, format="PNG")
-            
-            # 🔍 버퍼 저장 이후에 검사
-            data = buffered.getvalue()
-            if not data:
-                logger.error("버퍼가 비어 있음: 이미지 저장 실패")
-                raise ValueError("이미지를 버퍼에 저장하지 못했습니다.")
-            else: 
-                print(f"버퍼 데이터 있음 : {data[:100]}")
+            data, _ = encode_image(image, profile or image_encoding_settings.bg_output_profile, output_format)
             return base64.b64encode(data).decode("utf-8")
 
         except Exception as e:
@@ -95,9 +119,11 @@ async def validate_image(upload_file: UploadFile) -> Image.Image:
     if not upload_file.content_type.startswith('image/'):
         raise HTTPException(status_code=400, detail="이미지 파일만 업로드 가능합니다.")
     
-    contents = await upload_file.read()
+    with span("upload_read"):
+        contents = await upload_file.read()
     try:
-        image = Image.open(io.BytesIO(contents))
-        return image.convert("RGBA")
+        with span("upload_parse"):
+            image = Image.open(io.BytesIO(contents))
+            return image.convert("RGBA")
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"이미지 처리 실패: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,154 @@
+import time
+import zlib
+import logging
+import threading
+import unicodedata
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from common.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# 캐시 동작 모드
+MODE_OFF = "off"          # 조회/저장 안 함
+MODE_SHADOW = "shadow"    # 조회만 하고 통계 기록 (임계값 튜닝용), 응답은 항상 새로 생성
+MODE_REUSE = "reuse"      # 임계값 이상이면 이전 응답 재사용
+
+_similarity = metrics.histogram(
+    "semantic_cache_best_similarity",
+    "시맨틱 캐시 조회 시 가장 가까운 항목의 코사인 유사도",
+    ["cache"],
+    buckets=[0.5, 0.6, 0.7, 0.8, 0.85, 0.9, 0.93, 0.95, 0.97, 0.99, 1.0]
+)
+
+class HashedNgramVectorizer:
+    """문자 n-gram 해싱 벡터 (임베딩 모델 없이 CPU에서 계산, L2 정규화)"""
+
+    def __init__(self, dimensions: int = 2048, ngram_range: Tuple[int, int] = (2, 4)):
+        self.dimensions = dimensions
+        self.ngram_range = ngram_range
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return " ".join(unicodedata.normalize("NFKC", text).lower().split())
+
+    def transform(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        text = self.normalize(text)
+        low, high = self.ngram_range
+        for n in range(low, high + 1):
+            for i in range(len(text) - n + 1):
+                h = zlib.crc32(text[i:i + n].encode("utf-8"))
+                # 해시 상위 비트로 부호를 정해 충돌 편향 완화
+                vector[h % self.dimensions] += 1.0 if h & 0x80000000 else -1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+class SemanticCache:
+    """
+    유사 요청 응답 캐시 (프로세스 내 벡터 인덱스)
+
+    요청 텍스트 벡터와 저장된 벡터의 코사인 유사도가 threshold 이상이면 이전 응답을 반환합니다.
+    partition이 다른 항목끼리는 비교하지 않습니다. (예: 제품 유형/마케팅 유형이 정확히 같아야 재사용)
+    threshold를 높이면 잘못된 재사용이 줄고(정밀도), 낮추면 재사용이 늘어납니다(재현율).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        mode: str = MODE_REUSE,
+        threshold: float = 0.95,
+        max_entries: int = 2000,
+        ttl: float = 86400.0,
+        vectorizer: Optional[HashedNgramVectorizer] = None
+    ):
+        self.name = name
+        self.mode = mode
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.vectorizer = vectorizer or HashedNgramVectorizer()
+
+        # 고정 크기 링 버퍼 (가득 차면 가장 오래된 항목부터 교체)
+        self._vectors = np.zeros((max_entries, self.vectorizer.dimensions), dtype=np.float32)
+        # partition 문자열의 해시 (프로세스 내 캐시라 hash()로 충분, 별도 id 표가 쌓이지 않음)
+        self._partitions = np.full(max_entries, -1, dtype=np.int64)
+        self._stored_at = np.zeros(max_entries, dtype=np.float64)
+        self._values: list = [None] * max_entries
+        self._next = 0
+        self._size = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "shadow_hits": 0}
+
+    def lookup(self, text: str, partition: str = "", allow_reuse: bool = True) -> Optional[Any]:
+        """유사 요청의 응답 (모드가 reuse이고 allow_reuse일 때만 반환, shadow 모드는 통계만 기록)"""
+        if self.mode == MODE_OFF:
+            return None
+        vector = self.vectorizer.transform(text)
+
+        with self._lock:
+            if self._size == 0:
+                self._stats["misses"] += 1
+                return None
+            size = self._size
+            similarities = self._vectors[:size] @ vector
+            valid = (self._partitions[:size] == hash(partition)) & (
+                time.monotonic() - self._stored_at[:size] <= self.ttl
+            )
+            similarities = np.where(valid, similarities, -1.0)
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            value = self._values[best]
+
+            matched = similarity >= self.threshold
+            if not matched:
+                self._stats["misses"] += 1
+            elif self.mode == MODE_SHADOW or not allow_reuse:
+                self._stats["shadow_hits"] += 1
+            else:
+                self._stats["hits"] += 1
+
+        if similarity >= 0:
+            _similarity.observe(similarity, cache=self.name)
+        if matched and self.mode == MODE_REUSE and allow_reuse:
+            logger.info(f"시맨틱 캐시 적중 ({self.name}): 유사도 {similarity:.3f}")
+            return value
+        return None
+
+    def add(self, text: str, value: Any, partition: str = "") -> None:
+        if self.mode == MODE_OFF:
+            return
+        vector = self.vectorizer.transform(text)
+        with self._lock:
+            slot = self._next
+            if self._size == self.max_entries:
+                self._stats["evictions"] += 1
+            self._vectors[slot] = vector
+            self._partitions[slot] = hash(partition)
+            self._stored_at[slot] = time.monotonic()
+            self._values[slot] = value
+            self._next = (slot + 1) % self.max_entries
+            self._size = min(self._size + 1, self.max_entries)
+
+    def stats(self) -> Dict[str, float]:
+        """캐시 통계 (/metrics)"""
+        with self._lock:
+            return {**self._stats, "entries": self._size}
+
+    @classmethod
+    def from_config(cls, name: str, config: Dict[str, Any]) -> "SemanticCache":
+        """config.yaml의 semantic_cache 항목으로 생성 (항목별 설정이 공통 설정보다 우선)"""
+        options = {**{k: v for k, v in config.items() if not isinstance(v, dict)}, **config.get(name, {})}
+        return cls(
+            name=name,
+            mode=str(options.get("mode", MODE_REUSE)),
+            threshold=float(options.get("threshold", 0.95)),
+            max_entries=int(options.get("max_entries", 2000)),
+            ttl=float(options.get("ttl_seconds", 86400)),
+            vectorizer=HashedNgramVectorizer(
+                dimensions=int(options.get("dimensions", 2048)),
+                ngram_range=tuple(options.get("ngram_range", (2, 4)))
+            )
+        )
@@ -1,13 +1,34 @@
 import os
+from typing import Optional
 from pydantic_settings import BaseSettings
 
 class ImageGenSettings(BaseSettings):
     app_name: str = "Text Image Generator"
     debug: bool = False
     font_download_dir: str = "imageGen_Text/downloaded_fonts"
+    # 오프라인 환경용 폰트 미러 디렉터리 (원격 폰트를 URL 파일명 또는 "<폰트 이름>.<확장자>"로 찾음)
+    font_mirror_dir: Optional[str] = None
+    font_prefetch_concurrency: int = 4
+    font_download_timeout: float = 30.0
+    # 폰트 서브셋 (fonttools 필요, 기본 한글/라틴 문자만 담은 폰트로 렌더링, 그 밖의 글자가 있으면 원본 폰트)
+    font_subsetting: bool = True
+    font_subset_dir: str = "imageGen_Text/font_subsets"
+    font_subset_dir_max_bytes: int = 256 * 1024 * 1024
     max_font_size: int = 200
     min_font_size: int = 50
     max_background_size: int = 2048
+    # 폰트 객체 캐시 (메모리는 폰트 파일 크기 합으로 추정)
+    font_cache_max_entries: int = 64
+    font_cache_max_bytes: int = 256 * 1024 * 1024
+    # 글자 마스크 캐시 (마스크 픽셀 수 합)
+    glyph_cache_max_bytes: int = 64 * 1024 * 1024
+    # 배치 렌더링 (한 요청의 최대 변형 수, 렌더링 스레드 수)
+    batch_max_variants: int = 32
+    render_workers: int = 4
+    # 렌더링 결과 캐시 (인코딩된 이미지 바이트 합, render_cache_dir가 비어 있으면 디스크 계층 사용 안 함)
+    render_cache_max_bytes: int = 64 * 1024 * 1024
+    render_cache_dir: Optional[str] = "imageGen_Text/render_cache"
+    render_cache_disk_max_bytes: int = 512 * 1024 * 1024
     
     class Config:
         env_file = ".env"
@@ -47,6 +68,8 @@ EXT_TO_FORMAT = {
     ".tif": "TIFF",
     ".tiff": "TIFF",
     ".webp": "WEBP",
+    ".avif": "AVIF",
+    ".svg": "SVG",
     ".ico": "ICO",
     ".ppm": "PPM",
     ".pbm": "PPM",
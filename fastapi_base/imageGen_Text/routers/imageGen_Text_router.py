@@ -1,6 +1,14 @@
-from fastapi import APIRouter, HTTPException, status
-from imageGen_Text.schemas.imageGen_Text_schemas import TextImageRequest, TextImageResponse, FontListResponse, ErrorResponse
+import asyncio
+import functools
+import contextvars
+from fastapi import APIRouter, HTTPException, Path, Request, Response, status
+from imageGen_Text.schemas.imageGen_Text_schemas import (
+    TextImageRequest, TextImageResponse, FontListResponse, ErrorResponse,
+    TextImageBatchRequest, TextImageBatchResponse
+)
 from imageGen_Text.service.imageGen_Text_service import text_image_service
+from imageGen_Text.utils.font_store import font_store
+from imageGen_Text.utils.font_subset import font_subsetter
 
 router = APIRouter()
 
@@ -16,9 +24,22 @@ async def get_available_fonts():
             detail=f"폰트 목록을 가져오는 중 오류 발생: {str(e)}"
         )
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 헤더(쉼표 구분 목록, W/ 접두사 허용)에 etag가 있는지"""
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates
+
 @router.post("/generate", response_model=TextImageResponse)
-async def generate_text_image(request: TextImageRequest):
-    """텍스트 이미지를 생성합니다."""
+async def generate_text_image(request: TextImageRequest, http_request: Request, response: Response):
+    """
+    텍스트 이미지를 생성합니다.
+    
+    같은 입력이면 캐시된 이미지를 반환하며, 응답의 ETag와 Content-Location(GET /images/{image_id})으로
+    재검증할 수 있습니다. POST는 조건부 요청에 304를 쓸 수 없으므로(RFC 9110 13.1.2)
+    If-None-Match가 일치하면 412를 반환합니다.
+    output_format=SVG면 벡터(SVG 문서)를, scale을 주면 그 배율로 바로 래스터화한 이미지를 반환합니다.
+    (최종 합성 시 리사이즈 대신 사용)
+    """
     try:
         # 배경 크기 검증
         if request.background_size[0] > 2048 or request.background_size[1] > 2048:
@@ -43,18 +64,29 @@ async def generate_text_image(request: TextImageRequest):
                     detail="단어별 색상 모드에서는 테두리 색상 개수가 단어 개수와 일치해야 합니다."
                 )
         
-        # 이미지 생성
-        image_base64, format_name, error_message = text_image_service.generate_text_image(
-            text=request.text,
-            font_name=request.font_name,
-            font_size=request.font_size,
-            text_colors=request.text_colors,
-            stroke_colors=request.stroke_colors,
-            stroke_width=request.stroke_width,
-            word_based_colors=request.word_based_colors,
-            background_size=request.background_size,
-            background_color=request.background_color,
-            output_format=request.output_format
+        # 입력 전체의 지문을 ETag로 사용 (렌더링 전에 재검증 가능)
+        style = request.model_dump(exclude={"text", "font_name", "output_format", "encoding_profile"})
+        image_id = text_image_service.cache_key(request.text, request.font_name, request.output_format, request.encoding_profile, **style)
+        etag = f'"{image_id}"'
+        if _etag_matches(http_request.headers.get("if-none-match", ""), etag):
+            return Response(status_code=status.HTTP_412_PRECONDITION_FAILED, headers={"ETag": etag})
+        
+        # 폰트 파일 준비 (원격 폰트 다운로드는 이벤트 루프를 막지 않음, 서브셋은 기다리지 않고 백그라운드 생성)
+        await font_store.ensure(request.font_name)
+        font_subsetter.schedule(request.font_name, request.text)
+        
+        # 이미지 생성 (효과 렌더링은 CPU 작업이므로 배치와 같은 렌더 스레드 풀에서 실행)
+        loop = asyncio.get_running_loop()
+        image_base64, format_name, error_message = await loop.run_in_executor(
+            text_image_service._executor,
+            functools.partial(
+                contextvars.copy_context().run, text_image_service.generate_text_image,
+                text=request.text,
+                font_name=request.font_name,
+                output_format=request.output_format,
+                encoding_profile=request.encoding_profile,
+                **style
+            )
         )
         
         if error_message:
@@ -63,6 +95,10 @@ async def generate_text_image(request: TextImageRequest):
                 detail=error_message
             )
         
+        response.headers["ETag"] = etag
+        response.headers["Content-Location"] = http_request.url_for("get_cached_text_image", image_id=image_id).path
+        response.headers["Cache-Control"] = "private, no-cache"
+        
         return TextImageResponse(
             success=True,
             message="이미지 생성이 완료되었습니다.",
@@ -78,6 +114,102 @@ async def generate_text_image(request: TextImageRequest):
             detail=f"서버 오류가 발생했습니다: {str(e)}"
         )
 
+@router.get("/images/{image_id}", response_model=TextImageResponse)
+async def get_cached_text_image(
+    http_request: Request,
+    response: Response,
+    image_id: str = Path(..., pattern="^[0-9a-f]{64}$", description="생성 응답의 ETag (따옴표 제외)")
+):
+    """
+    생성된 텍스트 이미지를 ETag로 조회합니다.
+    
+    image_id는 입력 전체의 지문이라 내용이 바뀌지 않으므로, If-None-Match가 일치하면 본문 없이 304를 반환합니다.
+    캐시에서 밀려난 이미지는 404이며, 이때는 POST /generate로 다시 생성합니다.
+    """
+    etag = f'"{image_id}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(http_request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    cached = text_image_service.get_cached_image(image_id)
+    if cached is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="캐시에 없는 이미지입니다. 다시 생성해 주세요."
+        )
+    
+    image_base64, format_name = cached
+    response.headers.update(headers)
+    return TextImageResponse(
+        success=True,
+        message="캐시된 이미지입니다.",
+        image_base64=image_base64,
+        format=format_name
+    )
+
+# 변형마다 덮어쓸 수 있는 값을 제외한 공통 렌더링 옵션
+BATCH_SHARED_FIELDS = {
+    "font_size", "text_colors", "stroke_colors", "stroke_width", "word_based_colors",
+    "background_size", "background_color", "text_align", "line_spacing", "padding", "wrap", "effects", "scale"
+}
+
+@router.post("/generate/batch", response_model=TextImageBatchResponse)
+async def generate_text_image_batch(request: TextImageBatchRequest):
+    """
+    같은 텍스트를 여러 스타일(폰트/크기/색상/테두리)로 한 번에 생성합니다.
+    
+    contact_sheet=true면 변형 순서대로 격자에 배치한 이미지 1장을 반환합니다. (폰트 선택 미리보기용)
+    """
+    try:
+        base = request.model_dump(include=BATCH_SHARED_FIELDS)
+        variants = [{**base, **variant.model_dump(exclude_none=True)} for variant in request.variants]
+        
+        # 단어별 색상 검증
+        if request.word_based_colors:
+            words = request.text.split()
+            for i, variant in enumerate(variants):
+                if isinstance(variant["text_colors"], list) and len(variant["text_colors"]) != len(words):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"{i}번 변형: 단어별 색상 모드에서는 색상 개수가 단어 개수와 일치해야 합니다."
+                    )
+        
+        async def prepare_font(font_name: str) -> None:
+            await font_store.ensure(font_name)
+            font_subsetter.schedule(font_name, request.text)
+        await asyncio.gather(*(prepare_font(font_name) for font_name in {v["font_name"] for v in variants}))
+        
+        result = await text_image_service.generate_text_image_batch(
+            text=request.text,
+            variants=variants,
+            output_format=request.output_format,
+            encoding_profile=request.encoding_profile,
+            contact_sheet=request.contact_sheet,
+            columns=request.sheet_columns,
+            cell_width=request.sheet_cell_width
+        )
+        
+        succeeded = sum(item["success"] for item in result["items"])
+        if succeeded == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=result["items"][0]["error"]
+            )
+        
+        return TextImageBatchResponse(
+            success=True,
+            message=f"{len(variants)}개 중 {succeeded}개 이미지 생성이 완료되었습니다.",
+            **result
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
 @router.get("/health")
 async def health_check():
     """API 상태 확인"""
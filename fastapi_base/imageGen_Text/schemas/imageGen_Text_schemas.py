@@ -1,5 +1,96 @@
+import re
 from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional, Union
+from typing import List, Literal, Optional, Tuple, Union
+from imageGen_Text.core.imageGen_Text_config import settings
+
+# #RRGGBB (SVG 속성에도 그대로 들어가므로 16진수 6자리만 허용)
+HEX_COLOR_PATTERN = re.compile(r'#[0-9A-Fa-f]{6}')
+
+def _is_hex_color(v) -> bool:
+    return isinstance(v, str) and HEX_COLOR_PATTERN.fullmatch(v) is not None
+
+def _check_colors(v: Union[str, List[str]], message: str, list_message: str) -> Union[str, List[str]]:
+    """#RRGGBB 형식 색상(단색 또는 리스트) 검증"""
+    if isinstance(v, str):
+        if not _is_hex_color(v):
+            raise ValueError(message)
+    elif isinstance(v, list):
+        for color in v:
+            if not _is_hex_color(color):
+                raise ValueError(list_message)
+    return v
+
+def _check_color(v: str) -> str:
+    if not _is_hex_color(v):
+        raise ValueError('색상은 #RRGGBB 형식이어야 합니다.')
+    return v
+
+class GradientFill(BaseModel):
+    """글자 색을 대신하는 선형 그라데이션"""
+    
+    colors: List[str] = Field(..., min_length=2, max_length=5, description="색상 (균등 간격)", example=["#FF512F", "#F09819"])
+    angle: float = Field(default=90, ge=0, le=360, description="방향 (도, 0: 왼쪽→오른쪽, 90: 위→아래)", example=90)
+
+    @field_validator('colors')
+    @classmethod
+    def validate_colors(cls, v: List[str]) -> List[str]:
+        return [_check_color(color) for color in v]
+
+class ShadowEffect(BaseModel):
+    """그림자 (외곽 마스크를 블러 후 이동)"""
+    
+    color: str = Field(default="#000000", description="그림자 색상", example="#000000")
+    opacity: float = Field(default=0.5, ge=0, le=1, description="불투명도", example=0.5)
+    offset: Tuple[int, int] = Field(default=(4, 4), description="이동 (x, y, px)", example=(4, 4))
+    blur_radius: float = Field(default=6, ge=0, le=50, description="블러 반경 (px)", example=6)
+
+    @field_validator('color')
+    @classmethod
+    def validate_color(cls, v: str) -> str:
+        return _check_color(v)
+
+    @field_validator('offset')
+    @classmethod
+    def validate_offset(cls, v: Tuple[int, int]) -> Tuple[int, int]:
+        if any(abs(component) > 100 for component in v):
+            raise ValueError('그림자 이동은 100px을 초과할 수 없습니다.')
+        return v
+
+class GlowEffect(BaseModel):
+    """글로우 (외곽 마스크를 팽창 후 블러)"""
+    
+    color: str = Field(default="#FFFFFF", description="글로우 색상", example="#FFFF00")
+    opacity: float = Field(default=0.8, ge=0, le=1, description="불투명도", example=0.8)
+    radius: float = Field(default=8, ge=1, le=50, description="블러 반경 (px)", example=8)
+    spread: int = Field(default=2, ge=0, le=20, description="팽창 폭 (px)", example=2)
+
+    @field_validator('color')
+    @classmethod
+    def validate_color(cls, v: str) -> str:
+        return _check_color(v)
+
+class OutlineEffect(BaseModel):
+    """외곽선 한 겹 (목록 순서대로 안쪽부터 바깥쪽으로 쌓임)"""
+    
+    color: str = Field(..., description="외곽선 색상", example="#FFFFFF")
+    width: int = Field(..., ge=1, le=30, description="두께 (px)", example=4)
+
+    @field_validator('color')
+    @classmethod
+    def validate_color(cls, v: str) -> str:
+        return _check_color(v)
+
+class TextEffects(BaseModel):
+    """
+    텍스트 효과
+    
+    아래에서 위로 그림자 → 글로우 → 외곽선 → 텍스트(기본 테두리 포함) → 그라데이션 순으로 합성합니다.
+    """
+    
+    gradient: Optional[GradientFill] = Field(default=None, description="글자 그라데이션")
+    shadows: List[ShadowEffect] = Field(default=[], max_length=3, description="그림자 목록")
+    glow: Optional[GlowEffect] = Field(default=None, description="글로우")
+    outlines: List[OutlineEffect] = Field(default=[], max_length=5, description="외곽선 목록 (안쪽부터)")
 
 class TextImageRequest(BaseModel):
     """
@@ -67,11 +158,58 @@ class TextImageRequest(BaseModel):
         example=(255, 255, 255, 0)
     )
     
-    output_format: str = Field(
-        default="PNG", 
-        description="출력 이미지 포맷",
+    output_format: Optional[str] = Field(
+        default=None, 
+        description="출력 이미지 포맷 (생략하면 인코딩 프로필의 기본 포맷, WEBP/AVIF는 서버가 지원하지 않으면 PNG로 반환, SVG는 글리프 윤곽 벡터)",
         example="PNG"
     )
+    
+    encoding_profile: Literal["preview", "final", "download"] = Field(
+        default="final",
+        description="인코딩 프로필 (preview: 작고 빠른 미리보기, final: 무손실 빠른 압축, download: 무손실 최소 크기)",
+        example="final"
+    )
+    
+    text_align: Literal["left", "center", "right"] = Field(
+        default="center",
+        description="줄 정렬",
+        example="center"
+    )
+    
+    line_spacing: float = Field(
+        default=1.0,
+        ge=0.5,
+        le=3.0,
+        description="줄 간격 (폰트 높이 배수)",
+        example=1.2
+    )
+    
+    padding: int = Field(
+        default=0,
+        ge=0,
+        le=512,
+        description="좌우 여백 (px, 줄바꿈 폭과 좌/우 정렬 기준)",
+        example=20
+    )
+    
+    wrap: bool = Field(
+        default=True,
+        description="배경 폭을 넘는 줄 자동 줄바꿈 여부",
+        example=True
+    )
+    
+    effects: Optional[TextEffects] = Field(
+        default=None,
+        description="그라데이션/그림자/글로우/다중 외곽선 효과"
+    )
+    
+    scale: float = Field(
+        default=1.0,
+        gt=0,
+        le=4.0,
+        description="출력 배율 (최종 합성 크기로 바로 래스터화, SVG는 표시 크기만 변경)",
+        example=0.5
+    )
 
     @field_validator('text')
     @classmethod
@@ -85,27 +223,13 @@ class TextImageRequest(BaseModel):
     @classmethod
     def validate_text_colors(cls, v: Union[str, List[str]]) -> Union[str, List[str]]:
         """텍스트 색상 유효성 검증"""
-        if isinstance(v, str):
-            if not v.startswith('#') or len(v) != 7:
-                raise ValueError('색상은 #RRGGBB 형식이어야 합니다.')
-        elif isinstance(v, list):
-            for color in v:
-                if not isinstance(color, str) or not color.startswith('#') or len(color) != 7:
-                    raise ValueError('모든 색상은 #RRGGBB 형식이어야 합니다.')
-        return v
+        return _check_colors(v, '색상은 #RRGGBB 형식이어야 합니다.', '모든 색상은 #RRGGBB 형식이어야 합니다.')
 
     @field_validator('stroke_colors')
     @classmethod
     def validate_stroke_colors(cls, v: Union[str, List[str]]) -> Union[str, List[str]]:
         """테두리 색상 유효성 검증"""
-        if isinstance(v, str):
-            if not v.startswith('#') or len(v) != 7:
-                raise ValueError('테두리 색상은 #RRGGBB 형식이어야 합니다.')
-        elif isinstance(v, list):
-            for color in v:
-                if not isinstance(color, str) or not color.startswith('#') or len(color) != 7:
-                    raise ValueError('모든 테두리 색상은 #RRGGBB 형식이어야 합니다.')
-        return v
+        return _check_colors(v, '테두리 색상은 #RRGGBB 형식이어야 합니다.', '모든 테두리 색상은 #RRGGBB 형식이어야 합니다.')
 
     @field_validator('background_size')
     @classmethod
@@ -135,13 +259,151 @@ class TextImageRequest(BaseModel):
 
     @field_validator('output_format')
     @classmethod
-    def validate_output_format(cls, v: str) -> str:
+    def validate_output_format(cls, v: Optional[str]) -> Optional[str]:
         """출력 포맷 검증"""
-        valid_formats = ["PNG", "JPEG", "JPG", "WEBP", "BMP", "GIF", "TIFF"]
+        if v is None:
+            return v
+        valid_formats = ["PNG", "JPEG", "JPG", "WEBP", "AVIF", "BMP", "GIF", "TIFF", "SVG"]
         if v.upper() not in valid_formats:
             raise ValueError(f'지원하지 않는 포맷입니다. 지원 포맷: {", ".join(valid_formats)}')
         return v.upper()
 
+class TextStyleVariant(BaseModel):
+    """
+    배치 렌더링 스타일 변형
+    
+    폰트는 필수이며, 지정하지 않은 항목은 배치 요청의 공통 값을 사용합니다.
+    """
+    
+    font_name: str = Field(
+        ...,
+        description="사용할 폰트 이름",
+        example="베이글"
+    )
+    
+    font_size: Optional[int] = Field(
+        default=None,
+        ge=50,
+        le=200,
+        description="글자 크기 (50-200 사이)",
+        example=100
+    )
+    
+    text_colors: Optional[Union[str, List[str]]] = Field(
+        default=None,
+        description="텍스트 색상 (단색 또는 단어별 색상 리스트)",
+        example="#FF0000"
+    )
+    
+    stroke_colors: Optional[Union[str, List[str]]] = Field(
+        default=None,
+        description="테두리 색상 (단색 또는 단어별 색상 리스트)",
+        example="#FFFFFF"
+    )
+    
+    stroke_width: Optional[int] = Field(
+        default=None,
+        ge=0,
+        le=10,
+        description="테두리 굵기 (0-10 사이)",
+        example=2
+    )
+    
+    effects: Optional[TextEffects] = Field(
+        default=None,
+        description="텍스트 효과"
+    )
+
+    @field_validator('text_colors')
+    @classmethod
+    def validate_text_colors(cls, v: Optional[Union[str, List[str]]]) -> Optional[Union[str, List[str]]]:
+        if v is None:
+            return v
+        return _check_colors(v, '색상은 #RRGGBB 형식이어야 합니다.', '모든 색상은 #RRGGBB 형식이어야 합니다.')
+
+    @field_validator('stroke_colors')
+    @classmethod
+    def validate_stroke_colors(cls, v: Optional[Union[str, List[str]]]) -> Optional[Union[str, List[str]]]:
+        if v is None:
+            return v
+        return _check_colors(v, '테두리 색상은 #RRGGBB 형식이어야 합니다.', '모든 테두리 색상은 #RRGGBB 형식이어야 합니다.')
+
+class TextImageBatchRequest(TextImageRequest):
+    """
+    텍스트 이미지 배치 생성 요청 모델
+    
+    같은 텍스트를 여러 스타일 변형(폰트, 크기, 색상, 테두리)으로 한 번에 렌더링합니다.
+    변형에 없는 항목과 배경/정렬/출력 포맷은 이 요청의 값을 공통으로 사용합니다.
+    """
+    
+    font_name: Optional[str] = Field(
+        default=None,
+        description="사용하지 않음 (폰트는 변형마다 지정)"
+    )
+    
+    variants: List[TextStyleVariant] = Field(
+        ...,
+        description="스타일 변형 목록",
+        example=[{"font_name": "본고딕_BOLD"}, {"font_name": "베이글", "text_colors": "#FF0000"}]
+    )
+    
+    contact_sheet: bool = Field(
+        default=False,
+        description="개별 이미지 대신 격자로 합친 이미지 1장 반환 여부",
+        example=True
+    )
+    
+    sheet_columns: int = Field(
+        default=4,
+        ge=1,
+        le=8,
+        description="격자 열 수",
+        example=4
+    )
+    
+    sheet_cell_width: int = Field(
+        default=256,
+        ge=64,
+        le=1024,
+        description="격자 한 칸의 폭 (px, 높이는 배경 비율 유지)",
+        example=256
+    )
+
+    @field_validator('variants')
+    @classmethod
+    def validate_variants(cls, v: List[TextStyleVariant]) -> List[TextStyleVariant]:
+        if not v:
+            raise ValueError('스타일 변형 목록이 비어 있습니다.')
+        if len(v) > settings.batch_max_variants:
+            raise ValueError(f'한 번에 최대 {settings.batch_max_variants}개 변형까지 생성할 수 있습니다.')
+        return v
+
+class TextImageBatchItem(BaseModel):
+    """배치 결과 항목 (variants와 같은 순서)"""
+    
+    index: int = Field(description="변형 순번", example=0)
+    font_name: str = Field(description="폰트 이름", example="본고딕_BOLD")
+    success: bool = Field(description="생성 성공 여부", example=True)
+    image_base64: Optional[str] = Field(default=None, description="Base64 인코딩된 이미지 (contact_sheet이면 생략)")
+    format: Optional[str] = Field(default=None, description="이미지 포맷", example="PNG")
+    error: Optional[str] = Field(default=None, description="실패 사유")
+
+class TextImageBatchResponse(BaseModel):
+    """
+    텍스트 이미지 배치 생성 응답 모델
+    
+    contact_sheet 요청이면 contact_sheet_base64에 격자 이미지가 담기며,
+    칸 순서는 items(변형 순서)와 같습니다. 실패한 변형의 칸은 비워 둡니다.
+    """
+    
+    success: bool = Field(description="작업 성공 여부", example=True)
+    message: str = Field(description="응답 메시지", example="8개 중 8개 이미지 생성이 완료되었습니다.")
+    items: List[TextImageBatchItem] = Field(description="변형별 결과")
+    contact_sheet_base64: Optional[str] = Field(default=None, description="Base64 인코딩된 격자 이미지")
+    format: Optional[str] = Field(default=None, description="격자 이미지 포맷", example="PNG")
+    columns: Optional[int] = Field(default=None, description="격자 열 수", example=4)
+    cell_size: Optional[Tuple[int, int]] = Field(default=None, description="격자 한 칸 크기 (width, height)", example=(256, 256))
+
 class TextImageResponse(BaseModel):
     """
     텍스트 이미지 생성 응답 모델
@@ -1,22 +1,35 @@
-import os
+import math
 import base64
-from io import BytesIO
-from PIL import Image, ImageDraw, ImageFont
-from typing import Union, List, Tuple, Optional
-from imageGen_Text.core.imageGen_Text_config import FONTS, EXT_TO_FORMAT
-from imageGen_Text.utils.font_downloader import font_downloader
+import asyncio
+import inspect
+import functools
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageFont
+from typing import Any, Dict, Union, List, Tuple, Optional
+from imageGen_Text.core.imageGen_Text_config import FONTS, EXT_TO_FORMAT, settings
+from imageGen_Text.utils.font_cache import font_cache
+from imageGen_Text.utils.text_layout import TextLayout, layout_text, draw_layout, layout_masks
+from imageGen_Text.utils.text_effects import effects_margin, render_with_effects, scale_effects
+from imageGen_Text.utils.text_svg import layout_svg, outline_font
+from imageGen_Text.utils.render_cache import render_cache, render_fingerprint
+from common.utils.image_encoding import encode_image, resolve as resolve_encoding
+from common.utils.tracing import span
 
 class TextImageService:
     def __init__(self):
-        pass
+        # 배치 렌더링용 스레드 풀 (폰트/글자 캐시는 모든 스레드가 공유)
+        self._executor = ThreadPoolExecutor(max_workers=settings.render_workers, thread_name_prefix="text-render")
     
     def hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int, int]:
         """HEX 색상을 RGBA 튜플로 변환"""
         hex_color = hex_color.lstrip('#')
         return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4)) + (255,)
     
-    def infer_format_from_name(self, format_name: str) -> str:
-        """포맷 이름에서 PIL 포맷 추론"""
+    def infer_format_from_name(self, format_name: Optional[str]) -> Optional[str]:
+        """포맷 이름에서 PIL 포맷 추론 (None이면 None: 인코딩 프로필의 기본 포맷 사용)"""
+        if format_name is None:
+            return None
         format_name = format_name.upper()
         return format_name if format_name in EXT_TO_FORMAT.values() else "PNG"
     
@@ -24,7 +37,105 @@ class TextImageService:
         """사용 가능한 폰트 목록 반환"""
         return list(FONTS.keys())
     
-    def generate_text_image(
+    def _layout(
+        self,
+        text: str,
+        font_name: str,
+        font_size: int,
+        text_colors: Union[str, List[str]],
+        stroke_colors: Union[str, List[str]],
+        stroke_width: int,
+        word_based_colors: bool,
+        background_size: Tuple[int, int],
+        line_spacing: float,
+        padding: int,
+        wrap: bool,
+        effects: Optional[Dict[str, Any]]
+    ) -> Tuple[ImageFont.FreeTypeFont, TextLayout, int]:
+        """
+        폰트 로드와 글자별 색상 결정 후 줄/런 배치 (래스터/SVG 공용)
+        
+        Returns:
+            (폰트, 배치, 효과 여백을 더한 padding)
+        
+        Raises:
+            ValueError: 지원하지 않는 폰트이거나 폰트 파일이 없는 경우
+        """
+        # 폰트 확인 및 다운로드
+        if font_name not in FONTS:
+            raise ValueError(f"지원하지 않는 폰트입니다: {font_name}")
+        
+        with span("font_load"):
+            font = font_cache.get(font_name, font_size, text=text)
+        
+        if font is None:
+            raise ValueError(f"폰트 파일을 찾을 수 없습니다: {font_name}")
+        
+        # 문자별 색상 결정
+        char_text_colors = []
+        char_stroke_colors = []
+        
+        if word_based_colors:
+            words = text.split()
+            word_idx = 0
+            
+            for i, char in enumerate(text):
+                if char.isspace():
+                    char_text_colors.append(self.hex_to_rgb("#000000"))
+                    char_stroke_colors.append(self.hex_to_rgb("#FFFFFF"))
+                    # 연속 공백/개행은 단어 구분 1번으로 처리
+                    if i > 0 and not text[i - 1].isspace() and word_idx < len(words) - 1:
+                        word_idx += 1
+                else:
+                    if isinstance(text_colors, list) and word_idx < len(text_colors):
+                        char_text_colors.append(self.hex_to_rgb(text_colors[word_idx]))
+                    else:
+                        char_text_colors.append(self.hex_to_rgb(text_colors if isinstance(text_colors, str) else text_colors[0]))
+                    
+                    if isinstance(stroke_colors, list) and word_idx < len(stroke_colors):
+                        char_stroke_colors.append(self.hex_to_rgb(stroke_colors[word_idx]))
+                    else:
+                        char_stroke_colors.append(self.hex_to_rgb(stroke_colors if isinstance(stroke_colors, str) else stroke_colors[0]))
+        else:
+            # 단일 색상 사용
+            text_color = text_colors if isinstance(text_colors, str) else text_colors[0]
+            stroke_color = stroke_colors if isinstance(stroke_colors, str) else stroke_colors[0]
+            char_text_colors = [self.hex_to_rgb(text_color)] * len(text)
+            char_stroke_colors = [self.hex_to_rgb(stroke_color)] * len(text)
+        
+        # 줄/색상 런 단위 배치 (측정은 줄 전체 기준이라 커닝 유지, 외곽선/글로우 폭만큼 여백 추가)
+        padding += effects_margin(effects)
+        max_width = background_size[0] - 2 * (padding + stroke_width) if wrap else None
+        layout = layout_text(text, font, char_text_colors, char_stroke_colors, max_width, line_spacing)
+        return font, layout, padding
+    
+    def _apply_scale(
+        self,
+        scale: float,
+        font_size: int,
+        stroke_width: int,
+        background_size: Tuple[int, int],
+        padding: int,
+        effects: Optional[Dict[str, Any]]
+    ) -> Tuple[int, int, Tuple[int, int], int, Optional[Dict[str, Any]]]:
+        """
+        출력 배율 적용 (최종 합성 크기에서 바로 렌더링해 리사이즈 생략)
+        
+        Raises:
+            ValueError: 배율을 적용한 배경 크기가 최대 크기를 넘는 경우
+        """
+        if scale != 1.0:
+            font_size = max(1, round(font_size * scale))
+            stroke_width = round(stroke_width * scale)
+            background_size = tuple(max(1, round(dim * scale)) for dim in background_size)
+            padding = round(padding * scale)
+            effects = scale_effects(effects, scale)
+        if max(background_size) > settings.max_background_size:
+            limit = settings.max_background_size
+            raise ValueError(f"배율을 적용한 배경 크기는 {limit}x{limit}을 초과할 수 없습니다.")
+        return font_size, stroke_width, background_size, padding, effects
+    
+    def render_text_image(
         self,
         text: str,
         font_name: str,
@@ -35,111 +146,259 @@ class TextImageService:
         word_based_colors: bool = False,
         background_size: Tuple[int, int] = (512, 512),
         background_color: Tuple[int, int, int, int] = (255, 255, 255, 0),
-        output_format: str = "PNG"
+        text_align: str = "center",
+        line_spacing: float = 1.0,
+        padding: int = 0,
+        wrap: bool = True,
+        effects: Optional[Dict[str, Any]] = None,
+        scale: float = 1.0
+    ) -> Image.Image:
+        """
+        텍스트 이미지(RGBA)를 그립니다.
+        
+        같은 색이 연속된 글자는 한 번에 그리며, wrap이면 배경 폭(padding 제외)에 맞춰 줄바꿈합니다.
+        effects(TextEffects dict)가 있으면 글자 마스크를 한 번 그린 뒤 NumPy로 효과를 합성합니다.
+        scale은 크기 관련 값(글자, 테두리, 배경, 여백, 효과) 전체에 곱하는 출력 배율입니다.
+        
+        Raises:
+            ValueError: 지원하지 않는 폰트이거나 폰트 파일이 없는 경우, 배율 적용 후 배경이 너무 큰 경우
+        """
+        font_size, stroke_width, background_size, padding, effects = self._apply_scale(
+            scale, font_size, stroke_width, background_size, padding, effects
+        )
+        font, layout, padding = self._layout(
+            text, font_name, font_size, text_colors, stroke_colors, stroke_width, word_based_colors,
+            background_size, line_spacing, padding, wrap, effects
+        )
+        
+        # 이미지 생성
+        img = Image.new("RGBA", background_size, background_color)
+        
+        # 런 단위 합성 (런 마스크는 캐시에서 재사용)
+        font_key = (font_name, font_size, None)
+        with span("render"):
+            if not effects:
+                draw_layout(img, layout, font_key, font, stroke_width, text_align, padding)
+                return img
+            fill_mask, silhouette_mask = layout_masks(background_size, layout, font_key, font, stroke_width, text_align, padding)
+        
+        with span("effects"):
+            return render_with_effects(
+                img, fill_mask, silhouette_mask, effects,
+                lambda target: draw_layout(target, layout, font_key, font, stroke_width, text_align, padding)
+            )
+    
+    def render_text_svg(
+        self,
+        text: str,
+        font_name: str,
+        font_size: int = 125,
+        text_colors: Union[str, List[str]] = "#000000",
+        stroke_colors: Union[str, List[str]] = "#FFFFFF",
+        stroke_width: int = 0,
+        word_based_colors: bool = False,
+        background_size: Tuple[int, int] = (512, 512),
+        background_color: Tuple[int, int, int, int] = (255, 255, 255, 0),
+        text_align: str = "center",
+        line_spacing: float = 1.0,
+        padding: int = 0,
+        wrap: bool = True,
+        effects: Optional[Dict[str, Any]] = None,
+        scale: float = 1.0
+    ) -> str:
+        """
+        텍스트를 SVG 문서로 생성합니다. (인자는 render_text_image와 동일)
+        
+        글리프 윤곽을 폰트에서 꺼내 쓰므로 표시 크기와 무관하게 선명하며,
+        scale은 좌표계를 그대로 두고 표시 크기(width/height)만 바꿉니다.
+        
+        Raises:
+            ValueError: 지원하지 않는 폰트이거나 폰트 파일이 없는 경우, fonttools가 없는 경우
+        """
+        font, layout, padding = self._layout(
+            text, font_name, font_size, text_colors, stroke_colors, stroke_width, word_based_colors,
+            background_size, line_spacing, padding, wrap, effects
+        )
+        path = font_cache.font_path(font_name)
+        if path is None:
+            raise ValueError(f"폰트 파일을 찾을 수 없습니다: {font_name}")
+        try:
+            with span("font_outline"):
+                outline = outline_font(path)
+        except ImportError:
+            raise ValueError("SVG 출력에는 fonttools가 필요합니다.")
+        
+        display_size = tuple(max(1, round(dim * scale)) for dim in background_size)
+        with span("render"):
+            return layout_svg(
+                background_size, layout, font, outline, stroke_width, text_align, padding,
+                background_color, effects, display_size
+            )
+    
+    def encode_image(self, img: Image.Image, output_format: Optional[str] = None, encoding_profile: str = "final") -> Tuple[bytes, str]:
+        """
+        이미지를 지정 포맷/인코딩 프로필로 인코딩해 (바이트, 포맷) 반환
+        
+        output_format이 None이면 프로필의 기본 포맷이며, 지원하지 않는 포맷은 PNG입니다.
+        """
+        return encode_image(img, encoding_profile, self.infer_format_from_name(output_format))
+    
+    def resolve_format(self, output_format: Optional[str], encoding_profile: str = "final") -> str:
+        """실제 출력 포맷 (SVG는 그대로, 래스터 포맷은 서버가 인코딩하지 못하면 PNG)"""
+        fmt = self.infer_format_from_name(output_format)
+        return fmt if fmt == "SVG" else resolve_encoding(encoding_profile, fmt)[0]
+    
+    def cache_key(self, text: str, font_name: str, output_format: Optional[str] = None, encoding_profile: str = "final", **style) -> str:
+        """렌더링 결과 캐시 키 (생략한 스타일 값은 기본값으로 채워 같은 결과면 같은 키, ETag로도 사용)"""
+        return render_fingerprint(
+            text=text,
+            font_name=font_name,
+            output_format=self.resolve_format(output_format, encoding_profile),
+            encoding_profile=encoding_profile,
+            style={**_RENDER_DEFAULTS, **style}
+        )
+    
+    def get_cached_image(self, key: str) -> Optional[Tuple[str, str]]:
+        """캐시 키(ETag)로 이미 생성된 이미지 조회, (base64_image, format) 또는 None"""
+        cached = render_cache.get(key)
+        if cached is None:
+            return None
+        data, fmt = cached
+        return base64.b64encode(data).decode(), fmt
+    
+    def generate_text_image(
+        self,
+        text: str,
+        font_name: str,
+        output_format: Optional[str] = None,
+        encoding_profile: str = "final",
+        **style
     ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
-        텍스트 이미지를 생성합니다.
+        텍스트 이미지를 생성합니다. (style은 render_text_image 인자, 같은 입력이면 캐시된 결과 반환)
+        
+        output_format이 SVG면 래스터화하지 않고 글리프 윤곽으로 만든 SVG 문서를 반환합니다.
         
         Returns:
             (base64_image, format, error_message)
         """
         try:
-            # 폰트 확인 및 다운로드
-            if font_name not in FONTS:
-                return None, None, f"지원하지 않는 폰트입니다: {font_name}"
-            
-            font_url = FONTS[font_name]
-            font_path = font_downloader.get_font_path(font_name, font_url)
-            
-            if not font_path or not os.path.exists(font_path):
-                return None, None, f"폰트 파일을 찾을 수 없습니다: {font_name}"
-            
-            # 포맷 확인
-            fmt = self.infer_format_from_name(output_format)
-            
-            # 이미지 생성
-            img = Image.new("RGBA", background_size, background_color)
-            draw = ImageDraw.Draw(img)
-            font = ImageFont.truetype(font_path, font_size)
-            
-            # 문자별 색상 결정
-            char_text_colors = []
-            char_stroke_colors = []
-            
-            if word_based_colors:
-                words = text.split()
-                word_idx = 0
-                
-                for char in text:
-                    if char == ' ' and word_idx < len(words) - 1:
-                        char_text_colors.append(self.hex_to_rgb("#000000"))
-                        char_stroke_colors.append(self.hex_to_rgb("#FFFFFF"))
-                        word_idx += 1
-                    else:
-                        if isinstance(text_colors, list) and word_idx < len(text_colors):
-                            char_text_colors.append(self.hex_to_rgb(text_colors[word_idx]))
-                        else:
-                            char_text_colors.append(self.hex_to_rgb(text_colors if isinstance(text_colors, str) else text_colors[0]))
-                        
-                        if isinstance(stroke_colors, list) and word_idx < len(stroke_colors):
-                            char_stroke_colors.append(self.hex_to_rgb(stroke_colors[word_idx]))
-                        else:
-                            char_stroke_colors.append(self.hex_to_rgb(stroke_colors if isinstance(stroke_colors, str) else stroke_colors[0]))
+            key = self.cache_key(text, font_name, output_format, encoding_profile, **style)
+            cached = render_cache.get(key)
+            if cached is not None:
+                data, fmt = cached
+            elif self.resolve_format(output_format, encoding_profile) == "SVG":
+                data, fmt = self.render_text_svg(text, font_name, **style).encode("utf-8"), "SVG"
+                render_cache.put(key, data, fmt)
             else:
-                # 단일 색상 사용
-                text_color = text_colors if isinstance(text_colors, str) else text_colors[0]
-                stroke_color = stroke_colors if isinstance(stroke_colors, str) else stroke_colors[0]
-                char_text_colors = [self.hex_to_rgb(text_color)] * len(text)
-                char_stroke_colors = [self.hex_to_rgb(stroke_color)] * len(text)
-            
-            # 텍스트 중앙 정렬을 위한 크기 계산
-            total_text_width = 0
-            char_widths = []
-            
-            for char in text:
-                bbox = draw.textbbox((0, 0), char, font=font)
-                char_width = bbox[2] - bbox[0]
-                total_text_width += char_width
-                char_widths.append(char_width)
-            
-            # 텍스트 높이 계산
-            if text:
-                bbox_first_char = draw.textbbox((0, 0), text[0], font=font)
-                text_height = bbox_first_char[3] - bbox_first_char[1]
-            else:
-                text_height = 0
-            
-            start_x = (background_size[0] - total_text_width) // 2
-            start_y = (background_size[1] - text_height) // 2
-            current_x = start_x
-            
-            # 각 문자 그리기
-            for i, char in enumerate(text):
-                draw.text(
-                    (current_x, start_y),
-                    char,
-                    font=font,
-                    fill=char_text_colors[i],
-                    stroke_width=stroke_width,
-                    stroke_fill=char_stroke_colors[i],
-                )
-                current_x += char_widths[i]
-            
-            # RGB 변환이 필요한 포맷 처리
-            if fmt in {"JPEG", "ICO", "PPM", "HEIF"}:
-                img = img.convert("RGB")
-            
-            # Base64로 변환
-            buffer = BytesIO()
-            img.save(buffer, format=fmt)
-            buffer.seek(0)
-            
-            image_base64 = base64.b64encode(buffer.getvalue()).decode()
-            
-            return image_base64, fmt, None
-            
+                img = self.render_text_image(text, font_name, **style)
+                data, fmt = self.encode_image(img, output_format, encoding_profile)
+                render_cache.put(key, data, fmt)
+            return base64.b64encode(data).decode(), fmt, None
+        except ValueError as e:
+            return None, None, str(e)
         except Exception as e:
             return None, None, f"이미지 생성 중 오류 발생: {str(e)}"
+    
+    def _render_variant(
+        self,
+        text: str,
+        style: Dict[str, Any],
+        encode: bool = True,
+        output_format: Optional[str] = None,
+        encoding_profile: str = "final"
+    ) -> Dict[str, Any]:
+        """배치 변형 1개 렌더링 (encode가 False면 인코딩하지 않고 이미지 그대로 반환)"""
+        item: Dict[str, Any] = {"font_name": style["font_name"], "success": False}
+        if encode:
+            image_base64, fmt, error = self.generate_text_image(
+                text, output_format=output_format, encoding_profile=encoding_profile, **style
+            )
+            if error:
+                return {**item, "error": error}
+            return {**item, "success": True, "image_base64": image_base64, "format": fmt}
+        try:
+            item["image"] = self.render_text_image(text, **style)
+            item["success"] = True
+        except ValueError as e:
+            item["error"] = str(e)
+        except Exception as e:
+            item["error"] = f"이미지 생성 중 오류 발생: {str(e)}"
+        return item
+    
+    def build_contact_sheet(
+        self,
+        images: List[Optional[Image.Image]],
+        columns: int,
+        cell_width: int,
+        background_color: Tuple[int, int, int, int]
+    ) -> Tuple[Image.Image, Tuple[int, int]]:
+        """변형 이미지를 격자로 배치 (실패한 칸은 빈칸), (시트 이미지, 칸 크기) 반환"""
+        source = next(img for img in images if img is not None)
+        cell_size = (cell_width, max(1, round(cell_width * source.height / source.width)))
+        columns = min(columns, len(images))
+        rows = math.ceil(len(images) / columns)
+        
+        sheet = Image.new("RGBA", (cell_size[0] * columns, cell_size[1] * rows), background_color)
+        for i, img in enumerate(images):
+            if img is not None:
+                thumb = img if img.size == cell_size else img.resize(cell_size, Image.LANCZOS)
+                sheet.paste(thumb, ((i % columns) * cell_size[0], (i // columns) * cell_size[1]))
+        return sheet, cell_size
+    
+    async def generate_text_image_batch(
+        self,
+        text: str,
+        variants: List[Dict[str, Any]],
+        output_format: Optional[str] = None,
+        encoding_profile: str = "final",
+        contact_sheet: bool = False,
+        columns: int = 4,
+        cell_width: int = 256
+    ) -> Dict[str, Any]:
+        """
+        같은 텍스트를 여러 스타일로 스레드 풀에서 병렬 렌더링합니다.
+        
+        variants는 render_text_image 인자 dict 목록이며, 결과 items는 variants와 같은 순서입니다.
+        contact_sheet이면 개별 이미지 대신 격자로 합친 이미지 1장을 반환합니다.
+        """
+        loop = asyncio.get_running_loop()
+        # 요청 Trace에 span이 기록되도록 컨텍스트를 복사해서 실행
+        items = await asyncio.gather(*(
+            loop.run_in_executor(
+                self._executor,
+                functools.partial(
+                    contextvars.copy_context().run, self._render_variant, text, style,
+                    not contact_sheet, output_format, encoding_profile
+                )
+            )
+            for style in variants
+        ))
+        for index, item in enumerate(items):
+            item["index"] = index
+        
+        result: Dict[str, Any] = {"items": items}
+        if contact_sheet:
+            images = [item.pop("image", None) for item in items]
+            if any(img is not None for img in images):
+                sheet, cell_size = await loop.run_in_executor(
+                    self._executor,
+                    self.build_contact_sheet, images, columns, cell_width, variants[0]["background_color"]
+                )
+                data, result["format"] = await loop.run_in_executor(
+                    self._executor, self.encode_image, sheet, output_format, encoding_profile
+                )
+                result["contact_sheet_base64"] = base64.b64encode(data).decode()
+                result["columns"] = min(columns, len(images))
+                result["cell_size"] = cell_size
+        return result
+
+# 캐시 키 계산용 render_text_image 기본값
+_RENDER_DEFAULTS = {
+    name: param.default
+    for name, param in inspect.signature(TextImageService.render_text_image).parameters.items()
+    if param.default is not inspect.Parameter.empty
+}
 
 # 전역 인스턴스
-text_image_service = TextImageService()
\ No newline at end of file
+text_image_service = TextImageService()
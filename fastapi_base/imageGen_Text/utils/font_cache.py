@@ -0,0 +1,115 @@
+import os
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from PIL import ImageFont
+
+from imageGen_Text.core.imageGen_Text_config import FONTS, settings
+from imageGen_Text.utils.font_store import font_store
+from imageGen_Text.utils.font_subset import CORE_SUBSET, font_subsetter
+from common.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# (폰트 이름, 크기, 가변 폰트 스타일 이름)
+FontKey = Tuple[str, int, Optional[str]]
+
+class FontCache:
+    """
+    폰트 객체 LRU 캐시
+
+    ImageFont.truetype은 호출할 때마다 폰트 파일을 다시 파싱하므로(본고딕 OTF는 수 MB),
+    (폰트, 크기, 스타일)별로 로드한 객체를 재사용합니다. 메모리는 폰트 파일 크기로 추정합니다.
+    text를 주면 준비된 서브셋(font_subset)을 원본 대신 로드하며, stats의 full_bytes는
+    같은 항목을 원본 폰트로 로드했을 때의 크기입니다. (bytes와 비교용)
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._fonts: "OrderedDict[Tuple[str, int, Optional[str], str], Tuple[ImageFont.FreeTypeFont, int, int]]" = OrderedDict()
+        self._paths: Dict[str, Optional[str]] = {}
+        self._bytes = 0
+        self._full_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "subset_fallbacks": 0}
+
+    def resolve_paths(self) -> Dict[str, Optional[str]]:
+        """설정된 모든 폰트 경로 확인 (시작 시 프리페치 후 1회, 이후 요청에서는 파일 시스템 확인 생략)"""
+        for font_name in FONTS:
+            self.font_path(font_name, refresh=True)
+        return dict(self._paths)
+
+    def font_path(self, font_name: str, refresh: bool = False) -> Optional[str]:
+        # 찾지 못한 폰트는 다음 요청에서 다시 확인 (다운로드는 font_store.ensure가 렌더링 전에 수행)
+        if refresh or self._paths.get(font_name) is None:
+            self._paths[font_name] = font_store.local_path(font_name)
+        return self._paths[font_name]
+
+    def get(
+        self,
+        font_name: str,
+        font_size: int,
+        variation: Optional[str] = None,
+        text: Optional[str] = None
+    ) -> Optional[ImageFont.FreeTypeFont]:
+        """폰트 객체 반환 (지원하지 않거나 파일이 없으면 None, 기본 서브셋으로 text를 그릴 수 있고 서브셋이 준비됐으면 서브셋)"""
+        if font_name not in FONTS:
+            return None
+        use_subset = text is not None and font_subsetter.enabled and font_subsetter.covers(text)
+        key = (font_name, font_size, variation, CORE_SUBSET if use_subset else "full")
+        with self._lock:
+            if key in self._fonts:
+                self._fonts.move_to_end(key)
+                self._stats["hits"] += 1
+                return self._fonts[key][0]
+            self._stats["misses"] += 1
+
+        font_path = self.font_path(font_name)
+        if font_path is None:
+            return None
+        full_size = os.path.getsize(font_path)
+        if use_subset:
+            subset_path = font_subsetter.ready_path(font_name, font_path)
+            if subset_path is None:
+                # 서브셋이 아직 없으면 원본 사용 (서브셋은 워밍업 또는 font_subsetter.schedule이 백그라운드로 생성)
+                with self._lock:
+                    self._stats["subset_fallbacks"] += 1
+                return self.get(font_name, font_size, variation)
+            font_path = subset_path
+        font = ImageFont.truetype(font_path, font_size)
+        if variation:
+            font.set_variation_by_name(variation)
+        size = os.path.getsize(font_path)
+
+        with self._lock:
+            if key not in self._fonts:
+                self._fonts[key] = (font, size, full_size)
+                self._bytes += size
+                self._full_bytes += full_size
+            while len(self._fonts) > self.max_entries or (self._bytes > self.max_bytes and len(self._fonts) > 1):
+                _, (_, evicted_size, evicted_full_size) = self._fonts.popitem(last=False)
+                self._bytes -= evicted_size
+                self._full_bytes -= evicted_full_size
+                self._stats["evictions"] += 1
+            return self._fonts[key][0] if key in self._fonts else font
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fonts.clear()
+            self._bytes = 0
+            self._full_bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """캐시 통계 (/metrics)"""
+        with self._lock:
+            return {**self._stats, "entries": len(self._fonts), "bytes": self._bytes, "full_bytes": self._full_bytes}
+
+# 전역 인스턴스
+font_cache = FontCache(
+    max_entries=settings.font_cache_max_entries,
+    max_bytes=settings.font_cache_max_bytes
+)
+metrics.register_cache("fonts", font_cache.stats)
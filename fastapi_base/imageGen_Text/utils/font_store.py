@@ -0,0 +1,150 @@
+import os
+import uuid
+import shutil
+import asyncio
+import logging
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+from PIL import ImageFont
+
+from imageGen_Text.core.imageGen_Text_config import FONTS, settings
+
+logger = logging.getLogger(__name__)
+
+def is_remote(source: str) -> bool:
+    return source.startswith("http")
+
+class FontStore:
+    """
+    폰트 파일 보관소
+
+    원격 폰트는 비동기로 받아(미러 디렉터리가 있으면 그곳에서 복사) 임시 파일에 쓰고,
+    폰트로 파싱되는지 확인한 뒤 원자적으로 교체합니다. 같은 폰트를 동시에 요청하면 한 번만 받습니다.
+    렌더링 경로(동기)는 local_path로 디스크에 있는 파일만 사용합니다.
+    """
+
+    def __init__(self, download_dir: str, mirror_dir: Optional[str] = None, concurrency: int = 4, timeout: float = 30.0):
+        self.download_dir = Path(download_dir)
+        self.mirror_dir = Path(mirror_dir) if mirror_dir else None
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._verified: Dict[str, str] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def target_path(self, font_name: str) -> Path:
+        """폰트 파일 위치 (원격 폰트는 다운로드 디렉터리, 로컬 폰트는 설정된 경로)"""
+        source = FONTS[font_name]
+        if not is_remote(source):
+            return Path(source)
+        ext = ".otf" if source.endswith(".otf") else ".ttf"
+        return self.download_dir / f"{font_name}{ext}"
+
+    def local_path(self, font_name: str) -> Optional[str]:
+        """디스크에 있는 폰트 경로 (네트워크 접근 없음, 없으면 None)"""
+        if font_name in self._verified:
+            return self._verified[font_name]
+        path = self.target_path(font_name)
+        return str(path) if path.exists() else None
+
+    @staticmethod
+    def validate(path: Path) -> None:
+        """폰트로 파싱되는지 확인 (잘린 파일/HTML 오류 페이지 등은 OSError)"""
+        ImageFont.truetype(str(path), 12).getbbox("가")
+
+    def _mirror_source(self, font_name: str, source: str) -> Optional[Path]:
+        if self.mirror_dir is None:
+            return None
+        for name in (Path(urlparse(source).path).name, self.target_path(font_name).name):
+            candidate = self.mirror_dir / name
+            if candidate.exists():
+                return candidate
+        return None
+
+    async def _download(self, url: str, destination: Path) -> None:
+        import httpx
+
+        async with httpx.AsyncClient(follow_redirects=True, timeout=self.timeout) as client:
+            response = await client.get(url)
+            response.raise_for_status()
+        await asyncio.to_thread(destination.write_bytes, response.content)
+
+    async def _fetch(self, font_name: str) -> Optional[str]:
+        source = FONTS[font_name]
+        path = self.target_path(font_name)
+
+        if path.exists():
+            try:
+                await asyncio.to_thread(self.validate, path)
+                self._verified[font_name] = str(path)
+                return str(path)
+            except Exception as e:
+                if not is_remote(source):
+                    logger.warning(f"폰트 파일을 읽을 수 없습니다 ({font_name}): {e}")
+                    return None
+                logger.warning(f"손상된 폰트 파일을 다시 받습니다 ({font_name}): {e}")
+                path.unlink(missing_ok=True)
+
+        if not is_remote(source):
+            logger.warning(f"로컬 폰트 파일을 찾을 수 없습니다: {source}")
+            return None
+
+        async with self._semaphore:
+            mirror = self._mirror_source(font_name, source)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                if mirror is not None:
+                    logger.info(f"미러에서 폰트 복사: {mirror}")
+                    await asyncio.to_thread(shutil.copyfile, mirror, tmp)
+                else:
+                    logger.info(f"폰트 다운로드 중: {font_name}")
+                    await self._download(source, tmp)
+                await asyncio.to_thread(self.validate, tmp)
+                os.replace(tmp, path)
+            except Exception as e:
+                logger.warning(f"폰트 가져오기 실패 ({font_name}): {e}")
+                return None
+            finally:
+                tmp.unlink(missing_ok=True)
+
+        logger.info(f"폰트 준비 완료: {path}")
+        self._verified[font_name] = str(path)
+        return str(path)
+
+    async def ensure(self, font_name: str) -> Optional[str]:
+        """폰트 파일을 준비하고 경로 반환 (지원하지 않거나 실패하면 None)"""
+        if font_name not in FONTS:
+            return None
+        if font_name in self._verified:
+            return self._verified[font_name]
+
+        task = self._inflight.get(font_name)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(font_name))
+            self._inflight[font_name] = task
+            task.add_done_callback(lambda _: self._inflight.pop(font_name, None))
+        # 기다리던 요청이 취소되어도 다른 요청이 공유하는 다운로드는 계속 진행
+        return await asyncio.shield(task)
+
+    async def prefetch_all(self, progress: Optional[Callable[[float], None]] = None) -> Dict[str, Optional[str]]:
+        """설정된 모든 폰트를 동시에 준비 (progress: 완료 비율 콜백)"""
+        names = list(FONTS)
+        paths: Dict[str, Optional[str]] = {}
+
+        async def one(font_name: str) -> None:
+            paths[font_name] = await self.ensure(font_name)
+            if progress is not None:
+                progress(len(paths) / len(names))
+
+        await asyncio.gather(*(one(font_name) for font_name in names))
+        return {font_name: paths[font_name] for font_name in names}
+
+# 전역 인스턴스
+font_store = FontStore(
+    download_dir=settings.font_download_dir,
+    mirror_dir=settings.font_mirror_dir,
+    concurrency=settings.font_prefetch_concurrency,
+    timeout=settings.font_download_timeout
+)
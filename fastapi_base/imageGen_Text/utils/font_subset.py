@@ -0,0 +1,187 @@
+import os
+import uuid
+import asyncio
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, FrozenSet, Optional, Set
+
+from imageGen_Text.core.imageGen_Text_config import FONTS, settings
+from imageGen_Text.utils.font_store import font_store
+
+logger = logging.getLogger(__name__)
+
+CORE_SUBSET = "core"
+
+def _ks_x_1001_hangul() -> str:
+    """KS X 1001 완성형 한글 2,350자 (EUC-KR 0xB0A1-0xC8FE)"""
+    chars = []
+    for lead in range(0xB0, 0xC9):
+        for trail in range(0xA1, 0xFF):
+            try:
+                chars.append(bytes([lead, trail]).decode("euc_kr"))
+            except UnicodeDecodeError:
+                continue
+    return "".join(chars)
+
+# 모든 서브셋에 포함하는 기본 문자 (ASCII, 자주 쓰는 한글, 호환 자모, 광고 문구에 흔한 기호)
+CORE_CHARS: FrozenSet[str] = frozenset(
+    "".join(chr(c) for c in range(0x20, 0x7F))
+    + _ks_x_1001_hangul()
+    + "".join(chr(c) for c in range(0x3131, 0x318F))
+    + "·…‘’“”「」『』【】〈〉《》※★☆♥♡♪→←↑↓▶◀●○■□◆◇％～・、。"
+)
+
+class FontSubsetter:
+    """
+    텍스트 렌더링용 폰트 서브셋 (fontTools)
+
+    폰트마다 CORE_CHARS만 담은 기본 서브셋 하나를 만들어 원본 파일의 크기/수정 시각별로 디스크에 보관합니다.
+    기본 문자 밖의 글자가 있는 텍스트는 원본 폰트로 렌더링합니다. (텍스트마다 CJK 폰트 전체를
+    서브셋하면 원본을 읽는 것보다 느림) 준비된 서브셋이 없을 때도 원본 폰트를 사용합니다.
+    """
+
+    def __init__(self, directory: str, enabled: bool = True, max_bytes: int = 0):
+        self.directory = Path(directory)
+        self.enabled = enabled and self._has_fonttools()
+        self.max_bytes = max_bytes
+        self._ready: Set[str] = set()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _has_fonttools() -> bool:
+        try:
+            import fontTools.subset  # noqa: F401
+            return True
+        except ImportError:
+            logger.info("fonttools가 없어 폰트 서브셋을 사용하지 않습니다. (pip install fonttools)")
+            return False
+
+    @staticmethod
+    def covers(text: str) -> bool:
+        """기본 서브셋으로 text를 그릴 수 있는지"""
+        return all(char in CORE_CHARS or char.isspace() for char in text)
+
+    @staticmethod
+    def _prefix(font_name: str) -> str:
+        return hashlib.sha1(font_name.encode("utf-8")).hexdigest()[:8]
+
+    def subset_path(self, font_name: str, source: str) -> Path:
+        stat = os.stat(source)
+        stamp = hashlib.sha1(f"{source}|{stat.st_size}|{stat.st_mtime_ns}".encode("utf-8")).hexdigest()[:10]
+        return self.directory / f"{self._prefix(font_name)}-{stamp}-{CORE_SUBSET}{Path(source).suffix}"
+
+    def ready_path(self, font_name: str, source: str) -> Optional[str]:
+        """
+        이미 만들어진 기본 서브셋 경로 (없으면 None, 렌더링 경로에서 호출)
+
+        원본 파일의 크기/수정 시각이 경로에 들어가므로 폰트가 교체되면 이전 서브셋을 쓰지 않습니다.
+        """
+        path = str(self.subset_path(font_name, source))
+        with self._lock:
+            if path in self._ready:
+                return path
+        if not os.path.exists(path):
+            return None
+        with self._lock:
+            self._ready.add(path)
+        return path
+
+    def build(self, font_name: str, source: str) -> Optional[str]:
+        """기본 서브셋 파일 생성, 실패하면 None"""
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+
+        path = self.subset_path(font_name, source)
+        if path.exists():
+            return self.ready_path(font_name, source)
+
+        options = subset.Options()
+        options.layout_features = ["*"]
+        options.name_IDs = ["*"]
+        options.notdef_outline = True
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            font = TTFont(source)
+            subsetter = subset.Subsetter(options)
+            subsetter.populate(unicodes={ord(char) for char in CORE_CHARS})
+            subsetter.subset(font)
+            font.save(str(tmp))
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.warning(f"폰트 서브셋 생성 실패 ({font_name}): {e}")
+            return None
+        finally:
+            tmp.unlink(missing_ok=True)
+
+        logger.info(f"폰트 서브셋 생성: {font_name} ({os.path.getsize(source):,} → {os.path.getsize(path):,} bytes)")
+        self._trim(font_name, path)
+        return self.ready_path(font_name, source)
+
+    def _trim(self, font_name: str, current: Path) -> None:
+        """같은 폰트의 이전 원본으로 만든 서브셋을 지우고, 디렉터리가 max_bytes를 넘으면 오래된 파일부터 삭제"""
+        prefix = self._prefix(font_name) + "-"
+        files = []
+        for path in self.directory.glob("*"):
+            if path.name.endswith(".tmp") or path == current:
+                continue
+            try:
+                if path.name.startswith(prefix):
+                    path.unlink()
+                else:
+                    stat = path.stat()
+                    files.append((stat.st_mtime, stat.st_size, path))
+            except OSError:
+                # 다른 워커가 이미 지운 파일
+                continue
+
+        if self.max_bytes > 0:
+            total = current.stat().st_size + sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+        with self._lock:
+            self._ready = {path for path in self._ready if os.path.exists(path)}
+
+    async def prepare(self, font_name: str, text: str = "") -> Optional[str]:
+        """
+        기본 서브셋을 스레드에서 생성 (동시 요청은 한 번만 생성)
+
+        기본 문자 밖의 글자가 있는 text는 원본 폰트로 그리므로 만들지 않고 None을 반환합니다.
+        """
+        if not self.enabled or font_name not in FONTS or not self.covers(text):
+            return None
+        source = font_store.local_path(font_name)
+        if source is None:
+            return None
+        ready = self.ready_path(font_name, source)
+        if ready is not None:
+            return ready
+
+        key = str(self.subset_path(font_name, source))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(asyncio.to_thread(self.build, font_name, source))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def schedule(self, font_name: str, text: str = "") -> None:
+        """요청 경로용: 필요한 기본 서브셋 생성을 백그라운드로 시작만 함 (기다리지 않고, 그동안 원본 폰트 사용)"""
+        if not self.enabled or not self.covers(text):
+            return
+        task = asyncio.ensure_future(self.prepare(font_name, text))
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+# 전역 인스턴스
+font_subsetter = FontSubsetter(
+    directory=settings.font_subset_dir,
+    enabled=settings.font_subsetting,
+    max_bytes=settings.font_subset_dir_max_bytes
+)
@@ -0,0 +1,108 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+from imageGen_Text.core.imageGen_Text_config import settings
+from imageGen_Text.utils.font_cache import FontKey
+from common.utils.metrics import metrics
+
+Color = Tuple[int, int, int, int]
+
+class Glyph(NamedTuple):
+    """
+    문자열(글자 또는 같은 색 런)의 측정값과 미리 래스터화한 알파 마스크
+
+    width/height는 테두리 없는 bbox 크기,
+    마스크는 테두리 포함 bbox 기준이며 offset은 그리기 원점에서 마스크 좌상단까지의 거리입니다.
+    """
+    width: int
+    height: int
+    offset: Tuple[int, int]
+    fill_mask: Image.Image
+    stroke_mask: Optional[Image.Image]
+
+    @property
+    def nbytes(self) -> int:
+        size = self.fill_mask.width * self.fill_mask.height
+        return size * 2 if self.stroke_mask is not None else size
+
+    def draw(self, img: Image.Image, xy: Tuple[int, int], fill: Color, stroke_fill: Color) -> None:
+        """
+        글자를 지정 색으로 합성 (ImageDraw.text와 동일: 테두리를 먼저, 그 위에 글자)
+        """
+        w, h = self.fill_mask.size
+        if w == 0 or h == 0:
+            return
+        x, y = xy[0] + self.offset[0], xy[1] + self.offset[1]
+        box = (x, y, x + w, y + h)
+        if self.stroke_mask is not None:
+            img.paste(stroke_fill, box, self.stroke_mask)
+        img.paste(fill, box, self.fill_mask)
+
+def rasterize(font: ImageFont.FreeTypeFont, text: str, stroke_width: int) -> Glyph:
+    left, top, right, bottom = font.getbbox(text)
+    s_left, s_top, s_right, s_bottom = font.getbbox(text, stroke_width=stroke_width)
+    size = (max(s_right - s_left, 0), max(s_bottom - s_top, 0))
+    origin = (-s_left, -s_top)
+
+    fill_mask = Image.new("L", size, 0)
+    ImageDraw.Draw(fill_mask).text(origin, text, font=font, fill=255)
+    stroke_mask = None
+    if stroke_width > 0:
+        stroke_mask = Image.new("L", size, 0)
+        ImageDraw.Draw(stroke_mask).text(origin, text, font=font, fill=255, stroke_width=stroke_width, stroke_fill=255)
+
+    return Glyph(
+        width=right - left,
+        height=bottom - top,
+        offset=(s_left, s_top),
+        fill_mask=fill_mask,
+        stroke_mask=stroke_mask
+    )
+
+class GlyphCache:
+    """(폰트, 크기, 문자열, 테두리 두께)별 마스크 LRU 캐시 (메모리는 마스크 픽셀 수로 계산)"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._glyphs: "OrderedDict[Tuple[FontKey, str, int], Glyph]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, font_key: FontKey, font: ImageFont.FreeTypeFont, text: str, stroke_width: int = 0) -> Glyph:
+        key = (font_key, text, stroke_width)
+        with self._lock:
+            glyph = self._glyphs.get(key)
+            if glyph is not None:
+                self._glyphs.move_to_end(key)
+                self._stats["hits"] += 1
+                return glyph
+            self._stats["misses"] += 1
+
+        glyph = rasterize(font, text, stroke_width)
+        with self._lock:
+            if key not in self._glyphs:
+                self._glyphs[key] = glyph
+                self._bytes += glyph.nbytes
+            while self._bytes > self.max_bytes and len(self._glyphs) > 1:
+                _, evicted = self._glyphs.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self._stats["evictions"] += 1
+        return glyph
+
+    def clear(self) -> None:
+        with self._lock:
+            self._glyphs.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """캐시 통계 (/metrics)"""
+        with self._lock:
+            return {**self._stats, "entries": len(self._glyphs), "bytes": self._bytes}
+
+# 전역 인스턴스
+glyph_cache = GlyphCache(max_bytes=settings.glyph_cache_max_bytes)
+metrics.register_cache("glyphs", glyph_cache.stats)
@@ -0,0 +1,138 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from imageGen_Text.core.imageGen_Text_config import settings
+from common.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# 렌더링 결과가 바뀌는 코드 변경 시 올려서 기존 캐시(메모리/디스크/ETag) 무효화
+RENDER_VERSION = "layout-1"
+
+def render_fingerprint(**fields: Any) -> str:
+    """렌더링 입력 전체(텍스트, 폰트, 크기, 색상, 테두리, 배경, 포맷 등)의 해시"""
+    payload = json.dumps({"version": RENDER_VERSION, **fields}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class RenderCache:
+    """
+    인코딩된 텍스트 이미지 캐시 (메모리 LRU + 디스크)
+
+    메모리에 없으면 디스크에서 읽어 메모리로 올립니다. 두 계층 모두 바이트 합으로 제한하며,
+    디스크는 가장 오래 전에 쓰거나 읽은 파일부터 지웁니다. directory가 없으면 메모리만 사용합니다.
+    """
+
+    def __init__(self, max_bytes: int, directory: Optional[str] = None, disk_max_bytes: int = 0):
+        self.max_bytes = max_bytes
+        self.directory = Path(directory) if directory else None
+        self.disk_max_bytes = disk_max_bytes
+        self._entries: "OrderedDict[str, Tuple[bytes, str]]" = OrderedDict()
+        self._bytes = 0
+        self._disk_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "disk_evictions": 0}
+
+    def _path(self, key: str, fmt: str) -> Path:
+        return self.directory / key[:2] / f"{key}.{fmt.lower()}"
+
+    def _disk_files(self):
+        return [path for path in self.directory.glob("*/*") if not path.name.endswith(".tmp")]
+
+    def _remember(self, key: str, data: bytes, fmt: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = (data, fmt)
+            self._bytes += len(data)
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self._stats["evictions"] += 1
+
+    def get(self, key: str) -> Optional[Tuple[bytes, str]]:
+        """(인코딩된 이미지, 포맷) 또는 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry
+
+        if self.directory is not None:
+            for path in self.directory.glob(f"{key[:2]}/{key}.*"):
+                if path.name.endswith(".tmp"):
+                    continue
+                try:
+                    data = path.read_bytes()
+                    os.utime(path)
+                except OSError:
+                    continue
+                fmt = path.suffix[1:].upper()
+                self._remember(key, data, fmt)
+                with self._lock:
+                    self._stats["disk_hits"] += 1
+                return data, fmt
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def put(self, key: str, data: bytes, fmt: str) -> None:
+        self._remember(key, data, fmt)
+        if self.directory is None:
+            return
+        path = self._path(key, fmt)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+            self._trim_disk(len(data))
+        except OSError as e:
+            logger.warning(f"렌더링 캐시 디스크 기록 실패: {e}")
+
+    def _trim_disk(self, added: int) -> None:
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(path.stat().st_size for path in self._disk_files())
+            else:
+                self._disk_bytes += added
+            if self._disk_bytes <= self.disk_max_bytes:
+                return
+            files = sorted(self._disk_files(), key=lambda path: path.stat().st_mtime)
+            for path in files:
+                if self._disk_bytes <= self.disk_max_bytes * 0.9:
+                    break
+                try:
+                    size = path.stat().st_size
+                    path.unlink()
+                except OSError:
+                    continue
+                self._disk_bytes -= size
+                self._stats["disk_evictions"] += 1
+
+    def clear(self) -> None:
+        """메모리 계층만 비움 (디스크는 RENDER_VERSION 변경으로 무효화)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """캐시 통계 (/metrics)"""
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "bytes": self._bytes,
+                    "disk_bytes": self._disk_bytes or 0}
+
+# 전역 인스턴스
+render_cache = RenderCache(
+    max_bytes=settings.render_cache_max_bytes,
+    directory=settings.render_cache_dir,
+    disk_max_bytes=settings.render_cache_disk_max_bytes
+)
+metrics.register_cache("text_images", render_cache.stats)
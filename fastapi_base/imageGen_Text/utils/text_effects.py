@@ -0,0 +1,170 @@
+"""
+텍스트 효과 (그라데이션, 그림자, 글로우, 다중 외곽선)
+
+글자/외곽 마스크를 한 번만 그린 뒤 효과 레이어는 마스크 연산(블러, 팽창, 이동)으로 만듭니다.
+레이어를 추가해도 글자를 다시 래스터화하지 않으며, 블러와 팽창은 반경과 무관하게 픽셀당 비용이 일정합니다.
+"""
+import math
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageFilter
+
+def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+
+def to_alpha(mask: Image.Image) -> np.ndarray:
+    """L 마스크 → 0~1 float32 배열"""
+    return np.asarray(mask, dtype=np.float32) / 255.0
+
+def shift(alpha: np.ndarray, dx: int, dy: int) -> np.ndarray:
+    """배열을 (dx, dy)만큼 이동 (밀려난 자리는 0)"""
+    out = np.zeros_like(alpha)
+    h, w = alpha.shape
+    if abs(dx) >= w or abs(dy) >= h:
+        return out
+    out[max(dy, 0):h + min(dy, 0), max(dx, 0):w + min(dx, 0)] = \
+        alpha[max(-dy, 0):h + min(-dy, 0), max(-dx, 0):w + min(-dx, 0)]
+    return out
+
+def gaussian_blur(alpha: np.ndarray, radius: float) -> np.ndarray:
+    """가우시안 블러 (sigma = radius / 2, Pillow의 박스 블러 3회 근사라 반경과 무관하게 픽셀당 비용 일정)"""
+    if radius <= 0:
+        return alpha
+    mask = Image.fromarray(np.clip(alpha * 255.0 + 0.5, 0, 255).astype(np.uint8), "L")
+    return to_alpha(mask.filter(ImageFilter.GaussianBlur(radius / 2.0)))
+
+def distance_to(alpha: np.ndarray) -> np.ndarray:
+    """각 픽셀에서 마스크(alpha >= 0.5)까지의 유클리드 거리 (픽셀 단위)"""
+    import cv2
+
+    outside = (alpha < 0.5).astype(np.uint8)
+    return cv2.distanceTransform(outside, cv2.DIST_L2, cv2.DIST_MASK_PRECISE)
+
+def dilate(alpha: np.ndarray, radius: float, distance: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    마스크를 radius만큼 원형으로 팽창 (거리 임계값, 가장자리 1픽셀은 안티앨리어싱)
+
+    distance는 distance_to(alpha) 결과입니다. 여러 두께로 팽창할 때 넘기면 거리 변환을 한 번만 계산합니다.
+    """
+    if radius <= 0:
+        return alpha
+    if distance is None:
+        distance = distance_to(alpha)
+    return np.maximum(alpha, np.clip(radius + 0.5 - distance, 0.0, 1.0))
+
+def linear_gradient(alpha: np.ndarray, colors: List[str], angle: float) -> np.ndarray:
+    """
+    글자 영역 bbox에 맞춘 선형 그라데이션 RGB 배열 (H, W, 3)
+
+    angle은 도 단위이며 0은 왼쪽→오른쪽, 90은 위→아래입니다. 색은 균등 간격으로 배치합니다.
+    """
+    h, w = alpha.shape
+    ys, xs = np.nonzero(alpha > 0)
+    if len(xs) == 0:
+        left, top, right, bottom = 0, 0, w, h
+    else:
+        left, top, right, bottom = xs.min(), ys.min(), xs.max() + 1, ys.max() + 1
+
+    theta = math.radians(angle)
+    cos, sin = math.cos(theta), math.sin(theta)
+    extent = abs((right - left) * cos) + abs((bottom - top) * sin) or 1.0
+    cx, cy = (left + right) / 2, (top + bottom) / 2
+    yy, xx = np.mgrid[0:h, 0:w].astype(np.float32)
+    t = np.clip(((xx - cx) * cos + (yy - cy) * sin) / extent + 0.5, 0.0, 1.0)
+
+    stops = np.linspace(0.0, 1.0, len(colors))
+    rgb = np.array([hex_to_rgb(color) for color in colors], dtype=np.float32)
+    return np.stack([np.interp(t, stops, rgb[:, c]) for c in range(3)], axis=-1)
+
+def composite(canvas: np.ndarray, color: Any, alpha: np.ndarray) -> None:
+    """
+    canvas(H, W, 4, 0~255 float)에 색(RGB 튜플 또는 (H, W, 3) 배열)을 alpha로 덮어 그림 (over 연산)
+    """
+    color = np.asarray(color, dtype=np.float32)
+    dst_a = canvas[..., 3:4] / 255.0
+    src_a = alpha[..., None]
+    out_a = src_a + dst_a * (1.0 - src_a)
+    safe = np.where(out_a > 0, out_a, 1.0)
+    blended = (color * src_a + canvas[..., :3] * dst_a * (1.0 - src_a)) / safe
+    # 완전히 투명한 곳은 배경 RGB 유지 (이후 글자 가장자리 블렌딩이 효과 없는 경우와 같도록)
+    canvas[..., :3] = np.where(out_a > 0, blended, canvas[..., :3])
+    canvas[..., 3:4] = out_a * 255.0
+
+def effects_margin(effects: Optional[Dict[str, Any]]) -> int:
+    """외곽선/글로우/그림자가 글자 밖으로 넓어지는 폭 (줄바꿈 폭 계산용)"""
+    if not effects:
+        return 0
+    margin = sum(outline["width"] for outline in effects.get("outlines") or [])
+    glow = effects.get("glow")
+    if glow:
+        margin = max(margin, glow["spread"] + glow["radius"])
+    for shadow in effects.get("shadows") or []:
+        # 블러는 sigma(= radius / 2)의 3배까지 퍼짐
+        margin = max(margin, max(abs(component) for component in shadow["offset"]) + 1.5 * shadow["blur_radius"])
+    return int(math.ceil(margin))
+
+def render_with_effects(
+    background: Image.Image,
+    fill_mask: Image.Image,
+    silhouette_mask: Image.Image,
+    effects: Dict[str, Any],
+    draw_text: Callable[[Image.Image], None]
+) -> Image.Image:
+    """
+    효과를 적용해 텍스트 이미지 합성
+
+    아래에서 위로 그림자 → 글로우 → 외곽선(바깥부터) → 텍스트(draw_text, 기존 색/테두리) → 그라데이션 순입니다.
+    그라데이션은 글자 마스크에만 적용되어 글자 색을 대신합니다.
+    """
+    silhouette = to_alpha(silhouette_mask)
+    canvas = np.asarray(background.convert("RGBA"), dtype=np.float32).copy()
+
+    for shadow in effects.get("shadows") or []:
+        alpha = gaussian_blur(silhouette, shadow["blur_radius"])
+        alpha = shift(alpha, *shadow["offset"]) * shadow["opacity"]
+        composite(canvas, hex_to_rgb(shadow["color"]), alpha)
+
+    glow = effects.get("glow")
+    if glow:
+        alpha = gaussian_blur(dilate(silhouette, glow["spread"]), glow["radius"])
+        composite(canvas, hex_to_rgb(glow["color"]), np.clip(alpha * 2.0, 0.0, 1.0) * glow["opacity"])
+
+    # 외곽선은 누적 두께별로 같은 거리 변환을 임계값만 바꿔 사용 (바깥부터 그림)
+    outlines = effects.get("outlines") or []
+    if outlines:
+        distance = distance_to(silhouette)
+        widths = np.cumsum([outline["width"] for outline in outlines])
+        for outline, width in reversed(list(zip(outlines, widths))):
+            composite(canvas, hex_to_rgb(outline["color"]), dilate(silhouette, width, distance))
+
+    img = Image.fromarray(np.clip(canvas + 0.5, 0, 255).astype(np.uint8), "RGBA")
+    draw_text(img)
+
+    gradient = effects.get("gradient")
+    if gradient:
+        fill = to_alpha(fill_mask)
+        canvas = np.asarray(img, dtype=np.float32).copy()
+        composite(canvas, linear_gradient(fill, gradient["colors"], gradient["angle"]), fill)
+        img = Image.fromarray(np.clip(canvas + 0.5, 0, 255).astype(np.uint8), "RGBA")
+    return img
+
+def scale_effects(effects: Optional[Dict[str, Any]], scale: float) -> Optional[Dict[str, Any]]:
+    """효과 크기(그림자 이동/블러, 글로우 반경/팽창, 외곽선 두께)를 출력 배율에 맞춤"""
+    if not effects or scale == 1.0:
+        return effects
+    scaled = dict(effects)
+    scaled["shadows"] = [
+        {**shadow, "offset": tuple(round(component * scale) for component in shadow["offset"]),
+         "blur_radius": shadow["blur_radius"] * scale}
+        for shadow in effects.get("shadows") or []
+    ]
+    if effects.get("glow"):
+        glow = effects["glow"]
+        scaled["glow"] = {**glow, "radius": glow["radius"] * scale, "spread": round(glow["spread"] * scale)}
+    scaled["outlines"] = [
+        {**outline, "width": max(1, round(outline["width"] * scale))}
+        for outline in effects.get("outlines") or []
+    ]
+    return scaled
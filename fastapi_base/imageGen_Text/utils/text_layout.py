@@ -0,0 +1,159 @@
+import re
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from PIL import Image, ImageFont
+
+from imageGen_Text.utils.font_cache import FontKey
+from imageGen_Text.utils.glyph_cache import Color, glyph_cache
+
+ALIGNMENTS = ("left", "center", "right")
+
+class Run(NamedTuple):
+    """같은 글자/테두리 색이 연속된 구간 (x: 줄 시작에서 런 시작까지의 길이, 커닝 포함)"""
+    text: str
+    fill: Color
+    stroke_fill: Color
+    x: float
+
+class Line(NamedTuple):
+    runs: List[Run]
+    width: float
+
+class TextLayout(NamedTuple):
+    lines: List[Line]
+    line_height: int
+    height: int
+
+def _break_lines(text: str, font: ImageFont.FreeTypeFont, max_width: Optional[float]) -> List[Tuple[int, int]]:
+    """
+    줄 구간 [start, end) 목록
+
+    개행 문자에서 나누고, max_width가 있으면 공백 단위로 줄바꿈합니다.
+    한 단어가 max_width보다 길면 글자 단위로 나눕니다.
+    """
+    lines = []
+    offset = 0
+    for paragraph in text.split("\n"):
+        start = end = offset
+        for match in re.finditer(r"\S+|\s+", paragraph):
+            token_start, token_end = offset + match.start(), offset + match.end()
+            if (max_width is None or match.group().isspace()
+                    or font.getlength(text[start:token_end].rstrip()) <= max_width):
+                end = token_end
+                continue
+            if text[start:end].strip():
+                lines.append((start, end))
+            start = token_start
+            while token_end - start > 1 and font.getlength(text[start:token_end]) > max_width:
+                cut = start + 1
+                while cut < token_end and font.getlength(text[start:cut + 1]) <= max_width:
+                    cut += 1
+                lines.append((start, cut))
+                start = cut
+            end = token_end
+        lines.append((start, end))
+        offset += len(paragraph) + 1
+    return lines
+
+def _group_runs(
+    text: str,
+    start: int,
+    end: int,
+    fills: Sequence[Color],
+    stroke_fills: Sequence[Color]
+) -> List[Tuple[int, int, Color, Color]]:
+    """색이 같은 연속 구간 (공백은 그려지지 않으므로 앞 런에 붙임)"""
+    runs: List[list] = []
+    for i in range(start, end):
+        if runs and (text[i].isspace() or (fills[i], stroke_fills[i]) == (runs[-1][2], runs[-1][3])):
+            runs[-1][1] = i + 1
+        else:
+            runs.append([i, i + 1, fills[i], stroke_fills[i]])
+    return [tuple(run) for run in runs]
+
+def layout_text(
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    fills: Sequence[Color],
+    stroke_fills: Sequence[Color],
+    max_width: Optional[float] = None,
+    line_spacing: float = 1.0
+) -> TextLayout:
+    """
+    텍스트를 줄/색상 런 단위로 배치
+
+    fills/stroke_fills는 글자별 색상이며, 위치는 줄 전체 문자열 기준 getlength로 계산해
+    런 경계에서도 커닝이 유지됩니다.
+    """
+    ascent, descent = font.getmetrics()
+    line_height = int(round((ascent + descent) * line_spacing))
+
+    lines = []
+    for start, end in _break_lines(text, font, max_width):
+        end = start + len(text[start:end].rstrip())
+        runs = [
+            Run(text[run_start:run_end], fill, stroke_fill, font.getlength(text[start:run_start]))
+            for run_start, run_end, fill, stroke_fill in _group_runs(text, start, end, fills, stroke_fills)
+        ]
+        lines.append(Line(runs, font.getlength(text[start:end])))
+
+    height = line_height * (len(lines) - 1) + ascent + descent if lines else 0
+    return TextLayout(lines, line_height, height)
+
+def run_origins(
+    size: Tuple[int, int],
+    layout: TextLayout,
+    stroke_width: int,
+    align: str,
+    padding: int
+) -> Iterator[Tuple[Run, Tuple[int, int]]]:
+    """런별 그리기 원점 (세로 중앙, 줄마다 가로 정렬)"""
+    width, height = size
+    y = (height - layout.height) // 2
+    for line in layout.lines:
+        if align == "left":
+            x = padding + stroke_width
+        elif align == "right":
+            x = width - padding - stroke_width - line.width
+        else:
+            x = (width - line.width) / 2
+        for run in line.runs:
+            yield run, (int(round(x + run.x)), y)
+        y += layout.line_height
+
+def draw_layout(
+    img: Image.Image,
+    layout: TextLayout,
+    font_key: FontKey,
+    font: ImageFont.FreeTypeFont,
+    stroke_width: int = 0,
+    align: str = "center",
+    padding: int = 0
+) -> None:
+    """배치된 텍스트를 이미지 중앙(세로)에 정렬해 런 단위로 합성"""
+    for run, origin in run_origins(img.size, layout, stroke_width, align, padding):
+        glyph = glyph_cache.get(font_key, font, run.text, stroke_width)
+        glyph.draw(img, origin, run.fill, run.stroke_fill)
+
+def layout_masks(
+    size: Tuple[int, int],
+    layout: TextLayout,
+    font_key: FontKey,
+    font: ImageFont.FreeTypeFont,
+    stroke_width: int = 0,
+    align: str = "center",
+    padding: int = 0
+) -> Tuple[Image.Image, Image.Image]:
+    """
+    draw_layout과 같은 위치의 알파 마스크 (L, 뒤 런의 테두리가 앞 런 글자를 덮는 것까지 동일)
+
+    Returns:
+        (글자 마스크, 테두리 포함 외곽 마스크)
+    """
+    fill = Image.new("L", size, 0)
+    silhouette = Image.new("L", size, 0)
+    for run, origin in run_origins(size, layout, stroke_width, align, padding):
+        glyph = glyph_cache.get(font_key, font, run.text, stroke_width)
+        glyph.draw(fill, origin, 255, 0)
+        glyph.draw(silhouette, origin, 255, 255)
+    return fill, silhouette
@@ -0,0 +1,188 @@
+"""
+텍스트 SVG 출력 (fontTools 글리프 윤곽)
+
+래스터 경로와 같은 배치(layout_text, run_origins)를 쓰고, 글리프 윤곽은 폰트에서 한 번씩만 꺼내
+<defs>에 두고 <use>로 재사용합니다. 테두리는 stroke, 효과는 SVG 필터로 표현하므로
+어떤 크기로 표시해도 다시 렌더링할 필요가 없습니다.
+"""
+import os
+import math
+import functools
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import ImageColor, ImageFont
+
+from imageGen_Text.utils.glyph_cache import Color
+from imageGen_Text.utils.text_layout import TextLayout, run_origins
+
+class OutlineFont:
+    """폰트 파일의 글리프 윤곽 (글리프별 SVG path 문자열 캐시)"""
+
+    def __init__(self, path: str):
+        from fontTools.ttLib import TTFont
+
+        self._font = TTFont(path, lazy=True)
+        self.units_per_em = self._font["head"].unitsPerEm
+        self._cmap = self._font.getBestCmap()
+        self._glyph_set = self._font.getGlyphSet()
+        self._paths: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def glyph_name(self, char: str) -> str:
+        return self._cmap.get(ord(char), ".notdef")
+
+    def path(self, glyph_name: str) -> str:
+        """글리프 윤곽 (폰트 단위, y축 위쪽)"""
+        from fontTools.pens.svgPathPen import SVGPathPen
+
+        # TTFont의 지연 로드는 스레드 안전하지 않으므로 잠금 안에서 윤곽을 꺼냄
+        with self._lock:
+            if glyph_name not in self._paths:
+                pen = SVGPathPen(self._glyph_set)
+                self._glyph_set[glyph_name].draw(pen)
+                self._paths[glyph_name] = pen.getCommands()
+            return self._paths[glyph_name]
+
+@functools.lru_cache(maxsize=8)
+def _outline_font(path: str, size: int, mtime_ns: int) -> OutlineFont:
+    return OutlineFont(path)
+
+def outline_font(path: str) -> OutlineFont:
+    """경로별 OutlineFont (폰트 파일이 교체되면 크기/수정 시각이 바뀌어 다시 읽음)"""
+    stat = os.stat(path)
+    return _outline_font(path, stat.st_size, stat.st_mtime_ns)
+
+def _num(value: float) -> str:
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+def _hex(color: Any) -> str:
+    return "#{:02x}{:02x}{:02x}".format(*color[:3])
+
+def _color(value: str) -> str:
+    """요청 색상 문자열을 #rrggbb로 정규화 (속성값에 원문을 그대로 넣지 않음)"""
+    return _hex(ImageColor.getrgb(value))
+
+def _filter(filter_id: str, size: Tuple[int, int], primitives: str) -> str:
+    # 효과 영역을 캔버스 전체로 (래스터 경로와 같이 캔버스 밖은 잘림)
+    return (f'<filter id="{filter_id}" filterUnits="userSpaceOnUse" x="0" y="0" '
+            f'width="{size[0]}" height="{size[1]}">{primitives}</filter>')
+
+def _gradient(gradient: Dict[str, Any], bbox: Tuple[float, float, float, float]) -> str:
+    """text_effects.linear_gradient와 같은 방향/범위의 linearGradient (글자 영역 bbox 기준)"""
+    left, top, right, bottom = bbox
+    theta = math.radians(gradient["angle"])
+    cos, sin = math.cos(theta), math.sin(theta)
+    extent = abs((right - left) * cos) + abs((bottom - top) * sin) or 1.0
+    cx, cy = (left + right) / 2, (top + bottom) / 2
+    dx, dy = cos * extent / 2, sin * extent / 2
+    colors = gradient["colors"]
+    stops = "".join(
+        f'<stop offset="{_num(i / (len(colors) - 1))}" stop-color="{_color(color)}"/>'
+        for i, color in enumerate(colors)
+    )
+    return (f'<linearGradient id="gradient" gradientUnits="userSpaceOnUse" '
+            f'x1="{_num(cx - dx)}" y1="{_num(cy - dy)}" x2="{_num(cx + dx)}" y2="{_num(cy + dy)}">{stops}</linearGradient>')
+
+def layout_svg(
+    size: Tuple[int, int],
+    layout: TextLayout,
+    font: ImageFont.FreeTypeFont,
+    outline: OutlineFont,
+    stroke_width: int = 0,
+    align: str = "center",
+    padding: int = 0,
+    background_color: Color = (255, 255, 255, 0),
+    effects: Optional[Dict[str, Any]] = None,
+    display_size: Optional[Tuple[int, int]] = None
+) -> str:
+    """
+    배치된 텍스트를 SVG 문서로 변환
+
+    좌표계(viewBox)는 size이며, display_size를 주면 width/height만 바꿔 그 크기로 표시합니다.
+    런마다 테두리(stroke) → 글자 순으로 그려 draw_layout과 겹침 순서가 같습니다.
+    """
+    effects = effects or {}
+    scale = font.size / outline.units_per_em
+    ascent, _ = font.getmetrics()
+
+    glyph_ids: Dict[str, str] = {}
+    defs: List[str] = []
+    run_groups: List[Tuple[str, Color, Color]] = []
+    left, top, right, bottom = size[0], size[1], 0, 0
+
+    for run, (x, y) in run_origins(size, layout, stroke_width, align, padding):
+        baseline = y + ascent
+        uses = []
+        for i, char in enumerate(run.text):
+            if char.isspace():
+                continue
+            name = outline.glyph_name(char)
+            if name not in glyph_ids:
+                glyph_ids[name] = f"g{len(glyph_ids)}"
+                defs.append(f'<path id="{glyph_ids[name]}" d="{outline.path(name)}"/>')
+            gx = x + font.getlength(run.text[:i])
+            uses.append(f'<use href="#{glyph_ids[name]}" transform="translate({_num(gx)} {_num(baseline)}) '
+                        f'scale({_num(scale)} {_num(-scale)})"/>')
+        if not uses:
+            continue
+        run_id = f"r{len(run_groups)}"
+        defs.append(f'<g id="{run_id}">{"".join(uses)}</g>')
+        run_groups.append((run_id, run.fill, run.stroke_fill))
+        left, right = min(left, x), max(right, x + font.getlength(run.text))
+        top, bottom = min(top, y), max(bottom, y + layout.line_height)
+
+    # 글리프는 폰트 단위로 그려지므로 테두리 두께도 폰트 단위로 환산 (ImageDraw 테두리는 윤곽 바깥으로 stroke_width)
+    stroke_attrs = ""
+    if stroke_width > 0:
+        stroke_attrs = f' stroke-width="{_num(2 * stroke_width / scale)}" stroke-linejoin="round"'
+    defs.append(f'<g id="silhouette"{stroke_attrs}>'
+                + "".join(f'<use href="#{run_id}"/>' for run_id, _, _ in run_groups) + "</g>")
+
+    def silhouette(color: str, extra: str = "") -> str:
+        color = _color(color)
+        stroke = f' stroke="{color}"' if stroke_width > 0 else ""
+        return f'<use href="#silhouette" fill="{color}"{stroke}{extra}/>'
+
+    body: List[str] = []
+    if background_color[3] > 0:
+        body.append(f'<rect width="{size[0]}" height="{size[1]}" fill="{_hex(background_color)}" '
+                    f'fill-opacity="{_num(background_color[3] / 255)}"/>')
+
+    for i, shadow in enumerate(effects.get("shadows") or []):
+        dx, dy = shadow["offset"]
+        defs.append(_filter(f"shadow{i}", size,
+            f'<feGaussianBlur stdDeviation="{_num(shadow["blur_radius"] / 2)}"/><feOffset dx="{dx}" dy="{dy}"/>'))
+        body.append(silhouette(shadow["color"], f' opacity="{_num(shadow["opacity"])}" filter="url(#shadow{i})"'))
+
+    glow = effects.get("glow")
+    if glow:
+        defs.append(_filter("glow", size,
+            f'<feMorphology operator="dilate" radius="{glow["spread"]}"/>'
+            f'<feGaussianBlur stdDeviation="{_num(glow["radius"] / 2)}"/>'
+            '<feComponentTransfer><feFuncA type="linear" slope="2"/></feComponentTransfer>'))
+        body.append(silhouette(glow["color"], f' opacity="{_num(glow["opacity"])}" filter="url(#glow)"'))
+
+    outlines = effects.get("outlines") or []
+    widths = [sum(outline["width"] for outline in outlines[:i + 1]) for i in range(len(outlines))]
+    for i, (layer, width) in reversed(list(enumerate(zip(outlines, widths)))):
+        defs.append(_filter(f"outline{i}", size, f'<feMorphology operator="dilate" radius="{width}"/>'))
+        body.append(silhouette(layer["color"], f' filter="url(#outline{i})"'))
+
+    gradient = effects.get("gradient")
+    if gradient:
+        defs.append(_gradient(gradient, (left, top, right, bottom)))
+
+    for run_id, fill, stroke_fill in run_groups:
+        if stroke_width > 0:
+            body.append(f'<use href="#{run_id}" fill="{_hex(stroke_fill)}" stroke="{_hex(stroke_fill)}"{stroke_attrs}/>')
+        if not gradient:
+            body.append(f'<use href="#{run_id}" fill="{_hex(fill)}"/>')
+            continue
+        # 그라데이션 좌표는 캔버스 기준이므로 글리프(폰트 단위) 대신 글자 모양으로 마스킹한 사각형에 칠함
+        defs.append(f'<mask id="m{run_id}"><use href="#{run_id}" fill="#ffffff"/></mask>')
+        body.append(f'<rect width="{size[0]}" height="{size[1]}" fill="url(#gradient)" mask="url(#m{run_id})"/>')
+
+    width, height = display_size or size
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'viewBox="0 0 {size[0]} {size[1]}"><defs>{"".join(defs)}</defs>{"".join(body)}</svg>')
@@ -1,10 +1,53 @@
+import asyncio
+import importlib
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from textGen.routers import textGen, health
-from imageGen_Text.routers import imageGen_Text_router
-from imageGen_BG.routers import imageGen_BG_router
+from common.core.config import serving_settings
+from common.routers import system_router
+from common.service.inference_ipc import inference_client
+from common.service.metrics_service import publish_metrics_forever
+from common.service.openai_pool import openai_pool
+from common.service.openai_scheduler import OpenAIUnavailableError, openai_unavailable_handler
+from common.service.warmup import warmup_subsystems
+from common.utils.import_profiler import import_profiler
+from common.utils.metrics import MetricsMiddleware
+from common.utils.tracing import TracingMiddleware
 
-app = FastAPI(title="Multi-Service Backend", version="1.0.0")
+# 서비스별 라우터 (module, prefix, tag)
+SERVICE_ROUTERS = {
+    "textGen": ("textGen.routers.textGen", "/api/v1/text", "textGen"),
+    "imageGen_Text": ("imageGen_Text.routers.imageGen_Text_router", "/api/v1/image/text", "imgGen_Text"),
+    "imageGen_BG": ("imageGen_BG.routers.imageGen_BG_router", "/api/v1/image/bg", "imgGen_Backround"),
+}
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # remote 모드: 모델은 추론 프로세스가 소유, 워커는 IPC로 위임
+    publish_task = None
+    if serving_settings.inference_mode == "remote":
+        inference_client.connect()
+        publish_task = asyncio.create_task(
+            publish_metrics_forever(serving_settings.metrics_publish_interval)
+        )
+
+    # 무거운 서브시스템 로드 시점 결정
+    warmup_task = None
+    if serving_settings.startup_mode == "eager":
+        await warmup_subsystems(serving_settings.enabled_services)
+    elif serving_settings.startup_mode == "background":
+        warmup_task = asyncio.create_task(warmup_subsystems(serving_settings.enabled_services))
+
+    import_profiler.log_report()
+    yield
+
+    for task in (warmup_task, publish_task):
+        if task and not task.done():
+            task.cancel()
+    inference_client.close()
+    await openai_pool.aclose()
+
+app = FastAPI(title="Multi-Service Backend", version="1.0.0", lifespan=lifespan)
 
 # CORS 설정
 app.add_middleware(
@@ -13,25 +56,32 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
-# 라우터 등록
-app.include_router(textGen.router, prefix="/api/v1/text", tags=["textGen"])
-app.include_router(imageGen_Text_router.router, prefix="/api/v1/image/text", tags=["imgGen_Text"])
-app.include_router(imageGen_BG_router.router, prefix="/api/v1/image/bg", tags=["imgGen_Backround"])
+# OpenAI 재시도 소진 → 503 + Retry-After
+app.add_exception_handler(OpenAIUnavailableError, openai_unavailable_handler)
+
+# 요청별 단계 시간 기록 (Server-Timing 헤더 + 엔드포인트별 히스토그램)
+app.add_middleware(TracingMiddleware)
+
+# 라우트별 요청 수/처리 시간, 처리 중 요청 수 (/metrics)
+app.add_middleware(MetricsMiddleware)
+
+# 라우터 등록 (비활성 서비스는 import하지 않음)
+for service_name in serving_settings.enabled_services:
+    module_path, prefix, tag = SERVICE_ROUTERS[service_name]
+    with import_profiler.profile(module_path):
+        router_module = importlib.import_module(module_path)
+    app.include_router(router_module.router, prefix=prefix, tags=[tag])
 
 @app.get("/")
 async def root():
     return {"message": "FastAPI Multi-Service Backend is running"}
 
-@app.get("/health")
-async def health_check():
-    return {
-        "status": "healthy",
-        "services": ["textGen", "imageGen_Text_router"],
-        "message": "All services are running"
-    }
+# 헬스 체크 / 준비 상태 / 기동 프로파일 / 메트릭
+app.include_router(system_router.router, tags=["system"])
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8000)
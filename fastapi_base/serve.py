@@ -0,0 +1,68 @@
+"""
+서빙 엔트리포인트
+
+SERVING_WORKERS > 1 이면 모델을 소유하는 추론 프로세스 1개를 먼저 띄우고,
+HTTP 워커 N개가 로컬 IPC 큐로 추론 작업을 위임합니다.
+(모델 가중치는 추론 프로세스에만 한 번 로드됩니다)
+
+    SERVING_WORKERS=4 python serve.py
+"""
+import os
+import time
+import secrets
+import logging
+import multiprocessing
+import uvicorn
+
+from common.core.config import serving_settings
+
+logger = logging.getLogger(__name__)
+
+def _wait_for_socket(path: str, process: multiprocessing.Process, timeout: float = 60.0) -> None:
+    deadline = time.time() + timeout
+    while not os.path.exists(path):
+        if not process.is_alive():
+            raise RuntimeError("추론 프로세스가 시작 중 종료되었습니다.")
+        if time.time() > deadline:
+            raise TimeoutError(f"추론 프로세스 IPC 소켓 대기 시간 초과: {path}")
+        time.sleep(0.1)
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    use_remote = serving_settings.workers > 1 or serving_settings.inference_mode == "remote"
+
+    if not use_remote:
+        uvicorn.run("main:app", host=serving_settings.host, port=serving_settings.port)
+        return
+
+    from imageGen_BG.service.remote_pipeline_service import run_inference_process
+
+    authkey = serving_settings.ipc_authkey or secrets.token_hex(16)
+    # uvicorn 워커 프로세스가 상속할 환경 변수
+    os.environ["SERVING_INFERENCE_MODE"] = "remote"
+    os.environ["SERVING_IPC_AUTHKEY"] = authkey
+
+    ctx = multiprocessing.get_context("spawn")
+    inference_process = ctx.Process(
+        target=run_inference_process,
+        args=(serving_settings.ipc_address, authkey),
+        name="inference",
+        daemon=True
+    )
+    inference_process.start()
+    logger.info(f"추론 프로세스 시작 (pid={inference_process.pid})")
+
+    try:
+        _wait_for_socket(serving_settings.ipc_address, inference_process)
+        uvicorn.run(
+            "main:app",
+            host=serving_settings.host,
+            port=serving_settings.port,
+            workers=serving_settings.workers
+        )
+    finally:
+        inference_process.terminate()
+        inference_process.join(timeout=10)
+
+if __name__ == "__main__":
+    main()
@@ -22,7 +22,34 @@ class Settings(BaseSettings):
     # 모델 설정
     DEFAULT_MODEL_MINI: str = "gpt-4.1-mini"
     DEFAULT_TEMPERATURES: List[float] = [0.2, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+    # 프로세스당 동시 OpenAI 호출 수 (플랫폼 × 온도 병렬 생성 시 상한)
+    MAX_CONCURRENT_REQUESTS: int = 8
+    # 토큰 예산(분당 토큰 수) 추정용 샘플당 예상 출력 토큰 수
+    EXPECTED_COMPLETION_TOKENS: int = 400
+
+    # 프롬프트 접두부(시스템 프롬프트 + few-shot) 토큰 예산 (None이면 예시 전체 사용)
+    PROMPT_TOKEN_BUDGET: Optional[int] = None
+    PROMPT_MIN_FEW_SHOT_PAIRS: int = 1
+
+    # 응답 캐시 (같은 입력 반복 요청 시 토큰/지연 절약)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL: float = 3600.0
+    RESPONSE_CACHE_MAX_ENTRIES: int = 2048
+    # 이 온도 이하는 결정적 요청으로 보고 캐시에서 응답
+    RESPONSE_CACHE_MAX_TEMPERATURE: float = 0.3
+    # 높은 온도도 캐시된 변형을 재사용 (변형이 RESPONSE_CACHE_VARIANTS개 쌓인 뒤부터 무작위 반환)
+    RESPONSE_CACHE_REUSE_VARIANTS: bool = False
+    RESPONSE_CACHE_VARIANTS: int = 3
     
+    # 배치 생성 (카탈로그 단위 광고 문구)
+    BATCH_MAX_PRODUCTS: int = 1000
+    BATCH_CONCURRENCY: int = 4
+    BATCH_DEFAULT_TEMPERATURES: List[float] = [0.7]
+    # OpenAI 계정 한도에 맞춘 분당 예산 (요청 수 / 토큰 수)
+    BATCH_REQUESTS_PER_MINUTE: int = 500
+    BATCH_TOKENS_PER_MINUTE: int = 200000
+    BATCH_CHECKPOINT_DIR: str = "batch_checkpoints"
+
     # 지원 플랫폼
     SUPPORTED_PLATFORMS: List[str] = ["인스타그램", "블로그", "포스터"]
     
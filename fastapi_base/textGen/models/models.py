@@ -0,0 +1,303 @@
+import os
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, Any, List, Optional, Set, Tuple
+from textGen.core.config import settings, DEFAULT_MODEL, DEFAULT_TEMPERATURES
+from textGen.utils.prompt_registry import prompt_registry
+from common.service.openai_pool import openai_pool
+from common.service.openai_scheduler import openai_scheduler
+from common.utils.tracing import span
+from common.utils.metrics import openai_call_timer
+
+logger = logging.getLogger(__name__)
+
+IMAGE_TEXT_MODE = "광고 문구 + 텍스트 이미지용 문구 생성"
+
+# (플랫폼, 온도 인덱스)
+EntryKey = Tuple[str, int]
+# (프롬프트 플랫폼, 온도) → [(엔트리 키, 필드)]
+JobPlan = Dict[Tuple[str, float], List[Tuple[EntryKey, str]]]
+
+class OpenAIClient:
+    """광고 문구 생성을 위한 OpenAI 클라이언트"""
+
+    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
+        # 연결 풀은 앱 전역 클라이언트와 공유 (openai SDK는 첫 사용 시점에 import)
+        self.client = openai_pool.get_client(api_key or settings.OPENAI_API_KEY or os.getenv("OPENAI_API_KEY"))
+        self.model = model or DEFAULT_MODEL["mini"]
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def build_user_prompt(
+        self,
+        platform: str,
+        product_name: str,
+        product_use: str,
+        brand_name: str,
+        extra_info: Optional[str] = None
+    ) -> str:
+        """few-shot 예시와 같은 형식의 사용자 프롬프트 생성"""
+        keywords = ", ".join(v for v in [brand_name, product_name, product_use, extra_info] if v)
+        if platform == "포스터":
+            return f"키워드: {keywords}\n\n 광고 이미지용 광고 문구를 만들어줘."
+        return f"키워드: {keywords}\n\n광고 문구를 만들어줘."
+
+    def build_messages(self, platform: str, user_prompt: str) -> List[Dict[str, str]]:
+        """시스템 프롬프트 + few-shot 예시 + 사용자 프롬프트 (정적 접두부는 레지스트리에서 공유)"""
+        return prompt_registry.get(platform).messages(user_prompt)
+
+    def estimate_tokens(self, platform: str, user_prompt: str, n: int = 1) -> int:
+        """분당 토큰 예산 차감용 토큰 수 (접두부 + 사용자 프롬프트 + 예상 출력)"""
+        return (
+            prompt_registry.get(platform).prefix_tokens
+            + prompt_registry.count_tokens(user_prompt)
+            + settings.EXPECTED_COMPLETION_TOKENS * n
+        )
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 프로세스 전체 동시 호출 수 제한 (이벤트 루프 안에서 생성)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_REQUESTS)
+        return self._semaphore
+
+    async def generate_choices(
+        self,
+        platform: str,
+        product_name: str,
+        product_use: str,
+        brand_name: str,
+        extra_info: Optional[str] = None,
+        temperature: float = 0.7,
+        n: int = 1
+    ) -> List[str]:
+        """같은 프롬프트/온도로 n개 샘플 생성 (API 1회 호출)"""
+        user_prompt = self.build_user_prompt(platform, product_name, product_use, brand_name, extra_info)
+        async with self._get_semaphore():
+            response = await openai_scheduler.create(
+                "textGen",
+                self.client,
+                estimated_tokens=self.estimate_tokens(platform, user_prompt, n),
+                model=self.model,
+                messages=self.build_messages(platform, user_prompt),
+                temperature=temperature,
+                n=n
+            )
+        return [choice.message.content.strip() for choice in response.choices]
+
+    async def stream_choices(
+        self,
+        platform: str,
+        product_name: str,
+        product_use: str,
+        brand_name: str,
+        extra_info: Optional[str] = None,
+        temperature: float = 0.7,
+        n: int = 1
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """같은 프롬프트/온도로 n개 샘플을 스트리밍 생성, (샘플 인덱스, 텍스트 조각)을 반환"""
+        user_prompt = self.build_user_prompt(platform, product_name, product_use, brand_name, extra_info)
+        async with self._get_semaphore():
+            # 스트리밍 응답에는 usage가 없어 호출 수/지연/첫 토큰 시간만 기록
+            with span("openai"), openai_call_timer("textGen", self.model) as call:
+                stream = await openai_scheduler.open_stream(
+                    "textGen",
+                    self.client,
+                    estimated_tokens=self.estimate_tokens(platform, user_prompt, n),
+                    model=self.model,
+                    messages=self.build_messages(platform, user_prompt),
+                    temperature=temperature,
+                    n=n
+                )
+                async for chunk in stream:
+                    for choice in chunk.choices:
+                        if choice.delta.content:
+                            call.first_token()
+                            yield choice.index, choice.delta.content
+
+    async def generate_response(
+        self,
+        platform: str,
+        product_name: str,
+        product_use: str,
+        brand_name: str,
+        extra_info: Optional[str] = None,
+        temperature: float = 0.7
+    ) -> str:
+        """단일 플랫폼/온도 광고 문구 생성"""
+        choices = await self.generate_choices(
+            platform, product_name, product_use, brand_name, extra_info, temperature
+        )
+        return choices[0]
+
+    @staticmethod
+    def plan_jobs(
+        platforms: List[str],
+        mode: str,
+        temperatures: List[float],
+        only: Optional[Set[EntryKey]] = None
+    ) -> Tuple[Dict[EntryKey, Dict[str, Any]], Dict[EntryKey, int], JobPlan]:
+        """
+        플랫폼 × 온도 조합을 API 호출 단위로 묶습니다. (only가 있으면 해당 엔트리만)
+
+        반환: (엔트리, 엔트리별 남은 필드 수, 호출 계획)
+        """
+        entries: Dict[EntryKey, Dict[str, Any]] = {}
+        pending_parts: Dict[EntryKey, int] = {}
+        jobs: JobPlan = {}
+
+        for platform in platforms:
+            for index, temperature in enumerate(temperatures):
+                key = (platform, index)
+                if only is not None and key not in only:
+                    continue
+                entries[key] = {"temperature": temperature}
+                jobs.setdefault((platform, temperature), []).append((key, "ad_text"))
+                pending_parts[key] = 1
+                # 모드 2: 텍스트 이미지용 짧은 문구도 함께 생성
+                if mode == IMAGE_TEXT_MODE and platform != "포스터":
+                    jobs.setdefault(("포스터", temperature), []).append((key, "image_text"))
+                    pending_parts[key] += 1
+        return entries, pending_parts, jobs
+
+    async def iter_responses(
+        self,
+        platforms: List[str],
+        product_name: str,
+        product_use: str,
+        brand_name: str,
+        extra_info: Optional[str] = None,
+        mode: str = "광고 문구만 생성",
+        temperatures: Optional[List[float]] = None,
+        only: Optional[Set[EntryKey]] = None
+    ) -> AsyncIterator[Tuple[str, int, Dict[str, Any]]]:
+        """
+        플랫폼 × 온도 조합을 동시에 생성하고 완료되는 순서대로 (platform, index, entry)를 반환합니다.
+
+        같은 프롬프트/온도 조합은 n 파라미터로 한 번에 요청합니다.
+        (모드 2의 텍스트 이미지용 문구는 플랫폼과 무관하게 포스터 프롬프트를 쓰므로 온도별로 묶임)
+        """
+        entries, pending_parts, jobs = self.plan_jobs(platforms, mode, temperatures or DEFAULT_TEMPERATURES, only)
+
+        async def run_job(job_key, slots):
+            prompt_platform, temperature = job_key
+            texts = await self.generate_choices(
+                prompt_platform, product_name, product_use, brand_name, extra_info, temperature, n=len(slots)
+            )
+            return slots, texts
+
+        tasks = [asyncio.create_task(run_job(job_key, slots)) for job_key, slots in jobs.items()]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                slots, texts = await completed
+                for (key, field), text in zip(slots, texts):
+                    entries[key][field] = text
+                    pending_parts[key] -= 1
+                    if pending_parts[key] == 0:
+                        yield key[0], key[1], entries[key]
+        finally:
+            # 실패/클라이언트 연결 종료 시 남은 호출 취소
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def iter_token_events(
+        self,
+        platforms: List[str],
+        product_name: str,
+        product_use: str,
+        brand_name: str,
+        extra_info: Optional[str] = None,
+        mode: str = "광고 문구만 생성",
+        temperatures: Optional[List[float]] = None,
+        only: Optional[Set[EntryKey]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        플랫폼 × 온도 조합을 동시에 스트리밍 생성하고 이벤트를 도착 순서대로 반환합니다.
+
+        - {"type": "delta", "platform", "index", "temperature", "field", "delta"}: 토큰 조각
+        - {"type": "result", "platform", "index", "temperature", "ad_text", "image_text"?}: 엔트리 완성
+        """
+        entries, pending_parts, jobs = self.plan_jobs(platforms, mode, temperatures or DEFAULT_TEMPERATURES, only)
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def run_job(job_key, slots):
+            prompt_platform, temperature = job_key
+            texts = [""] * len(slots)
+            try:
+                async for choice_index, delta in self.stream_choices(
+                    prompt_platform, product_name, product_use, brand_name, extra_info, temperature, n=len(slots)
+                ):
+                    texts[choice_index] += delta
+                    (platform, index), field = slots[choice_index]
+                    await queue.put(("event", {
+                        "type": "delta",
+                        "platform": platform,
+                        "index": index,
+                        "temperature": temperature,
+                        "field": field,
+                        "delta": delta
+                    }))
+                await queue.put(("done", slots, texts))
+            except Exception as e:
+                await queue.put(("error", e))
+
+        tasks = [asyncio.create_task(run_job(job_key, slots)) for job_key, slots in jobs.items()]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                message = await queue.get()
+                if message[0] == "event":
+                    yield message[1]
+                    continue
+                if message[0] == "error":
+                    raise message[1]
+
+                remaining -= 1
+                _, slots, texts = message
+                for (key, field), text in zip(slots, texts):
+                    entries[key][field] = text.strip()
+                    pending_parts[key] -= 1
+                    if pending_parts[key] == 0:
+                        yield {"type": "result", "platform": key[0], "index": key[1], **entries[key]}
+        finally:
+            # 실패/클라이언트 연결 종료 시 남은 호출 취소
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def generate_multiple_responses(
+        self,
+        platforms: List[str],
+        product_name: str,
+        product_use: str,
+        brand_name: str,
+        extra_info: Optional[str] = None,
+        mode: str = "광고 문구만 생성",
+        temperatures: Optional[List[float]] = None,
+        only: Optional[Set[EntryKey]] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """플랫폼 × 온도 조합별 광고 문구 생성 (온도 순서 유지, only에 없는 칸은 None)"""
+        temperatures = temperatures or DEFAULT_TEMPERATURES
+        results: Dict[str, List[Optional[Dict[str, Any]]]] = {
+            platform: [None] * len(temperatures) for platform in platforms
+        }
+        async for platform, index, entry in self.iter_responses(
+            platforms, product_name, product_use, brand_name, extra_info, mode, temperatures, only
+        ):
+            results[platform][index] = entry
+        return results
+
+    async def generate_texts(
+        self,
+        platforms: List[str],
+        product_name: str,
+        product_use: str,
+        brand_name: str,
+        extra_info: Optional[str] = None,
+        mode: str = "광고 문구만 생성",
+        temperature: float = 0.7
+    ) -> Dict[str, Dict[str, Any]]:
+        """단일 온도로 플랫폼별 광고 문구 생성"""
+        results = await self.generate_multiple_responses(
+            platforms, product_name, product_use, brand_name, extra_info, mode, [temperature]
+        )
+        return {platform: entries[0] for platform, entries in results.items()}
@@ -1,14 +1,23 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, UploadFile, File, Form
+from fastapi.responses import FileResponse
+from typing import Optional
+import re
 import logging
 from textGen.schemas.textGen_schemas import (
     SingleAdRequest, 
     MultiPlatformRequest, 
     SingleTemperatureRequest,
+    BatchAdRequest,
+    BATCH_ID_PATTERN,
     AdGenerationResponse,
 
 )
 from textGen.service.textGen_service import ad_service
+from textGen.service.batch_service import batch_service
 from textGen.core.config import settings
+from common.service.openai_scheduler import OpenAIUnavailableError
+from textGen.utils.streaming import event_stream_response
+from textGen.utils.batch_io import parse_products
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -47,10 +56,30 @@ async def generate_single_ad(request: SingleAdRequest):
     except ValueError as e:
         logger.error(f"Validation error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
+    except OpenAIUnavailableError:
+        raise
     except Exception as e:
         logger.error(f"Ad generation failed: {e}")
         raise HTTPException(status_code=500, detail="광고 문구 생성 중 오류가 발생했습니다.")
 
+@router.post("/textGen-multiTP_singlePF/stream")
+async def stream_single_ad(request: SingleAdRequest, http_request: Request):
+    """
+    단일 플랫폼 광고 문구를 토큰 단위로 스트리밍
+
+    이벤트 형식은 /textGen_multiTP_multiPF/stream과 같습니다. (NDJSON 또는 SSE)
+    """
+    logger.info(f"단일 광고 스트리밍 요청: {request.ad_type} - {request.product_name}")
+
+    return event_stream_response(http_request, ad_service.stream_single_ad(
+        ad_type=request.ad_type,
+        mode_input=request.mode_input,
+        product_name=request.product_name,
+        product_use=request.product_use,
+        brand_name=request.brand_name,
+        extra_info=request.extra_info
+    ))
+
 @router.post("/textGen_multiTP_multiPF", response_model=AdGenerationResponse)
 async def generate_multiple_ads(request: MultiPlatformRequest):
     """
@@ -84,10 +113,35 @@ async def generate_multiple_ads(request: MultiPlatformRequest):
             execution_time=result.get("execution_time")
         )
         
+    except OpenAIUnavailableError:
+        raise
     except Exception as e:
         logger.error(f"Multiple ads generation failed: {e}")
         raise HTTPException(status_code=500, detail="광고 문구 생성 중 오류가 발생했습니다.")
 
+@router.post("/textGen_multiTP_multiPF/stream")
+async def stream_multiple_ads(request: MultiPlatformRequest, http_request: Request):
+    """
+    여러 플랫폼 및 온도 조합 광고 문구를 토큰 단위로 스트리밍
+
+    기본은 NDJSON이며, Accept: text/event-stream이면 SSE로 보냅니다. 각 이벤트는 다음 중 하나입니다.
+    - {"type": "delta", "platform", "index", "temperature", "field", "delta"}
+    - {"type": "result", "platform", "index", "temperature", "ad_text", "image_text"?}
+    - {"type": "done", "execution_time"}
+    - {"type": "error", "message"}
+    """
+    logger.info(f"다중 광고 스트리밍 요청: {request.platforms} - {request.product_name}")
+
+    return event_stream_response(http_request, ad_service.stream_multiple_ads(
+        platforms=request.platforms,
+        product_name=request.product_name,
+        product_use=request.product_use,
+        brand_name=request.brand_name,
+        extra_info=request.extra_info,
+        mode=request.mode,
+        temperatures=request.temperatures
+    ))
+
 @router.post("/signleTP_multiPF", response_model=AdGenerationResponse)
 async def generate_single_temperature_ads(request: SingleTemperatureRequest):
     """
@@ -119,6 +173,71 @@ async def generate_single_temperature_ads(request: SingleTemperatureRequest):
             execution_time=result.get("execution_time")
         )
         
+    except OpenAIUnavailableError:
+        raise
     except Exception as e:
         logger.error(f"Single temperature ads generation failed: {e}")
-        raise HTTPException(status_code=500, detail="광고 문구 생성 중 오류가 발생했습니다.")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="광고 문구 생성 중 오류가 발생했습니다.")
+
+@router.post("/signleTP_multiPF/stream")
+async def stream_single_temperature_ads(request: SingleTemperatureRequest, http_request: Request):
+    """
+    단일 온도로 여러 플랫폼 광고 문구를 토큰 단위로 스트리밍
+
+    이벤트 형식은 /textGen_multiTP_multiPF/stream과 같습니다. (NDJSON 또는 SSE)
+    """
+    logger.info(f"단일 온도 다중 플랫폼 광고 스트리밍 요청: {request.platforms} - {request.product_name}")
+
+    return event_stream_response(http_request, ad_service.stream_single_temperature_ads(
+        platforms=request.platforms,
+        product_name=request.product_name,
+        product_use=request.product_use,
+        brand_name=request.brand_name,
+        extra_info=request.extra_info,
+        mode=request.mode
+    ))
+
+@router.post("/batch")
+async def generate_batch(request: BatchAdRequest, http_request: Request):
+    """
+    여러 상품 광고 문구 일괄 생성 (JSONL 스트리밍)
+
+    - **products**: 상품 목록 (id 선택)
+    - **platforms** / **mode** / **temperatures**: 모든 상품에 공통 적용
+    - **batch_id**: 중단된 배치 재개용 ID (없으면 같은 요청 내용이면 자동으로 이어서 진행)
+
+    이벤트: batch → result/error (완료 순) → summary → done
+    """
+    logger.info(f"배치 광고 생성 요청: {len(request.products)}개 상품, {request.platforms}")
+    return event_stream_response(http_request, batch_service.run(request))
+
+@router.post("/batch/upload")
+async def upload_batch(
+    http_request: Request,
+    file: UploadFile = File(..., description="상품 목록 (CSV 또는 JSONL)"),
+    platforms: str = Form(..., description="대상 플랫폼 (쉼표 구분)"),
+    mode: str = Form("광고 문구만 생성"),
+    temperatures: Optional[str] = Form(None, description="온도 값 (쉼표 구분)"),
+    batch_id: Optional[str] = Form(None)
+):
+    """CSV/JSONL 파일로 배치 광고 문구 생성 (응답 형식은 /batch와 같음)"""
+    try:
+        request = BatchAdRequest(
+            products=parse_products(file.filename, await file.read()),
+            platforms=[p.strip() for p in platforms.split(",") if p.strip()],
+            mode=mode,
+            temperatures=[float(t) for t in temperatures.split(",") if t.strip()] if temperatures else None,
+            batch_id=batch_id or None
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    logger.info(f"배치 광고 생성 업로드: {file.filename}, {len(request.products)}개 상품")
+    return event_stream_response(http_request, batch_service.run(request))
+
+@router.get("/batch/{batch_id}")
+async def get_batch_results(batch_id: str):
+    """배치 체크포인트(완료된 상품 결과 JSONL) 다운로드"""
+    if not re.fullmatch(BATCH_ID_PATTERN, batch_id) or not batch_service.checkpoint_path(batch_id).exists():
+        raise HTTPException(status_code=404, detail="배치를 찾을 수 없습니다.")
+    return FileResponse(batch_service.checkpoint_path(batch_id), media_type="application/x-ndjson", filename=f"{batch_id}.jsonl")
@@ -1,3 +1,4 @@
+import re
 from pydantic import BaseModel, Field, field_validator, ValidationInfo
 from typing import Optional, List, Dict, Any
 from textGen.core.config import settings
@@ -66,6 +67,65 @@ class SingleTemperatureRequest(BaseAdRequest):
             raise ValueError(f'지원되지 않는 플랫폼: {invalid_platforms}. 사용 가능한 플랫폼: {settings.SUPPORTED_PLATFORMS}')
         return v
 
+# 체크포인트 파일 이름으로 쓰이므로 영문/숫자/-/_만 허용
+BATCH_ID_PATTERN = r"[A-Za-z0-9_-]{1,64}"
+
+class BatchProduct(BaseAdRequest):
+    """배치 생성 대상 상품"""
+    id: Optional[str] = Field(None, description="상품 식별자 (없으면 '#목록 순서')", example="SKU-001")
+
+def _item_id(index: int, product: BatchProduct) -> str:
+    return product.id or f"#{index}"
+
+class BatchAdRequest(BaseModel):
+    """여러 상품 광고 문구 일괄 생성 요청"""
+    products: List[BatchProduct] = Field(..., description="상품 목록")
+    platforms: List[str] = Field(..., description="대상 플랫폼 리스트", example=["인스타그램"])
+    mode: str = Field("광고 문구만 생성", description="생성 모드")
+    temperatures: Optional[List[float]] = Field(None, description="온도 값 리스트 (기본: BATCH_DEFAULT_TEMPERATURES)", example=[0.7])
+    batch_id: Optional[str] = Field(None, description="재개할 배치 ID (없으면 요청 내용으로 결정)")
+
+    @field_validator('products')
+    @classmethod
+    def validate_products(cls, v: List[BatchProduct]) -> List[BatchProduct]:
+        if not v:
+            raise ValueError('상품 목록이 비어 있습니다.')
+        if len(v) > settings.BATCH_MAX_PRODUCTS:
+            raise ValueError(f'한 번에 최대 {settings.BATCH_MAX_PRODUCTS}개 상품까지 생성할 수 있습니다.')
+        # 기본 id까지 채운 뒤 검사 (명시 id가 다른 상품의 기본 id와 같아도 체크포인트에서 섞이므로)
+        ids = [_item_id(index, product) for index, product in enumerate(v)]
+        if len(ids) != len(set(ids)):
+            raise ValueError('상품 id가 중복되었습니다.')
+        return v
+
+    def item_ids(self) -> List[str]:
+        """상품별 id (체크포인트 키, 없으면 '#목록 순서')"""
+        return [_item_id(index, product) for index, product in enumerate(self.products)]
+
+    @field_validator('platforms')
+    @classmethod
+    def validate_platforms(cls, v: List[str]) -> List[str]:
+        invalid_platforms = [p for p in v if p not in settings.SUPPORTED_PLATFORMS]
+        if invalid_platforms:
+            raise ValueError(f'지원되지 않는 플랫폼: {invalid_platforms}. 사용 가능한 플랫폼: {settings.SUPPORTED_PLATFORMS}')
+        return v
+
+    @field_validator('temperatures')
+    @classmethod
+    def validate_temperatures(cls, v: Optional[List[float]]) -> Optional[List[float]]:
+        if v is not None:
+            for temp in v:
+                if not 0 <= temp <= 2:
+                    raise ValueError('온도 값은 0과 2 사이여야 합니다.')
+        return v
+
+    @field_validator('batch_id')
+    @classmethod
+    def validate_batch_id(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None and not re.fullmatch(BATCH_ID_PATTERN, v):
+            raise ValueError('batch_id는 영문, 숫자, -, _ 로 된 64자 이하 문자열이어야 합니다.')
+        return v
+
 # 이미지 생성 관련 스키마 (추후 확장용)
 class ImageGenerationRequest(BaseModel):
     """이미지 생성 요청 (추후 구현 예정)"""
@@ -0,0 +1,164 @@
+import json
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+from textGen.core.config import settings
+from textGen.models.models import OpenAIClient
+from textGen.schemas.textGen_schemas import BatchAdRequest, BatchProduct
+from textGen.service.textGen_service import ad_service
+from textGen.utils.prompt_registry import prompt_registry
+from common.utils.rate_limit import RateLimiter
+from textGen.utils.response_cache import fingerprint
+
+logger = logging.getLogger(__name__)
+
+class BatchCheckpoint:
+    """배치 진행 상황 (완료된 상품 결과를 JSONL로 누적, 재시작 시 이어서 진행)"""
+
+    def __init__(self, directory: str, batch_id: str):
+        self.path = Path(directory) / f"{batch_id}.jsonl"
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """완료된 상품 id → 결과 레코드"""
+        if not self.path.exists():
+            return {}
+        completed = {}
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 중단 시점에 잘린 마지막 줄은 무시
+                    continue
+                completed[record["id"]] = record
+        return completed
+
+    def append(self, record: Dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+class BatchService:
+    """여러 상품 광고 문구 일괄 생성 (동시성 + 분당 요청/토큰 예산 + 체크포인트)"""
+
+    def __init__(self):
+        self.limiter = RateLimiter(
+            requests_per_minute=settings.BATCH_REQUESTS_PER_MINUTE,
+            tokens_per_minute=settings.BATCH_TOKENS_PER_MINUTE
+        )
+
+    @staticmethod
+    def batch_id_for(request: BatchAdRequest, temperatures: List[float]) -> str:
+        """같은 상품 목록/옵션이면 같은 ID (다시 요청하면 자동으로 이어서 진행)"""
+        return fingerprint(
+            products=[product.model_dump() for product in request.products],
+            platforms=request.platforms,
+            mode=request.mode,
+            temperatures=temperatures
+        )[:16]
+
+    @staticmethod
+    def checkpoint_path(batch_id: str) -> Path:
+        return BatchCheckpoint(settings.BATCH_CHECKPOINT_DIR, batch_id).path
+
+    @staticmethod
+    def estimate_usage(
+        product: BatchProduct,
+        platforms: List[str],
+        mode: str,
+        temperatures: List[float]
+    ) -> Tuple[int, int]:
+        """상품 1개 생성에 필요한 (API 호출 수, 입력 + 예상 출력 토큰 수)"""
+        _, _, jobs = OpenAIClient.plan_jobs(platforms, mode, temperatures)
+        keywords = " ".join(v for v in [product.brand_name, product.product_name, product.product_use, product.extra_info] if v)
+        user_tokens = prompt_registry.count_tokens(keywords) + 20
+        tokens = sum(
+            prompt_registry.get(prompt_platform).prefix_tokens + user_tokens
+            + settings.EXPECTED_COMPLETION_TOKENS * len(slots)
+            for (prompt_platform, _), slots in jobs.items()
+        )
+        return len(jobs), tokens
+
+    async def _generate_item(
+        self,
+        item_id: str,
+        product: BatchProduct,
+        platforms: List[str],
+        mode: str,
+        temperatures: List[float]
+    ) -> Dict[str, Any]:
+        requests, tokens = self.estimate_usage(product, platforms, mode, temperatures)
+        await self.limiter.acquire(requests, tokens)
+        try:
+            result = await ad_service.generate_multiple_ads(
+                platforms=platforms,
+                product_name=product.product_name,
+                product_use=product.product_use,
+                brand_name=product.brand_name,
+                extra_info=product.extra_info,
+                mode=mode,
+                temperatures=temperatures
+            )
+        except Exception as e:
+            logger.error(f"배치 상품 생성 실패 ({item_id}): {e}")
+            return {"type": "error", "id": item_id, "product_name": product.product_name,
+                    "message": "광고 문구 생성 중 오류가 발생했습니다."}
+        return {"type": "result", "id": item_id, "product_name": product.product_name,
+                "results": result["results"]}
+
+    async def run(self, request: BatchAdRequest) -> AsyncIterator[Dict[str, Any]]:
+        """
+        배치 실행. 이벤트를 완료되는 순서대로 반환합니다.
+
+        - {"type": "batch", "batch_id", "total", "resumed"}: 시작 (resumed: 체크포인트에서 복원한 상품 수)
+        - {"type": "result", "id", "product_name", "results", "resumed"?}
+        - {"type": "error", "id", "product_name", "message"}: 상품 단위 실패 (다음 재개 시 다시 시도)
+        - {"type": "summary", "batch_id", "completed", "failed"}
+        """
+        temperatures = request.temperatures or settings.BATCH_DEFAULT_TEMPERATURES
+        batch_id = request.batch_id or self.batch_id_for(request, temperatures)
+        checkpoint = BatchCheckpoint(settings.BATCH_CHECKPOINT_DIR, batch_id)
+        completed = checkpoint.load()
+
+        items = list(zip(request.item_ids(), request.products))
+        todo = [(item_id, product) for item_id, product in items if item_id not in completed]
+        logger.info(f"배치 시작: {batch_id} (전체 {len(items)}, 완료 {len(items) - len(todo)})")
+
+        yield {"type": "batch", "batch_id": batch_id, "total": len(items), "resumed": len(items) - len(todo)}
+        for item_id, _ in items:
+            if item_id in completed:
+                yield {**completed[item_id], "type": "result", "resumed": True}
+
+        queue: asyncio.Queue = asyncio.Queue()
+        pending = iter(todo)
+
+        async def worker():
+            for item_id, product in pending:
+                event = await self._generate_item(item_id, product, request.platforms, request.mode, temperatures)
+                if event["type"] == "result":
+                    try:
+                        checkpoint.append({k: v for k, v in event.items() if k != "type"})
+                    except OSError as e:
+                        logger.warning(f"체크포인트 기록 실패 ({batch_id}): {e}")
+                queue.put_nowait(event)
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(settings.BATCH_CONCURRENCY, len(todo)))]
+        failed = 0
+        try:
+            for _ in range(len(todo)):
+                event = await queue.get()
+                failed += event["type"] == "error"
+                yield event
+        finally:
+            # 클라이언트 연결 종료 시 남은 작업 취소 (완료분은 체크포인트에 남음)
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        logger.info(f"배치 완료: {batch_id} (실패 {failed})")
+        yield {"type": "summary", "batch_id": batch_id, "completed": len(items) - failed, "failed": failed}
+
+# 전역 인스턴스
+batch_service = BatchService()
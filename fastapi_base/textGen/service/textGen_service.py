@@ -1,8 +1,12 @@
 import time
+import random
 import logging
-from typing import Dict, Any, List, Optional
-from textGen.models.models import OpenAIClient
+from typing import AsyncIterator, Dict, Any, List, Optional, Set, Tuple
+from textGen.models.models import OpenAIClient, EntryKey
 from textGen.core.config import settings
+from textGen.utils.prompt_registry import prompt_registry
+from textGen.utils.response_cache import ResponseCache, fingerprint
+from common.utils.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -11,13 +15,154 @@ class AdGenerationService:
     
     def __init__(self):
         self.openai_client = None
+        self.response_cache = ResponseCache(
+            max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+            ttl=settings.RESPONSE_CACHE_TTL,
+            max_variants=settings.RESPONSE_CACHE_VARIANTS
+        )
     
     def _get_client(self) -> OpenAIClient:
         """OpenAI 클라이언트 인스턴스 반환 (지연 초기화)"""
         if self.openai_client is None:
             self.openai_client = OpenAIClient()
         return self.openai_client
+
+    @staticmethod
+    def _is_cacheable(temperature: float) -> bool:
+        if not settings.RESPONSE_CACHE_ENABLED:
+            return False
+        return temperature <= settings.RESPONSE_CACHE_MAX_TEMPERATURE or settings.RESPONSE_CACHE_REUSE_VARIANTS
+
+    def _lookup_cache(
+        self,
+        platforms: List[str],
+        product_name: str,
+        product_use: str,
+        brand_name: str,
+        extra_info: Optional[str],
+        mode: str,
+        temperatures: List[float]
+    ) -> Tuple[Dict[EntryKey, Dict[str, Any]], Dict[EntryKey, str]]:
+        """
+        캐시에서 응답할 수 있는 칸과 캐시 대상 칸의 키를 반환합니다.
+
+        낮은 온도는 저장된 결과를 그대로, 높은 온도는 (재사용 설정 시) 변형이 충분히 쌓인 뒤 무작위로 반환합니다.
+        """
+        cached: Dict[EntryKey, Dict[str, Any]] = {}
+        cache_keys: Dict[EntryKey, str] = {}
+        model = self._get_client().model
+
+        for platform in platforms:
+            for index, temperature in enumerate(temperatures):
+                if not self._is_cacheable(temperature):
+                    continue
+                cache_key = fingerprint(
+                    platform=platform,
+                    mode=mode,
+                    product_name=product_name,
+                    product_use=product_use,
+                    brand_name=brand_name,
+                    extra_info=extra_info,
+                    temperature=float(temperature),
+                    model=model,
+                    prompt_version=prompt_registry.version
+                )
+                cache_keys[(platform, index)] = cache_key
+
+                if temperature <= settings.RESPONSE_CACHE_MAX_TEMPERATURE:
+                    variants = self.response_cache.lookup(cache_key)
+                    entry = variants[-1] if variants else None
+                else:
+                    variants = self.response_cache.lookup(cache_key, min_variants=settings.RESPONSE_CACHE_VARIANTS)
+                    entry = random.choice(variants) if variants else None
+                if entry is not None:
+                    cached[(platform, index)] = {**entry, "temperature": temperature}
+
+        return cached, cache_keys
+
+    def _store_cache(self, cache_keys: Dict[EntryKey, str], key: EntryKey, entry: Dict[str, Any]) -> None:
+        cache_key = cache_keys.get(key)
+        if cache_key is not None and entry is not None:
+            self.response_cache.add(cache_key, dict(entry))
+
+    async def _generate_with_cache(
+        self,
+        platforms: List[str],
+        product_name: str,
+        product_use: str,
+        brand_name: str,
+        extra_info: Optional[str] = None,
+        mode: str = "광고 문구만 생성",
+        temperatures: Optional[List[float]] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """플랫폼 × 온도 조합 생성 (캐시에 있는 칸은 API를 호출하지 않음)"""
+        temperatures = temperatures or settings.DEFAULT_TEMPERATURES
+        cached, cache_keys = self._lookup_cache(
+            platforms, product_name, product_use, brand_name, extra_info, mode, temperatures
+        )
+        results = {
+            platform: [cached.get((platform, index)) for index in range(len(temperatures))]
+            for platform in platforms
+        }
+
+        missing: Set[EntryKey] = {
+            (platform, index) for platform in platforms for index in range(len(temperatures))
+        } - cached.keys()
+        if not missing:
+            logger.info(f"광고 문구 캐시 적중: {platforms}, {product_name}")
+            return results
+
+        generated = await self._get_client().generate_multiple_responses(
+            platforms, product_name, product_use, brand_name, extra_info, mode, temperatures, only=missing
+        )
+        for platform, index in missing:
+            entry = generated[platform][index]
+            results[platform][index] = entry
+            self._store_cache(cache_keys, (platform, index), entry)
+        return results
+
+    async def _stream_with_cache(
+        self,
+        platforms: List[str],
+        product_name: str,
+        product_use: str,
+        brand_name: str,
+        extra_info: Optional[str] = None,
+        mode: str = "광고 문구만 생성",
+        temperatures: Optional[List[float]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """캐시에 있는 칸은 result 이벤트로 먼저 보내고 나머지만 토큰 스트리밍"""
+        temperatures = temperatures or settings.DEFAULT_TEMPERATURES
+        cached, cache_keys = self._lookup_cache(
+            platforms, product_name, product_use, brand_name, extra_info, mode, temperatures
+        )
+        for (platform, index), entry in cached.items():
+            yield {"type": "result", "platform": platform, "index": index, **entry}
+
+        missing: Set[EntryKey] = {
+            (platform, index) for platform in platforms for index in range(len(temperatures))
+        } - cached.keys()
+        if not missing:
+            return
+
+        async for event in self._get_client().iter_token_events(
+            platforms, product_name, product_use, brand_name, extra_info, mode, temperatures, only=missing
+        ):
+            if event["type"] == "result":
+                key = (event["platform"], event["index"])
+                entry = {k: v for k, v in event.items() if k not in ("type", "platform", "index")}
+                self._store_cache(cache_keys, key, entry)
+            yield event
     
+    @staticmethod
+    def _resolve_mode(ad_type: str, mode_input: Optional[str]) -> str:
+        """광고 유형과 mode_input으로 생성 모드 결정"""
+        if ad_type in ["인스타그램", "블로그"]:
+            if mode_input not in ["1", "2"]:
+                raise ValueError("인스타그램 또는 블로그 광고는 mode_input을 '1' 또는 '2'로 지정해야 합니다.")
+            return "광고 문구만 생성" if mode_input == "1" else "광고 문구 + 텍스트 이미지용 문구 생성"
+        return "광고 문구만 생성"
+
     async def generate_ad_texts(
         self,
         ad_type: str,
@@ -30,19 +175,11 @@ class AdGenerationService:
         """
         광고 문구 생성 요청 함수 (기존 main.py에서 이동)
         """
-        openai_client = self._get_client()
-
-        # 모드 결정
-        if ad_type in ["인스타그램", "블로그"]:
-            if mode_input not in ["1", "2"]:
-                raise ValueError("인스타그램 또는 블로그 광고는 mode_input을 '1' 또는 '2'로 지정해야 합니다.")
-            mode = "광고 문구만 생성" if mode_input == "1" else "광고 문구 + 텍스트 이미지용 문구 생성"
-        else:
-            mode = "광고 문구만 생성"
+        mode = self._resolve_mode(ad_type, mode_input)
 
         platforms = [ad_type]
 
-        results = await openai_client.generate_multiple_responses(
+        results = await self._generate_with_cache(
             platforms,
             product_name,
             product_use,
@@ -107,8 +244,7 @@ class AdGenerationService:
         try:
             logger.info(f"다중 광고 생성 시작: {platforms}, {product_name}")
             
-            client = self._get_client()
-            results = await client.generate_multiple_responses(
+            results = await self._generate_with_cache(
                 platforms=platforms,
                 product_name=product_name,
                 product_use=product_use,
@@ -133,6 +269,77 @@ class AdGenerationService:
             logger.error(f"다중 광고 생성 실패: {e}")
             raise
     
+    async def stream_single_ad(
+        self,
+        ad_type: str,
+        mode_input: Optional[str],
+        product_name: str,
+        product_use: str,
+        brand_name: str,
+        extra_info: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """단일 플랫폼 광고 문구를 토큰 단위로 스트리밍 (delta/result 이벤트)"""
+        mode = self._resolve_mode(ad_type, mode_input)
+        logger.info(f"단일 광고 스트리밍 생성 시작: {ad_type}, {product_name}")
+
+        async for event in self._stream_with_cache(
+            platforms=[ad_type],
+            product_name=product_name,
+            product_use=product_use,
+            brand_name=brand_name,
+            extra_info=extra_info,
+            mode=mode
+        ):
+            yield event
+
+    async def stream_multiple_ads(
+        self,
+        platforms: List[str],
+        product_name: str,
+        product_use: str,
+        brand_name: str,
+        extra_info: Optional[str] = None,
+        mode: str = "광고 문구만 생성",
+        temperatures: Optional[List[float]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """여러 플랫폼 및 온도 조합 광고 문구를 토큰 단위로 스트리밍 (delta/result 이벤트)"""
+        logger.info(f"다중 광고 스트리밍 생성 시작: {platforms}, {product_name}")
+
+        async for event in self._stream_with_cache(
+            platforms=platforms,
+            product_name=product_name,
+            product_use=product_use,
+            brand_name=brand_name,
+            extra_info=extra_info,
+            mode=mode,
+            temperatures=temperatures
+        ):
+            yield event
+
+    async def stream_single_temperature_ads(
+        self,
+        platforms: List[str],
+        product_name: str,
+        product_use: str,
+        brand_name: str,
+        extra_info: Optional[str] = None,
+        mode: str = "광고 문구만 생성",
+        temperature: float = 0.7
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """단일 온도로 여러 플랫폼 광고 문구를 토큰 단위로 스트리밍 (delta/result 이벤트)"""
+        logger.info(f"단일 온도 다중 플랫폼 광고 스트리밍 생성 시작: {platforms}, {product_name}")
+
+        async for event in self._stream_with_cache(
+            platforms=platforms,
+            product_name=product_name,
+            product_use=product_use,
+            brand_name=brand_name,
+            extra_info=extra_info,
+            mode=mode,
+            temperatures=[temperature]
+        ):
+            yield event
+
     async def generate_single_temperature_ads(
         self,
         platforms: List[str],
@@ -148,15 +355,16 @@ class AdGenerationService:
         try:
             logger.info(f"단일 온도 다중 플랫폼 광고 생성 시작: {platforms}, {product_name}")
             
-            client = self._get_client()
-            results = await client.generate_texts(
+            results = await self._generate_with_cache(
                 platforms=platforms,
                 product_name=product_name,
                 product_use=product_use,
                 brand_name=brand_name,
                 extra_info=extra_info,
-                mode=mode
+                mode=mode,
+                temperatures=[0.7]
             )
+            results = {platform: entries[0] for platform, entries in results.items()}
             
             execution_time = time.time() - start_time
             logger.info(f"단일 온도 다중 플랫폼 광고 생성 완료: {execution_time:.2f}초")
@@ -175,3 +383,4 @@ class AdGenerationService:
         
 # 서비스 인스턴스 생성
 ad_service = AdGenerationService()
+metrics.register_cache("ad_copy_responses", ad_service.response_cache.stats)
@@ -0,0 +1,57 @@
+import csv
+import io
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PRODUCT_FIELDS = ("id", "product_name", "product_use", "brand_name", "extra_info")
+
+def _decode(content: bytes) -> str:
+    # 엑셀에서 저장한 CSV는 BOM 포함 UTF-8 또는 CP949인 경우가 많음
+    for encoding in ("utf-8-sig", "cp949"):
+        try:
+            return content.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    raise ValueError("파일 인코딩을 인식할 수 없습니다. (UTF-8 또는 CP949)")
+
+def _clean(row: Dict[str, Any]) -> Dict[str, Any]:
+    """상품 필드만 남기고 빈 값은 None으로"""
+    product = {}
+    for field in PRODUCT_FIELDS:
+        value = row.get(field)
+        if isinstance(value, str):
+            value = value.strip() or None
+        elif value is not None and field == "id":
+            value = str(value)
+        product[field] = value
+    return product
+
+def parse_products(filename: Optional[str], content: bytes) -> List[Dict[str, Any]]:
+    """
+    상품 목록 파일 파싱 (CSV 또는 JSONL)
+
+    CSV는 헤더에 product_name, product_use, brand_name (선택: id, extra_info) 열이 있어야 합니다.
+    """
+    text = _decode(content)
+    suffix = Path(filename or "").suffix.lower()
+
+    if suffix in (".jsonl", ".ndjson") or (not suffix and text.lstrip().startswith("{")):
+        products = []
+        for line_no, line in enumerate(text.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{line_no}번째 줄 JSON 파싱 오류: {e}")
+            if not isinstance(row, dict):
+                raise ValueError(f"{line_no}번째 줄은 JSON 객체여야 합니다.")
+            products.append(_clean(row))
+        return products
+
+    reader = csv.DictReader(io.StringIO(text))
+    missing = {"product_name", "product_use", "brand_name"} - set(reader.fieldnames or [])
+    if missing:
+        raise ValueError(f"CSV 헤더에 필요한 열이 없습니다: {sorted(missing)}")
+    return [_clean(row) for row in reader]
@@ -0,0 +1,171 @@
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from textGen.core.config import settings, PROMPT_CONFIGS, DEFAULT_MODEL
+from textGen.utils.prompts import PROMPT_TEMPLATE_VERSION
+from common.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# 메시지당 역할/구분자 토큰 (OpenAI chat 포맷 기준 근사치)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+class TokenCounter:
+    """모델 토크나이저 기반 토큰 수 계산 (tiktoken이 없으면 문자 수로 근사)"""
+
+    def __init__(self, model: str):
+        self.model = model
+        self._encoding = self._load_encoding(model)
+
+    @staticmethod
+    def _load_encoding(model: str):
+        try:
+            import tiktoken
+        except ImportError:
+            logger.warning("tiktoken 패키지가 없어 토큰 수를 문자 수로 근사합니다. (pip install tiktoken)")
+            return None
+        # BPE 파일은 첫 사용 시 내려받으므로 오프라인/프록시 환경에서는 네트워크 오류가 날 수 있음
+        try:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                # 토크나이저 매핑이 없는 신규 모델은 최신 인코딩 사용
+                return tiktoken.get_encoding("o200k_base")
+        except Exception as e:
+            logger.warning(f"tiktoken 인코딩을 불러오지 못해 토큰 수를 문자 수로 근사합니다 ({model}): {e}")
+            return None
+
+    def count(self, text: str) -> int:
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        # 근사: ASCII는 4자당 1토큰, 한글 등 비ASCII는 1자당 1토큰
+        ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+        return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+    def count_messages(self, messages: List[Dict[str, str]]) -> int:
+        return sum(self.count(message["content"]) + MESSAGE_OVERHEAD_TOKENS for message in messages)
+
+class CompiledPrompt:
+    """플랫폼별로 한 번 구성해 모든 호출이 공유하는 정적 메시지 접두부"""
+
+    def __init__(
+        self,
+        platform: str,
+        prefix: Tuple[Dict[str, str], ...],
+        prefix_tokens: int,
+        few_shot_pairs: int,
+        dropped_pairs: int
+    ):
+        self.platform = platform
+        self.prefix = prefix
+        self.prefix_tokens = prefix_tokens
+        self.few_shot_pairs = few_shot_pairs
+        self.dropped_pairs = dropped_pairs
+
+    def messages(self, user_prompt: str) -> List[Dict[str, str]]:
+        """시스템 프롬프트 + few-shot 예시 + 사용자 프롬프트 (접두부는 호출 간 동일)"""
+        return [*self.prefix, {"role": "user", "content": user_prompt}]
+
+class PromptRegistry:
+    """
+    플랫폼별 프롬프트 템플릿 레지스트리.
+
+    시스템 프롬프트와 few-shot 예시를 시작 시 한 번 메시지로 구성하고 토큰 수를 미리 계산합니다.
+    token_budget이 있으면 접두부가 예산 안에 들도록 뒤쪽 few-shot 예시 쌍부터 제외합니다.
+    접두부가 호출마다 같은 순서/내용이어야 OpenAI 프롬프트 캐싱이 적용됩니다.
+    """
+
+    def __init__(
+        self,
+        configs: Dict[str, Tuple[str, List[Dict[str, str]]]],
+        model: str,
+        token_budget: Optional[int] = None,
+        min_few_shot_pairs: int = 1
+    ):
+        self.configs = configs
+        self.model = model
+        self.token_budget = token_budget
+        self.min_few_shot_pairs = min_few_shot_pairs
+        self._compiled: Dict[str, CompiledPrompt] = {}
+        self._counter: Optional[TokenCounter] = None
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> str:
+        """응답 캐시 키용 버전 (프롬프트 내용 + 예산)"""
+        return f"{PROMPT_TEMPLATE_VERSION}-{self.token_budget or 'full'}"
+
+    def _compile_platform(self, platform: str) -> CompiledPrompt:
+        system_prompt, few_shot_examples = self.configs[platform]
+        system_message = {"role": "system", "content": system_prompt}
+        # few-shot 예시는 (user, assistant) 쌍 단위로 선택
+        pairs = [tuple(few_shot_examples[i:i + 2]) for i in range(0, len(few_shot_examples), 2)]
+
+        counter = self._counter
+        tokens = counter.count_messages([system_message])
+        pair_tokens = [counter.count_messages(list(pair)) for pair in pairs]
+
+        kept = len(pairs)
+        if self.token_budget is not None:
+            while kept > self.min_few_shot_pairs and tokens + sum(pair_tokens[:kept]) > self.token_budget:
+                kept -= 1
+        prefix = (system_message, *(message for pair in pairs[:kept] for message in pair))
+        compiled = CompiledPrompt(
+            platform=platform,
+            prefix=prefix,
+            prefix_tokens=tokens + sum(pair_tokens[:kept]),
+            few_shot_pairs=kept,
+            dropped_pairs=len(pairs) - kept
+        )
+        if compiled.dropped_pairs:
+            logger.info(
+                f"프롬프트 예산 적용: {platform} few-shot {len(pairs)}→{kept}쌍, {compiled.prefix_tokens} 토큰"
+            )
+        return compiled
+
+    def compile(self) -> None:
+        """모든 플랫폼 템플릿 구성 (앱 시작 시 워밍업에서 호출)"""
+        with self._lock:
+            if self._counter is None:
+                self._counter = TokenCounter(self.model)
+            for platform in self.configs:
+                if platform not in self._compiled:
+                    self._compiled[platform] = self._compile_platform(platform)
+
+    def get(self, platform: str) -> CompiledPrompt:
+        compiled = self._compiled.get(platform)
+        if compiled is None:
+            self.compile()
+            compiled = self._compiled[platform]
+        return compiled
+
+    def count_tokens(self, text: str) -> int:
+        if self._counter is None:
+            self.compile()
+        return self._counter.count(text)
+
+    def token_report(self) -> Dict[str, Dict[str, int]]:
+        """플랫폼별 접두부 토큰 수 / few-shot 쌍 수"""
+        return {
+            platform: {"prefix_tokens": compiled.prefix_tokens, "few_shot_pairs": compiled.few_shot_pairs}
+            for platform, compiled in self._compiled.items()
+        }
+
+def _prompt_families() -> List[Any]:
+    report = prompt_registry.token_report()
+    return [
+        ("prompt_prefix_tokens", "gauge", "플랫폼별 정적 프롬프트 접두부 토큰 수",
+         [("", {"platform": platform}, values["prefix_tokens"]) for platform, values in report.items()]),
+        ("prompt_few_shot_pairs", "gauge", "플랫폼별 사용 중인 few-shot 예시 쌍 수",
+         [("", {"platform": platform}, values["few_shot_pairs"]) for platform, values in report.items()]),
+    ]
+
+# 전역 인스턴스
+prompt_registry = PromptRegistry(
+    PROMPT_CONFIGS,
+    model=DEFAULT_MODEL["mini"],
+    token_budget=settings.PROMPT_TOKEN_BUDGET,
+    min_few_shot_pairs=settings.PROMPT_MIN_FEW_SHOT_PAIRS
+)
+metrics.register_collector(_prompt_families)
@@ -243,4 +243,20 @@ few_shot_examples_TI = [
         "role": "assistant",
         "content": "이 여름, 물속에서 미소가 터진다!"
     }
-]
\ No newline at end of file
+]
+
+# ==================================== version ====================================
+def _template_version() -> str:
+    """프롬프트 내용 해시 (프롬프트를 수정하면 버전이 바뀌어 응답 캐시가 무효화됨)"""
+    import json
+    import hashlib
+
+    templates = [
+        (system_prompt_insta, few_shot_examples_insta),
+        (system_prompt_blog, few_shot_examples_blog),
+        (system_prompt_TI, few_shot_examples_TI),
+    ]
+    payload = json.dumps(templates, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+PROMPT_TEMPLATE_VERSION = _template_version()
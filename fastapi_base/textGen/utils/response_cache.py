@@ -0,0 +1,75 @@
+import json
+import time
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+def normalize_text(value: Optional[str]) -> str:
+    """캐시 키용 입력 정규화 (유니코드 NFKC, 연속 공백 축약, 앞뒤 공백 제거)"""
+    if not value:
+        return ""
+    return " ".join(unicodedata.normalize("NFKC", value).split())
+
+def fingerprint(**fields: Any) -> str:
+    """정규화된 입력 필드의 해시 (문자열 필드는 normalize_text, 온도는 소수 둘째 자리 반올림)"""
+    normalized = {}
+    for name, value in fields.items():
+        if isinstance(value, float):
+            value = round(value, 2)
+        elif value is None or isinstance(value, str):
+            value = normalize_text(value)
+        normalized[name] = value
+    payload = json.dumps(normalized, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class ResponseCache:
+    """
+    TTL + LRU 응답 캐시
+
+    키마다 생성 결과 변형을 최대 max_variants개까지 보관합니다. (오래된 변형부터 교체)
+    """
+
+    def __init__(self, max_entries: int = 2048, ttl: float = 3600.0, max_variants: int = 1):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_variants = max(1, max_variants)
+        self._entries: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def lookup(self, key: str, min_variants: int = 1) -> Optional[List[Dict[str, Any]]]:
+        """변형이 min_variants개 이상 쌓여 있으면 변형 목록, 아니면 None (미스)"""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None and time.monotonic() - item[0] > self.ttl:
+                del self._entries[key]
+                self._stats["expirations"] += 1
+                item = None
+            if item is None or len(item[1]) < min_variants:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return list(item[1])
+
+    def add(self, key: str, value: Dict[str, Any]) -> None:
+        """변형 추가 (TTL은 마지막 추가 시점부터)"""
+        with self._lock:
+            item = self._entries.pop(key, None)
+            variants = item[1] if item is not None else []
+            variants = (variants + [value])[-self.max_variants:]
+            self._entries[key] = (time.monotonic(), variants)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """캐시 통계 (/metrics)"""
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries)}
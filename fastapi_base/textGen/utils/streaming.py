@@ -0,0 +1,59 @@
+import json
+import time
+import logging
+from typing import Any, AsyncIterator, Dict
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+from common.service.openai_scheduler import OpenAIUnavailableError
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+def wants_sse(request: Request) -> bool:
+    """Accept 헤더에 text/event-stream이 있으면 SSE, 아니면 NDJSON"""
+    return SSE_MEDIA_TYPE in request.headers.get("accept", "")
+
+def encode_event(event: Dict[str, Any], sse: bool) -> str:
+    data = json.dumps(event, ensure_ascii=False)
+    if sse:
+        return f"event: {event['type']}\ndata: {data}\n\n"
+    return data + "\n"
+
+def event_stream_response(
+    request: Request,
+    events: AsyncIterator[Dict[str, Any]],
+    error_message: str = "광고 문구 생성 중 오류가 발생했습니다."
+) -> StreamingResponse:
+    """
+    생성 이벤트를 NDJSON 또는 SSE 스트림으로 변환
+
+    이벤트 뒤에 {"type": "done", "execution_time"}를, 실패 시 {"type": "error", "message"}를 보냅니다.
+    """
+    sse = wants_sse(request)
+
+    async def body():
+        start_time = time.time()
+        try:
+            async for event in events:
+                yield encode_event(event, sse)
+            yield encode_event({"type": "done", "execution_time": time.time() - start_time}, sse)
+        except OpenAIUnavailableError as e:
+            logger.warning(f"Streaming generation unavailable: {e}")
+            yield encode_event({"type": "error", "message": "OpenAI 요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해 주세요.",
+                                "retry_after": e.retry_after}, sse)
+        except ValueError as e:
+            yield encode_event({"type": "error", "message": str(e)}, sse)
+        except Exception as e:
+            logger.error(f"Streaming generation failed: {e}")
+            yield encode_event({"type": "error", "message": error_message}, sse)
+
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return StreamingResponse(
+        body(),
+        media_type=SSE_MEDIA_TYPE if sse else NDJSON_MEDIA_TYPE,
+        headers=headers
+    )
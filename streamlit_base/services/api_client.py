@@ -1,7 +1,7 @@
 """FastAPI 백엔드와의 통신을 담당하는 클라이언트"""
 import requests
 import streamlit as st
-from typing import Optional, Dict, Any, Tuple, List
+from typing import Optional, Dict, Any, Tuple, List, Iterator
 import base64
 from PIL import Image
 from io import BytesIO
@@ -228,6 +228,40 @@ class APIClient:
             st.error(f"광고 텍스트 생성 중 오류 발생: {str(e)}")
             return None
     
+    def stream_ad_text(self, ad_type: str, product_name: str, product_use: str, brand_name: str,
+                       extra_info: str = "", mode_input: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        광고 문구 스트리밍 API 호출 (NDJSON 이벤트를 도착 순서대로 반환)
+
+        delta 이벤트의 조각을 이어 붙이면 첫 토큰부터 화면에 표시할 수 있습니다.
+        """
+        data = {
+            'ad_type': ad_type,
+            'mode_input': mode_input,
+            'product_name': product_name,
+            'product_use': product_use,
+            'brand_name': brand_name,
+            'extra_info': extra_info or None
+        }
+
+        try:
+            with self.session.post(f"{self.base_url}/api/v1/text/textGen-multiTP_singlePF/stream",
+                                   json=data, stream=True, timeout=self.session.timeout) as response:
+                response.raise_for_status()
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line:
+                        continue
+                    event = json.loads(line)
+                    if event.get('type') == 'error':
+                        st.error(f"광고 텍스트 생성 실패: {event.get('message', '알 수 없는 오류')}")
+                        return
+                    yield event
+
+        except requests.exceptions.RequestException as e:
+            st.error(f"광고 텍스트 생성 API 호출 오류: {str(e)}")
+        except json.JSONDecodeError:
+            st.error("광고 텍스트 생성 응답 파싱 오류")
+
     # 텍스트 이미지 생성 API
     def generate_text_image(self, text: str, font_name: str, font_size: int,
                            text_color: str, stroke_color: str, stroke_width: int) -> Optional[Image.Image]:
@@ -253,6 +287,46 @@ class APIClient:
             st.error(f"텍스트 이미지 생성 중 오류 발생: {str(e)}")
             return None
 
+    def generate_text_image_variants(self, text: str, variants: List[Dict[str, Any]],
+                                     contact_sheet: bool = False, columns: int = 4,
+                                     **options) -> Optional[Dict[str, Any]]:
+        """
+        텍스트 이미지 배치 생성 API 호출 (폰트 선택 미리보기용)
+
+        variants: [{'font_name': ..., 'font_size'?, 'text_colors'?, 'stroke_colors'?, 'stroke_width'?}]
+        반환: {'images': [Image 또는 None (실패)], 'contact_sheet': Image 또는 None, 'items': 응답 항목}
+        """
+        try:
+            data = {
+                'text': text,
+                'variants': variants,
+                'contact_sheet': contact_sheet,
+                'sheet_columns': columns,
+                # 미리보기이므로 작고 빠른 인코딩 (포맷은 서버의 preview 프로필이 결정)
+                'encoding_profile': 'preview',
+                **options
+            }
+
+            response = self.session.post(f"{self.base_url}/api/v1/image/text/generate/batch", json=data)
+            result = self._handle_response(response, "텍스트 이미지 배치 생성")
+            if not result:
+                return None
+
+            images = [
+                self._decode_base64_image(item['image_base64']) if item.get('image_base64') else None
+                for item in result['items']
+            ]
+            sheet = result.get('contact_sheet_base64')
+            return {
+                'images': images,
+                'contact_sheet': self._decode_base64_image(sheet) if sheet else None,
+                'items': result['items']
+            }
+
+        except Exception as e:
+            st.error(f"텍스트 이미지 배치 생성 중 오류 발생: {str(e)}")
+            return None
+
 # 싱글톤 인스턴스
 @st.cache_resource
 def get_api_client() -> APIClient: